@@ -0,0 +1,69 @@
+"""
+Request instrumentation overhead benchmark
+
+Drives a no-op ASGI app with and without RequestMetricsMiddleware and
+reports the difference per request, plus the raw cost of a histogram
+observation and of rendering the exposition text.
+
+    python benchmarks/bench_request_metrics.py
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.infrastructure.api.middleware.request_metrics import RequestMetricsMiddleware  # noqa: E402
+from src.infrastructure.observability.app_metrics import http_metrics, render_metrics  # noqa: E402
+
+ITERATIONS = 50_000
+
+
+class _Route:
+    path = "/audits/{audit_id}"
+
+
+async def endpoint(scope, receive, send):
+    scope["route"] = _Route
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b'{"ok": true}'})
+
+
+async def receive():
+    return {"type": "http.request", "body": b""}
+
+
+async def send(message):
+    pass
+
+
+async def per_request(app):
+    best = float("inf")
+    for _ in range(5):
+        started = time.perf_counter()
+        for _ in range(ITERATIONS):
+            await app({"type": "http", "method": "GET", "path": "/audits/1"}, receive, send)
+        best = min(best, time.perf_counter() - started)
+    return best / ITERATIONS
+
+
+def main():
+    bare = asyncio.run(per_request(endpoint))
+    instrumented = asyncio.run(per_request(RequestMetricsMiddleware(endpoint)))
+    print(f"{'bare app':>18}: {bare * 1e6:.2f} us/request")
+    print(f"{'instrumented':>18}: {instrumented * 1e6:.2f} us/request ({(instrumented - bare) * 1e6:+.2f} us)")
+
+    histogram = http_metrics.duration.labels("GET", "/audits/{audit_id}", "200")
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        histogram.observe(0.003)
+    print(f"{'observe':>18}: {(time.perf_counter() - started) / ITERATIONS * 1e6:.2f} us/op")
+
+    started = time.perf_counter()
+    text = render_metrics()
+    print(f"{'render':>18}: {(time.perf_counter() - started) * 1e3:.2f} ms ({len(text.splitlines())} lines)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Rule-engine micro-benchmarks
+
+Times the four stages of audit processing separately on synthetic data:
+parse (CSV to records, as the upload route does), evaluate (every rule
+against every row), findings (building a Finding per match) and score
+(optimization score and cost impact). Reports throughput and peak
+traced memory per stage, and compares with the JSON baseline of the same
+scenario; exits non-zero when a stage is slower than the tolerance allows.
+
+    python benchmarks/bench_rule_engine.py --rows 50000 --rules 20 --selectivity 0.1
+    python benchmarks/bench_rule_engine.py --update-baseline
+
+Baselines live in benchmarks/baselines/rule_engine.json, one per scenario.
+They are per environment and not committed: record them with
+``--update-baseline`` first; checking a scenario without one is an error.
+
+Memory is measured in a separate pass, so tracing does not skew timings.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from uuid import uuid4
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.synthetic_data import generate_rows, generate_rules, write_csv  # noqa: E402
+from src.domain.entities import Audit, AuditStatus, AuditType  # noqa: E402
+from src.domain.services import AuditService  # noqa: E402
+from src.infrastructure.datasets.audit_data_store import read_upload  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "rule_engine.json")
+
+
+def measure(fn, repeat):
+    """Best-of-``repeat`` seconds, then peak traced memory of one more call"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def run_scenario(audit_type, args):
+    service = AuditService()
+    rules = generate_rules(audit_type, args.rules, args.selectivity, seed=args.seed)
+    audit = Audit(
+        id=uuid4(),
+        organization_id=rules[0].organization_id if rules else uuid4(),
+        audit_type=audit_type,
+        file_name="synthetic.csv",
+        file_path="",
+        status=AuditStatus.PROCESSING,
+        created_by=uuid4(),
+        created_at=datetime.utcnow()
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, f"{audit_type.value}.csv")
+        write_csv(path, generate_rows(audit_type, args.rows, args.columns, args.seed))
+        parse = lambda: read_upload(path).to_dict("records")
+        records = parse()
+        results = {"parse": (*measure(parse, args.repeat), len(records), "rows")}
+
+    matches = [(row, rule) for row in records for rule in rules if rule.evaluate(row)]
+    evaluate = lambda: [rule.evaluate(row) for row in records for rule in rules]
+    results["evaluate"] = (*measure(evaluate, args.repeat), len(records), "rows")
+
+    build = lambda: [service._create_finding_from_rule(audit.id, rule, row) for row, rule in matches]
+    findings = build()
+    results["findings"] = (*measure(build, args.repeat), len(findings), "findings")
+
+    score = lambda: (service.calculate_optimization_score(findings), service.calculate_total_cost_impact(findings))
+    results["score"] = (*measure(score, args.repeat), len(findings), "findings")
+
+    return {
+        stage: {
+            "seconds": round(seconds, 6),
+            "items": items,
+            "unit": unit,
+            "items_per_sec": round(items / seconds) if seconds else None,
+            "peak_mb": round(peak / 2 ** 20, 3)
+        }
+        for stage, (seconds, peak, items, unit) in results.items()
+    }
+
+
+def scenario_key(audit_type, args):
+    return f"{audit_type.value}:rows={args.rows}:columns={args.columns}:rules={args.rules}:selectivity={args.selectivity}"
+
+
+def current_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_baselines():
+    if not os.path.exists(BASELINE_PATH):
+        return {}
+    with open(BASELINE_PATH) as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--audit-type", action="append", choices=[audit_type.value for audit_type in AuditType],
+                        help="repeatable; all types by default")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--columns", type=int, default=0, help="extra filler columns per row")
+    parser.add_argument("--rules", type=int, default=10)
+    parser.add_argument("--selectivity", type=float, default=0.05, help="fraction of rows each rule matches")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown over the baseline (0.2 = 20%%)")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    audit_types = [AuditType(value) for value in args.audit_type] if args.audit_type else list(AuditType)
+    baselines = load_baselines()
+    failures = []
+
+    for audit_type in audit_types:
+        key = scenario_key(audit_type, args)
+        stages = run_scenario(audit_type, args)
+        baseline = baselines.get(key, {}).get("stages", {})
+        print(key)
+        for stage, result in stages.items():
+            line = (
+                f"  {stage:>9}: {result['seconds'] * 1000:9.2f} ms  "
+                f"{result['items_per_sec'] or 0:>12,} {result['unit']}/s  peak {result['peak_mb']:8.2f} MB"
+            )
+            previous = baseline.get(stage)
+            if previous:
+                change = result["seconds"] / previous["seconds"] - 1 if previous["seconds"] else 0.0
+                line += f"  {change:+.1%} vs {baselines[key].get('commit') or 'baseline'}"
+                if change > args.tolerance:
+                    failures.append(f"{key} {stage}: regressed {change:+.1%}")
+            print(line)
+
+        if args.update_baseline:
+            baselines[key] = {
+                "commit": current_commit(),
+                "python": sys.version.split()[0],
+                "recorded_at": datetime.utcnow().isoformat(timespec="seconds"),
+                "stages": stages
+            }
+            os.makedirs(os.path.dirname(BASELINE_PATH), exist_ok=True)
+            with open(BASELINE_PATH, "w") as f:
+                json.dump(baselines, f, indent=2, sort_keys=True)
+                f.write("\n")
+            print(f"  baseline recorded in {BASELINE_PATH}")
+        elif key not in baselines:
+            failures.append(f"{key}: no baseline in {BASELINE_PATH}; record one with --update-baseline")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
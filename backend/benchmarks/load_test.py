@@ -0,0 +1,300 @@
+"""
+End-to-end load test
+
+Seeds tenants through the API (a user, an organization, rules and audits
+of several sizes each), then drives the read endpoints with concurrent
+clients and reports per-route latency percentiles, throughput and error
+rates.
+
+Against a local stack, with the auth and upload limits lifted so seeding
+is not throttled:
+
+    docker compose up -d postgres && alembic upgrade head
+    RATE_LIMIT_AUTH_PER_IP= RATE_LIMIT_UPLOAD_PER_IP= RATE_LIMIT_UPLOAD_PER_USER= \\
+        uvicorn src.main:app --port 8000 --workers 4
+    python benchmarks/load_test.py --profile ramp --clients 200 --ramp-seconds 60 --duration 120
+
+or pass --start-server to have the harness start (and stop) uvicorn itself.
+
+Profiles:
+    steady  every client starts at once and runs for --duration seconds
+    ramp    clients are added evenly over --ramp-seconds, then held for --duration
+    soak    steady load for a long --duration, reporting every --report-interval
+"""
+import argparse
+import asyncio
+import csv
+import io
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+import uuid
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.stats import percentile  # noqa: E402
+from benchmarks.synthetic_data import generate_rows, generate_rules  # noqa: E402
+from src.domain.entities import AuditType  # noqa: E402
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# Relative weight of each read route in the client mix
+READ_ROUTES = {
+    "GET /dashboard/metrics": 3,
+    "GET /audits": 3,
+    "GET /audits/{id}/findings": 2,
+    "GET /audits/{id}/data": 2,
+}
+
+
+class RouteStats:
+    """Latencies (ms) and status counts per route template"""
+
+    def __init__(self):
+        self.latencies = {}
+        self.statuses = {}
+
+    def record(self, route, status, elapsed_ms):
+        self.latencies.setdefault(route, []).append(elapsed_ms)
+        counts = self.statuses.setdefault(route, {})
+        counts[status] = counts.get(status, 0) + 1
+
+    def summary(self, seconds):
+        rows = {}
+        for route, samples in sorted(self.latencies.items()):
+            statuses = self.statuses[route]
+            errors = sum(count for status, count in statuses.items() if status == "error" or status >= 400)
+            rows[route] = {
+                "requests": len(samples),
+                "rps": round(len(samples) / seconds, 2) if seconds else 0.0,
+                "error_rate": round(errors / len(samples), 4),
+                "p50_ms": round(percentile(samples, 50), 2),
+                "p95_ms": round(percentile(samples, 95), 2),
+                "p99_ms": round(percentile(samples, 99), 2),
+                "max_ms": round(max(samples), 2),
+                "statuses": {str(status): count for status, count in sorted(statuses.items(), key=str)}
+            }
+        return rows
+
+
+def print_summary(title, rows):
+    print(title)
+    print(f"  {'route':<28} {'requests':>9} {'req/s':>9} {'errors':>7} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}")
+    for route, row in rows.items():
+        print(
+            f"  {route:<28} {row['requests']:>9} {row['rps']:>9.1f} {row['error_rate']:>7.2%} "
+            f"{row['p50_ms']:>7.1f}ms {row['p95_ms']:>7.1f}ms {row['p99_ms']:>7.1f}ms {row['max_ms']:>7.1f}ms"
+        )
+
+
+async def timed(client, stats, route, method, url, **kwargs):
+    started = time.perf_counter()
+    try:
+        response = await client.request(method, url, **kwargs)
+        status = response.status_code
+    except httpx.HTTPError:
+        response, status = None, "error"
+    stats.record(route, status, (time.perf_counter() - started) * 1000)
+    return response
+
+
+def csv_bytes(records):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(records[0]))
+    writer.writeheader()
+    writer.writerows(records)
+    return buffer.getvalue().encode()
+
+
+async def seed_tenant(client, index, args, stats):
+    """Register a user with an organization, rules and one audit per size"""
+    email = f"load-{uuid.uuid4().hex[:10]}@example.com"
+    response = await timed(client, stats, "POST /auth/register", "POST", "/auth/register",
+                           json={"email": email, "password": "load-test-password", "role": "admin"})
+    if response is None or response.status_code != 201:
+        return None
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    response = await timed(client, stats, "POST /organizations", "POST", "/organizations",
+                           json={"name": f"Load test {index}"}, headers=headers)
+    if response is None or response.status_code != 201:
+        return None
+    organization_id = response.json()["id"]
+
+    audit_types = list(AuditType)
+    for audit_type in audit_types:
+        for rule in generate_rules(audit_type, args.rules, args.selectivity, seed=index):
+            await timed(client, stats, "POST /rules", "POST", "/rules", headers=headers, json={
+                "organization_id": organization_id,
+                "name": rule.name,
+                "audit_type": rule.audit_type,
+                "conditions": rule.conditions,
+                "severity": rule.severity.value
+            })
+
+    audit_ids = []
+    for position, rows in enumerate(args.audit_sizes):
+        audit_type = audit_types[(index + position) % len(audit_types)]
+        content = csv_bytes(generate_rows(audit_type, rows, seed=index))
+        response = await timed(
+            client, stats, "POST /audits/upload", "POST", "/audits/upload", headers=headers,
+            data={"organization_id": organization_id, "audit_type": audit_type.value},
+            files={"file": (f"load_{rows}.csv", content, "text/csv")}
+        )
+        if response is not None and response.status_code == 201:
+            audit_ids.append(response.json()["id"])
+
+    return {"headers": headers, "organization_id": organization_id, "audit_ids": audit_ids}
+
+
+async def read_client(client, tenant, start_at, deadline, stats, rng):
+    await asyncio.sleep(max(0.0, start_at - time.perf_counter()))
+    routes, weights = list(READ_ROUTES), list(READ_ROUTES.values())
+    headers, organization_id = tenant["headers"], tenant["organization_id"]
+    while time.perf_counter() < deadline:
+        route = rng.choices(routes, weights)[0]
+        audit_id = rng.choice(tenant["audit_ids"]) if tenant["audit_ids"] else None
+        if route == "GET /dashboard/metrics":
+            await timed(client, stats, route, "GET", "/dashboard/metrics",
+                        params={"organization_id": organization_id}, headers=headers)
+        elif route == "GET /audits":
+            await timed(client, stats, route, "GET", "/audits",
+                        params={"organization_id": organization_id}, headers=headers)
+        elif audit_id is None:
+            await asyncio.sleep(0)
+        elif route == "GET /audits/{id}/findings":
+            await timed(client, stats, route, "GET", f"/audits/{audit_id}/findings", headers=headers)
+        else:
+            await timed(client, stats, route, "GET", f"/audits/{audit_id}/data",
+                        params={"offset": rng.randrange(0, 500), "limit": 100}, headers=headers)
+
+
+async def report_every(interval, deadline, holder):
+    """Soak profile: print and reset the interval window every ``interval`` seconds"""
+    while time.perf_counter() + interval <= deadline:
+        await asyncio.sleep(interval)
+        window, holder["window"] = holder["window"], RouteStats()
+        print_summary(f"--- last {interval:.0f}s ---", window.summary(interval))
+
+
+class WindowedStats(RouteStats):
+    """Totals plus a resettable window for periodic soak reports"""
+
+    def __init__(self):
+        super().__init__()
+        self.holder = {"window": RouteStats()}
+
+    def record(self, route, status, elapsed_ms):
+        super().record(route, status, elapsed_ms)
+        self.holder["window"].record(route, status, elapsed_ms)
+
+
+async def run(args):
+    limits = httpx.Limits(max_connections=args.clients + args.seed_concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+        seed_stats = RouteStats()
+        semaphore = asyncio.Semaphore(args.seed_concurrency)
+
+        async def seed(index):
+            async with semaphore:
+                return await seed_tenant(client, index, args, seed_stats)
+
+        started = time.perf_counter()
+        tenants = [tenant for tenant in await asyncio.gather(*(seed(i) for i in range(args.tenants))) if tenant]
+        seeding_seconds = time.perf_counter() - started
+        seeding = seed_stats.summary(seeding_seconds)
+        print_summary(f"seeding: {len(tenants)}/{args.tenants} tenants in {seeding_seconds:.1f}s", seeding)
+        if not tenants:
+            raise SystemExit("seeding failed; are the auth and upload rate limits lifted?")
+
+        stats = WindowedStats()
+        rng = random.Random(args.seed)
+        ramp = args.ramp_seconds if args.profile == "ramp" else 0.0
+        started = time.perf_counter()
+        deadline = started + ramp + args.duration
+        tasks = [
+            read_client(
+                client,
+                tenants[index % len(tenants)],
+                started + ramp * index / args.clients,
+                deadline,
+                stats,
+                random.Random(rng.random())
+            )
+            for index in range(args.clients)
+        ]
+        if args.profile == "soak":
+            tasks.append(report_every(args.report_interval, deadline, stats.holder))
+        await asyncio.gather(*tasks)
+
+        elapsed = time.perf_counter() - started
+        # Throughput over the time every client was running
+        summary = stats.summary(elapsed - ramp / 2)
+        print_summary(f"{args.profile}: {args.clients} clients, {elapsed:.1f}s", summary)
+        return {"seeding": seeding, "reads": summary}
+
+
+def start_server(args):
+    env = dict(os.environ)
+    for name in ("RATE_LIMIT_AUTH_PER_IP", "RATE_LIMIT_UPLOAD_PER_IP", "RATE_LIMIT_UPLOAD_PER_USER"):
+        env[name] = ""
+    port = args.base_url.rsplit(":", 1)[-1].strip("/")
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.main:app", "--port", port, "--workers", str(args.workers)],
+        cwd=BACKEND_DIR,
+        env=env
+    )
+    for _ in range(100):
+        try:
+            if httpx.get(f"{args.base_url}/health", timeout=1).status_code == 200:
+                return server
+        except httpx.HTTPError:
+            pass
+        if server.poll() is not None:
+            raise SystemExit("uvicorn exited during startup")
+        time.sleep(0.3)
+    server.terminate()
+    raise SystemExit("uvicorn did not become healthy")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--profile", choices=["steady", "ramp", "soak"], default="steady")
+    parser.add_argument("--clients", type=int, default=50, help="concurrent read clients")
+    parser.add_argument("--duration", type=float, default=60.0, help="seconds at full load")
+    parser.add_argument("--ramp-seconds", type=float, default=30.0)
+    parser.add_argument("--report-interval", type=float, default=60.0, help="soak report period in seconds")
+    parser.add_argument("--tenants", type=int, default=10)
+    parser.add_argument("--audit-sizes", type=lambda value: [int(rows) for rows in value.split(",")],
+                        default=[100, 1_000, 10_000], help="rows per uploaded audit, comma-separated")
+    parser.add_argument("--rules", type=int, default=5, help="rules per audit type and tenant")
+    parser.add_argument("--selectivity", type=float, default=0.05)
+    parser.add_argument("--seed-concurrency", type=int, default=4)
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--start-server", action="store_true", help="start uvicorn with rate limits lifted")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers with --start-server")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    server = start_server(args) if args.start_server else None
+    try:
+        results = asyncio.run(run(args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"profile": args.profile, "clients": args.clients, **results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
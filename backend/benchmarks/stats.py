@@ -0,0 +1,10 @@
+"""Summary statistics shared by the benchmarks"""
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of ``samples``; 0.0 when there are none"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
@@ -0,0 +1,123 @@
+"""
+Synthetic audit data
+
+Generates cloud, hospitality and business rows shaped like real uploads,
+plus rules whose match selectivity is known: every rule compares a metric
+uniformly distributed over [1, 101) against a threshold, so a rule with
+selectivity ``s`` matches about ``s`` of the rows.
+
+    python benchmarks/synthetic_data.py cloud --rows 100000 --columns 10 -o cloud.csv
+"""
+import argparse
+import csv
+import os
+import random
+import sys
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List
+from uuid import UUID, uuid4
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.domain.entities import AuditType, Rule, RuleSeverity  # noqa: E402
+
+# Metric columns (rules are built on these) and categorical columns per audit type
+SCHEMAS = {
+    AuditType.CLOUD: {
+        "metrics": ["cpu_utilization", "memory_utilization", "cost", "hours_running"],
+        "categories": {
+            "service": ["ec2", "rds", "s3", "lambda", "eks"],
+            "region": ["us-east-1", "us-west-2", "eu-west-1", "ap-south-1"]
+        }
+    },
+    AuditType.HOSPITALITY: {
+        "metrics": ["occupancy_rate", "adr", "revenue", "cancellations", "cost"],
+        "categories": {
+            "room_type": ["single", "double", "suite", "family"],
+            "channel": ["direct", "ota", "corporate", "walk_in"]
+        }
+    },
+    AuditType.BUSINESS: {
+        "metrics": ["amount", "budget_variance", "headcount", "cost"],
+        "categories": {
+            "department": ["sales", "engineering", "finance", "operations"],
+            "vendor": ["acme", "globex", "initech", "umbrella", "hooli"]
+        }
+    }
+}
+
+SEVERITIES = [RuleSeverity.LOW, RuleSeverity.MEDIUM, RuleSeverity.HIGH, RuleSeverity.CRITICAL]
+
+
+def generate_rows(audit_type: AuditType, rows: int, columns: int = 0, seed: int = 0) -> List[Dict[str, Any]]:
+    """``rows`` records of the type's schema plus ``columns`` extra filler columns"""
+    rng = random.Random(seed)
+    schema = SCHEMAS[audit_type]
+    start = date(2024, 1, 1)
+    records = []
+    for index in range(rows):
+        record: Dict[str, Any] = {
+            "id": f"{audit_type.value}-{index}",
+            "date": (start + timedelta(days=index % 365)).isoformat()
+        }
+        for name, values in schema["categories"].items():
+            record[name] = rng.choice(values)
+        for name in schema["metrics"]:
+            record[name] = round(rng.uniform(1, 101), 2)
+        for extra in range(columns):
+            record[f"extra_{extra}"] = round(rng.random() * 1000, 3)
+        records.append(record)
+    return records
+
+
+def generate_rules(
+    audit_type: AuditType,
+    count: int,
+    selectivity: float = 0.05,
+    organization_id: UUID = None,
+    seed: int = 0
+) -> List[Rule]:
+    """``count`` active rules on the type's metrics, each matching ~``selectivity`` of the rows"""
+    rng = random.Random(seed)
+    metrics = SCHEMAS[audit_type]["metrics"]
+    organization_id = organization_id or uuid4()
+    # Metrics are uniform over [1, 101): "> 101 - 100 * s" matches a fraction s
+    threshold = round(101 - 100 * selectivity, 2)
+    return [
+        Rule(
+            id=uuid4(),
+            organization_id=organization_id,
+            name=f"{metrics[index % len(metrics)]} above {threshold}",
+            audit_type=audit_type.value,
+            conditions={"field": metrics[index % len(metrics)], "operator": ">", "threshold": threshold},
+            severity=rng.choice(SEVERITIES),
+            is_active=True,
+            created_by=uuid4(),
+            created_at=datetime.utcnow()
+        )
+        for index in range(count)
+    ]
+
+
+def write_csv(path: str, records: List[Dict[str, Any]]) -> None:
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(records[0]) if records else [])
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("audit_type", choices=[audit_type.value for audit_type in AuditType])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--columns", type=int, default=0, help="extra filler columns")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", required=True)
+    args = parser.parse_args()
+
+    write_csv(args.output, generate_rows(AuditType(args.audit_type), args.rows, args.columns, args.seed))
+    print(f"wrote {args.rows} rows to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""Initial schema
+
+Mirrors the tables previously created by ``init_db()``. Databases that
+were built that way already have them: mark them as migrated with
+``alembic stamp 0001`` before running ``alembic upgrade head``.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("password_hash", sa.String(), nullable=False),
+        sa.Column("role", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True)
+    )
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "organizations",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("owner_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True)
+    )
+
+    op.create_table(
+        "audits",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("organization_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id"), nullable=False),
+        sa.Column("audit_type", sa.String(), nullable=False),
+        sa.Column("file_name", sa.String(), nullable=False),
+        sa.Column("file_path", sa.String(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("total_cost_or_revenue", sa.Float(), nullable=True),
+        sa.Column("optimization_score", sa.Integer(), nullable=True),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("created_by", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("completed_at", sa.DateTime(), nullable=True)
+    )
+
+    op.create_table(
+        "rules",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("organization_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("organizations.id"), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("audit_type", sa.String(), nullable=False),
+        sa.Column("conditions", sa.JSON(), nullable=False),
+        sa.Column("severity", sa.String(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.Column("created_by", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False)
+    )
+
+    op.create_table(
+        "findings",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("audit_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("audits.id"), nullable=False),
+        sa.Column("rule_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("rules.id"), nullable=True),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("severity", sa.String(), nullable=False),
+        sa.Column("cost_impact", sa.Float(), nullable=True),
+        sa.Column("evidence", sa.JSON(), nullable=True),
+        sa.Column("recommendation", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False)
+    )
+
+    op.create_table(
+        "organization_metrics",
+        sa.Column(
+            "organization_id", postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("organizations.id", ondelete="CASCADE"), primary_key=True
+        ),
+        sa.Column("total_audits", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("completed_audits", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("scored_audits", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("score_sum", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column("total_findings", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("total_cost_impact", sa.Float(), server_default="0", nullable=False),
+        sa.Column("active_rules", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True)
+    )
+
+    op.create_table(
+        "audit_rollups",
+        sa.Column(
+            "organization_id", postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("organizations.id", ondelete="CASCADE"), primary_key=True
+        ),
+        sa.Column("granularity", sa.String(), primary_key=True),
+        sa.Column("bucket_start", sa.Date(), primary_key=True),
+        sa.Column("audit_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("scored_audits", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("score_sum", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column("total_cost_impact", sa.Float(), server_default="0", nullable=False),
+        sa.Column("critical_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("high_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("medium_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("low_count", sa.Integer(), server_default="0", nullable=False)
+    )
+
+    op.create_table(
+        "audit_profiles",
+        sa.Column(
+            "audit_id", postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("audits.id", ondelete="CASCADE"), primary_key=True
+        ),
+        sa.Column("row_count", sa.Integer(), nullable=False),
+        sa.Column("columns", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False)
+    )
+
+    op.create_table(
+        "revoked_tokens",
+        sa.Column("jti", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.Column("revoked_at", sa.DateTime(), nullable=False)
+    )
+    op.create_index("ix_revoked_tokens_expires_at", "revoked_tokens", ["expires_at"])
+    op.create_index("ix_revoked_tokens_revoked_at", "revoked_tokens", ["revoked_at"])
+
+    op.create_table(
+        "rate_limit_buckets",
+        sa.Column("key", sa.String(), primary_key=True),
+        sa.Column("tokens", sa.Float(), nullable=False),
+        sa.Column("allowed", sa.Boolean(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False)
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("rate_limit_buckets")
+    op.drop_table("revoked_tokens")
+    op.drop_table("audit_profiles")
+    op.drop_table("audit_rollups")
+    op.drop_table("organization_metrics")
+    op.drop_table("findings")
+    op.drop_table("rules")
+    op.drop_table("audits")
+    op.drop_table("organizations")
+    op.drop_table("users")
@@ -0,0 +1,41 @@
+"""Composite indexes for the hot read paths
+
+Built with CREATE INDEX CONCURRENTLY so writes to the tables keep going
+while the indexes build. CONCURRENTLY cannot run inside a transaction,
+hence the autocommit block; ``if_not_exists`` lets a failed build be
+retried after dropping the INVALID index it leaves behind.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    # Organization lookups by owner (ownership checks, organization listings)
+    ("ix_organizations_owner_id", "organizations", ["owner_id"]),
+    # Per-organization audit listings, newest first
+    ("ix_audits_organization_id_created_at", "audits", ["organization_id", sa.text("created_at DESC")]),
+    # Active rules for an organization and audit type
+    ("ix_rules_organization_id_audit_type_is_active", "rules", ["organization_id", "audit_type", "is_active"]),
+    # Findings of an audit, optionally by severity
+    ("ix_findings_audit_id_severity", "findings", ["audit_id", "severity"]),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
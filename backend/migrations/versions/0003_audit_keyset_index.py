@@ -0,0 +1,35 @@
+"""Add id to the per-organization audit listing index
+
+Audit listings page by the (created_at, id) keyset; with id in the index
+the cursor is an index condition instead of a filter on every row before
+it. The new index is built before the old one is dropped, both
+CONCURRENTLY, so listings stay indexed throughout.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+OLD_INDEX = ("ix_audits_organization_id_created_at", ["organization_id", sa.text("created_at DESC")])
+NEW_INDEX = ("ix_audits_organization_id_created_at_id", ["organization_id", sa.text("created_at DESC"), sa.text("id DESC")])
+
+
+def _replace_index(old, new) -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(new[0], "audits", new[1], postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index(old[0], table_name="audits", postgresql_concurrently=True, if_exists=True)
+
+
+def upgrade() -> None:
+    _replace_index(OLD_INDEX, NEW_INDEX)
+
+
+def downgrade() -> None:
+    _replace_index(NEW_INDEX, OLD_INDEX)
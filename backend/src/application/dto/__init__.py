@@ -35,6 +35,10 @@ class TokenResponseDTO(BaseModel):
     user: UserResponseDTO
 
 
+class RefreshTokenDTO(BaseModel):
+    refresh_token: str
+
+
 # ============ ORGANIZATION DTOs ============
 class OrganizationCreateDTO(BaseModel):
     name: str = Field(..., min_length=1)
@@ -71,6 +75,11 @@ class AuditResponseDTO(BaseModel):
         from_attributes = True
 
 
+class StreamTokenResponseDTO(BaseModel):
+    stream_token: str
+    expires_in: int
+
+
 # ============ RULE DTOs ============
 class RuleCreateDTO(BaseModel):
     organization_id: UUID
@@ -116,6 +125,32 @@ class FindingResponseDTO(BaseModel):
     class Config:
         from_attributes = True
 
+# ============ PROFILE DTOs ============
+class ColumnProfileDTO(BaseModel):
+    name: str
+    inferred_type: str
+    count: int
+    null_count: int
+    distinct_estimate: int
+    min: Optional[Any] = None
+    max: Optional[Any] = None
+    mean: Optional[float] = None
+    top_values: Optional[List[Dict[str, Any]]] = None
+    histogram: Optional[Dict[str, List[float]]] = None
+    
+    class Config:
+        from_attributes = True
+
+
+class AuditProfileResponseDTO(BaseModel):
+    audit_id: UUID
+    row_count: int
+    created_at: datetime
+    columns: List[ColumnProfileDTO]
+    
+    class Config:
+        from_attributes = True
+
 # Organization List Response
 class OrganizationListResponse(BaseModel):
     organizations: List[OrganizationResponseDTO]
@@ -125,6 +160,7 @@ class OrganizationListResponse(BaseModel):
 class AuditListResponse(BaseModel):
     audits: List[AuditResponseDTO]
     total: int
+    next_cursor: Optional[str] = None
 
 # Finding List Response
 class FindingListResponse(BaseModel):
@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+
+
+class UnitOfWork(ABC):
+    """
+    Port (Interface) for grouping a use case's writes into one transaction
+
+    Used as ``async with unit_of_work:``. Repositories sharing the unit of
+    work stop committing on their own; everything is committed once when the
+    block exits, or rolled back if it raises. Domain events raised by the
+    writes are published only after the commit. Nested blocks join the
+    outermost one.
+    """
+
+    async def __aenter__(self) -> "UnitOfWork":
+        await self.begin()
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            await self.commit()
+        else:
+            await self.rollback()
+
+    @abstractmethod
+    async def begin(self) -> None:
+        pass
+
+    @abstractmethod
+    async def commit(self) -> None:
+        pass
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        pass
+
+    @abstractmethod
+    async def flush(self) -> None:
+        """Send pending writes to the database without committing"""
+        pass
@@ -9,6 +9,7 @@ from ...domain.repositories.finding_repository import FindingRepository
 from ...domain.repositories.rule_repository import RuleRepository
 from ...domain.services.audit_service import AuditService
 from ...domain.exceptions import EntityNotFoundError
+from ..unit_of_work import UnitOfWork
 
 
 class CreateAuditUseCase:
@@ -69,12 +70,14 @@ class ProcessAuditUseCase:
         audit_repository: AuditRepository,
         rule_repository: RuleRepository,
         finding_repository: FindingRepository,
-        audit_service: AuditService
+        audit_service: AuditService,
+        unit_of_work: UnitOfWork
     ):
         self.audit_repository = audit_repository
         self.rule_repository = rule_repository
         self.finding_repository = finding_repository
         self.audit_service = audit_service
+        self.unit_of_work = unit_of_work
     
     async def execute(self, audit_id: UUID, csv_data: List[dict]) -> Audit:
         # Get audit
@@ -84,34 +87,36 @@ class ProcessAuditUseCase:
         
         # Mark as processing
         audit.mark_as_processing()
-        await self.audit_repository.update(audit)
         
         try:
-            # Get active rules for this audit type
-            rules = await self.rule_repository.get_active_by_audit_type(
-                audit.organization_id,
-                audit.audit_type.value
-            )
-            
-            # Process data and generate findings
-            findings = self.audit_service.process_csv_data(audit, rules, csv_data)
-            
-            # Save findings
-            for finding in findings:
-                await self.finding_repository.create(finding)
-            
-            # Calculate metrics
-            score = self.audit_service.calculate_optimization_score(findings)
-            total_cost = self.audit_service.calculate_total_cost_impact(findings)
-            
-            # Mark as completed
-            audit.mark_as_completed(score, total_cost)
-            
+            # Status changes and findings are written in one transaction
+            async with self.unit_of_work:
+                await self.audit_repository.update(audit)
+                
+                # Get active rules for this audit type
+                rules = await self.rule_repository.get_active_by_audit_type(
+                    audit.organization_id,
+                    audit.audit_type.value
+                )
+                
+                # Process data and generate findings
+                findings = self.audit_service.process_csv_data(audit, rules, csv_data)
+                
+                # Save findings
+                await self.finding_repository.create_many(findings)
+                
+                # Calculate metrics
+                score = self.audit_service.calculate_optimization_score(findings)
+                total_cost = self.audit_service.calculate_total_cost_impact(findings)
+                
+                # Mark as completed
+                audit.mark_as_completed(score, total_cost)
+                return await self.audit_repository.update(audit)
+        
         except Exception as e:
-            # Mark as failed
+            # Partial findings were rolled back; record the failure on its own
             audit.mark_as_failed(str(e))
-        
-        return await self.audit_repository.update(audit)
+            return await self.audit_repository.update(audit)
 
 
 class GetAuditFindingsUseCase:
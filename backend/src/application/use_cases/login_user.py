@@ -35,6 +35,6 @@ class LoginUserUseCase:
             raise InvalidCredentialsError()
         
         # Authenticate
-        authenticated_user = self.auth_service.authenticate_user(user, password)
+        authenticated_user = await self.auth_service.authenticate_user_async(user, password)
         
         return authenticated_user
@@ -39,7 +39,7 @@ class RegisterUserUseCase:
             raise EntityAlreadyExistsError("User", "email", email)
         
         # Hash password
-        password_hash = self.auth_service.hash_password(password)
+        password_hash = await self.auth_service.hash_password_async(password)
         
         # Create user entity
         user = User(
@@ -0,0 +1,86 @@
+"""
+Management commands
+
+Usage:
+    python -m src.cli migrate [--revision REV]
+    python -m src.cli repair-metrics [--organization-id UUID]
+    python -m src.cli repair-trends [--organization-id UUID]
+    python -m src.cli purge-revoked-tokens
+"""
+
+import argparse
+import asyncio
+import os
+from uuid import UUID
+
+from .infrastructure.database import AsyncSessionLocal, async_engine
+from .infrastructure.persistence.repositories import (
+    SQLAlchemyMetricsRepository,
+    SQLAlchemyTrendRepository,
+    SQLAlchemyRevokedTokenRepository
+)
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+async def _run(repository_class, method: str, *args):
+    try:
+        async with AsyncSessionLocal() as db:
+            return await getattr(repository_class(db), method)(*args)
+    finally:
+        await async_engine.dispose()
+
+
+def migrate(args: argparse.Namespace) -> None:
+    """Apply Alembic migrations; run before starting (or upgrading) the API"""
+    from alembic import command
+    from alembic.config import Config
+    
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "migrations"))
+    command.upgrade(config, args.revision)
+
+
+def repair_metrics(args: argparse.Namespace) -> None:
+    """Rebuild organization_metrics counters from the source tables"""
+    rebuilt = asyncio.run(_run(SQLAlchemyMetricsRepository, "rebuild", args.organization_id))
+    print(f"Rebuilt metrics for {rebuilt} organization(s)")
+
+
+def repair_trends(args: argparse.Namespace) -> None:
+    """Rebuild audit_rollups trend buckets from the source tables"""
+    written = asyncio.run(_run(SQLAlchemyTrendRepository, "rebuild", args.organization_id))
+    print(f"Rebuilt {written} trend bucket(s)")
+
+
+def purge_revoked_tokens(args: argparse.Namespace) -> None:
+    """Delete revoked refresh-token ids whose tokens have expired"""
+    purged = asyncio.run(_run(SQLAlchemyRevokedTokenRepository, "purge_expired"))
+    print(f"Purged {purged} expired token id(s)")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m src.cli", description="SaaS platform management commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    upgrade = commands.add_parser("migrate", help="Create or upgrade the database schema")
+    upgrade.add_argument("--revision", default="head", help="Target Alembic revision")
+    upgrade.set_defaults(handler=migrate)
+    
+    repair = commands.add_parser("repair-metrics", help="Rebuild dashboard counters from source tables")
+    repair.add_argument("--organization-id", type=UUID, default=None, help="Only rebuild this organization")
+    repair.set_defaults(handler=repair_metrics)
+    
+    trends = commands.add_parser("repair-trends", help="Rebuild trend rollups from source tables")
+    trends.add_argument("--organization-id", type=UUID, default=None, help="Only rebuild this organization")
+    trends.set_defaults(handler=repair_trends)
+    
+    purge = commands.add_parser("purge-revoked-tokens", help="Delete expired entries from revoked_tokens")
+    purge.set_defaults(handler=purge_revoked_tokens)
+    
+    args = parser.parse_args(argv)
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
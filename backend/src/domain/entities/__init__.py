@@ -1,8 +1,10 @@
 from .user import User, UserRole
 from .organization import Organization
-from .audit import Audit, AuditType, AuditStatus
+from .audit import Audit, AuditType, AuditStatus, AuditPage, AuditCursor
 from .rule import Rule, RuleSeverity
 from .finding import Finding
+from .metrics import DashboardMetrics, TrendBucket, TrendGranularity
+from .profile import AuditProfile, ColumnProfile
 
 __all__ = [
     "User",
@@ -11,7 +13,14 @@ __all__ = [
     "Audit",
     "AuditType",
     "AuditStatus",
+    "AuditPage",
+    "AuditCursor",
     "Rule",
     "RuleSeverity",
     "Finding",
+    "DashboardMetrics",
+    "TrendBucket",
+    "TrendGranularity",
+    "AuditProfile",
+    "ColumnProfile",
 ]
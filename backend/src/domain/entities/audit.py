@@ -1,8 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from uuid import UUID
 from enum import Enum
-from typing import Optional
+from typing import List, Optional, Tuple
 
 
 class AuditType(str, Enum):
@@ -63,3 +63,17 @@ class Audit:
     def is_editable(self) -> bool:
         """Business rule: Only pending audits can be edited"""
         return self.status == AuditStatus.PENDING
+
+
+# Keyset position in a newest-first listing: (created_at, id) of the last row seen
+AuditCursor = Tuple[datetime, UUID]
+
+
+@dataclass
+class AuditPage:
+    """Read model - One page of an audit listing, newest first"""
+    
+    audits: List[Audit]
+    total: int
+    organization_ids: List[UUID] = field(default_factory=list)
+    next_cursor: Optional[AuditCursor] = None
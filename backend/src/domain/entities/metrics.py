@@ -0,0 +1,46 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from enum import Enum
+from uuid import UUID
+from typing import Dict, Optional
+
+
+class TrendGranularity(str, Enum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+    
+    def bucket_start(self, moment: date) -> date:
+        """Start of the bucket containing ``moment`` (weeks start on Monday)"""
+        day = moment.date() if isinstance(moment, datetime) else moment
+        if self == TrendGranularity.WEEK:
+            return day - timedelta(days=day.weekday())
+        if self == TrendGranularity.MONTH:
+            return day.replace(day=1)
+        return day
+
+
+@dataclass
+class DashboardMetrics:
+    """Read model - Aggregated metrics for an organization dashboard"""
+    
+    organization_id: UUID
+    total_audits: int = 0
+    completed_audits: int = 0
+    total_findings: int = 0
+    avg_optimization_score: Optional[float] = None
+    total_cost_impact: float = 0.0
+    active_rules: int = 0
+
+
+@dataclass
+class TrendBucket:
+    """Read model - Pre-rolled audit aggregates for one time bucket"""
+    
+    organization_id: UUID
+    granularity: TrendGranularity
+    bucket_start: date
+    audit_count: int = 0
+    avg_optimization_score: Optional[float] = None
+    total_cost_impact: float = 0.0
+    severity_counts: Dict[str, int] = field(default_factory=dict)
@@ -0,0 +1,36 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class ColumnProfile:
+    """Summary statistics of one column of an uploaded audit file"""
+    
+    name: str
+    inferred_type: str
+    count: int
+    null_count: int
+    distinct_estimate: int
+    min: Optional[Any] = None
+    max: Optional[Any] = None
+    mean: Optional[float] = None
+    top_values: Optional[List[Dict[str, Any]]] = None
+    histogram: Optional[Dict[str, List[float]]] = None
+    
+    def is_numeric(self) -> bool:
+        return self.inferred_type in ("integer", "float")
+
+
+@dataclass
+class AuditProfile:
+    """Column profiles of an audit's data, built when the file is parsed"""
+    
+    audit_id: UUID
+    row_count: int
+    created_at: datetime
+    columns: List[ColumnProfile] = field(default_factory=list)
+    
+    def get_column(self, name: str) -> Optional[ColumnProfile]:
+        return next((column for column in self.columns if column.name == name), None)
@@ -0,0 +1,123 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Type
+from uuid import UUID
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DomainEvent:
+    """Base event"""
+
+
+@dataclass(frozen=True)
+class UserChanged(DomainEvent):
+    """Raised when a user is updated or deleted"""
+    user_id: UUID
+
+
+@dataclass(frozen=True)
+class OrganizationEvent(DomainEvent):
+    """Base event - Something changed inside an organization"""
+    organization_id: UUID
+
+
+@dataclass(frozen=True)
+class OrganizationChanged(OrganizationEvent):
+    """Raised when an organization is created, updated or deleted"""
+    owner_id: UUID
+
+
+@dataclass(frozen=True)
+class AuditChanged(OrganizationEvent):
+    """Raised when an audit is created, updated or deleted"""
+    audit_id: UUID
+
+
+@dataclass(frozen=True)
+class FindingsChanged(OrganizationEvent):
+    """Raised when findings of an audit are created or deleted"""
+    audit_id: UUID
+
+
+@dataclass(frozen=True)
+class RuleChanged(OrganizationEvent):
+    """Raised when a rule is created, updated or deleted"""
+    rule_id: UUID
+
+
+class AuditPhase(str, Enum):
+    PARSING = "parsing"
+    EVALUATING = "evaluating"
+    PERSISTING = "persisting"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    
+    @property
+    def is_final(self) -> bool:
+        return self in (AuditPhase.COMPLETED, AuditPhase.FAILED)
+
+
+@dataclass(frozen=True)
+class AuditProgress:
+    """Progress notification emitted while an audit is being processed"""
+    audit_id: UUID
+    phase: AuditPhase
+    rows_total: int = 0
+    rows_processed: int = 0
+    findings: int = 0
+    optimization_score: Optional[int] = None
+    error_message: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "audit_id": str(self.audit_id),
+            "phase": self.phase.value,
+            "rows_total": self.rows_total,
+            "rows_processed": self.rows_processed,
+            "findings": self.findings,
+            "optimization_score": self.optimization_score,
+            "error_message": self.error_message
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AuditProgress":
+        return cls(
+            audit_id=UUID(data["audit_id"]),
+            phase=AuditPhase(data["phase"]),
+            rows_total=data.get("rows_total", 0),
+            rows_processed=data.get("rows_processed", 0),
+            findings=data.get("findings", 0),
+            optimization_score=data.get("optimization_score"),
+            error_message=data.get("error_message")
+        )
+
+
+EventHandler = Callable[[DomainEvent], None]
+
+
+class EventBus:
+    """Synchronous in-process publish/subscribe for domain events"""
+    
+    def __init__(self):
+        self._handlers: Dict[Type[DomainEvent], List[EventHandler]] = defaultdict(list)
+    
+    def subscribe(self, event_type: Type[DomainEvent], handler: EventHandler) -> None:
+        """Register a handler for an event type and its subclasses"""
+        self._handlers[event_type].append(handler)
+    
+    def publish(self, event: DomainEvent) -> None:
+        """Dispatch an event; handler errors are logged, never raised to the publisher"""
+        for event_type in type(event).__mro__:
+            for handler in self._handlers.get(event_type, ()):
+                try:
+                    handler(event)
+                except Exception:
+                    logger.exception("Event handler failed for %s", type(event).__name__)
+
+
+# Process-wide bus used by the persistence adapters
+event_bus = EventBus()
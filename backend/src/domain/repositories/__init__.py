@@ -3,6 +3,9 @@ from .organization_repository import OrganizationRepository
 from .audit_repository import AuditRepository
 from .rule_repository import RuleRepository
 from .finding_repository import FindingRepository
+from .metrics_repository import MetricsRepository, TrendRepository
+from .audit_profile_repository import AuditProfileRepository
+from .revoked_token_repository import RevokedTokenRepository
 
 __all__ = [
     "UserRepository",
@@ -10,4 +13,8 @@ __all__ = [
     "AuditRepository",
     "RuleRepository",
     "FindingRepository",
+    "MetricsRepository",
+    "TrendRepository",
+    "AuditProfileRepository",
+    "RevokedTokenRepository",
 ]
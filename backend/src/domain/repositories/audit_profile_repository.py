@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+
+from ..entities.profile import AuditProfile
+
+
+class AuditProfileRepository(ABC):
+    """Port (Interface) for audit data profiles"""
+    
+    @abstractmethod
+    async def save(self, profile: AuditProfile) -> AuditProfile:
+        """Create or replace the profile of an audit"""
+        pass
+    
+    @abstractmethod
+    async def get_by_audit(self, audit_id: UUID) -> Optional[AuditProfile]:
+        """Get the profile of an audit"""
+        pass
@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Optional, List
 from uuid import UUID
 
-from ..entities.audit import Audit, AuditStatus
+from ..entities.audit import Audit, AuditCursor, AuditPage, AuditStatus, AuditType
 
 
 class AuditRepository(ABC):
@@ -18,11 +18,35 @@ class AuditRepository(ABC):
         """Get audit by ID"""
         pass
     
+    @abstractmethod
+    async def get_by_id_for_owner(self, audit_id: UUID, owner_id: UUID) -> Optional[Audit]:
+        """Get audit by ID if its organization is owned by the user"""
+        pass
+    
     @abstractmethod
     async def get_by_organization(self, org_id: UUID) -> List[Audit]:
         """Get all audits for an organization"""
         pass
     
+    @abstractmethod
+    async def list_for_owner(
+        self,
+        owner_id: UUID,
+        organization_id: Optional[UUID] = None,
+        status: Optional[AuditStatus] = None,
+        audit_type: Optional[AuditType] = None,
+        limit: int = 50,
+        after: Optional[AuditCursor] = None
+    ) -> AuditPage:
+        """
+        Get a page of audits across the user's organizations, newest first
+        
+        ``after`` is the ``next_cursor`` of the previous page. ``total``
+        counts every matching audit and ``organization_ids`` lists the
+        organizations in scope (empty if ``organization_id`` is not owned).
+        """
+        pass
+    
     @abstractmethod
     async def get_by_status(self, status: AuditStatus) -> List[Audit]:
         """Get audits by status"""
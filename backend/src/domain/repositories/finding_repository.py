@@ -12,6 +12,11 @@ class FindingRepository(ABC):
     async def create(self, finding: Finding) -> Finding:
         pass
     
+    @abstractmethod
+    async def create_many(self, findings: List[Finding]) -> List[Finding]:
+        """Create findings in one batch"""
+        pass
+    
     @abstractmethod
     async def get_by_id(self, finding_id: UUID) -> Optional[Finding]:
         pass
@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List, Optional
+from uuid import UUID
+
+from ..entities.metrics import DashboardMetrics, TrendBucket, TrendGranularity
+
+
+class MetricsRepository(ABC):
+    """Port (Interface) for aggregated organization metrics"""
+    
+    @abstractmethod
+    async def get_dashboard_metrics(self, org_id: UUID) -> DashboardMetrics:
+        """Get aggregated dashboard metrics for an organization"""
+        pass
+    
+    @abstractmethod
+    async def rebuild(self, org_id: Optional[UUID] = None) -> int:
+        """Recompute counters from source tables, return number of organizations rebuilt"""
+        pass
+
+
+class TrendRepository(ABC):
+    """Port (Interface) for time-bucketed audit rollups"""
+    
+    @abstractmethod
+    async def get_trends(
+        self,
+        org_id: UUID,
+        granularity: TrendGranularity,
+        since: Optional[date] = None,
+        until: Optional[date] = None
+    ) -> List[TrendBucket]:
+        """Get rollup buckets for an organization ordered by bucket start"""
+        pass
+    
+    @abstractmethod
+    async def rebuild(self, org_id: Optional[UUID] = None) -> int:
+        """Recompute rollups from source tables, return number of buckets written"""
+        pass
@@ -18,6 +18,11 @@ class OrganizationRepository(ABC):
         """Get organization by ID"""
         pass
     
+    @abstractmethod
+    async def get_by_id_for_owner(self, org_id: UUID, owner_id: UUID) -> Optional[Organization]:
+        """Get organization by ID if it is owned by the user"""
+        pass
+    
     @abstractmethod
     async def get_by_owner(self, owner_id: UUID) -> List[Organization]:
         """Get all organizations owned by user"""
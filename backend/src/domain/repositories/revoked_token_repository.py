@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+
+class RevokedTokenRepository(ABC):
+    """Port (Interface) for revoked refresh-token ids"""
+    
+    @abstractmethod
+    async def revoke(self, jti: UUID, expires_at: datetime) -> bool:
+        """Record a token id as revoked; returns False if it already was"""
+        pass
+    
+    @abstractmethod
+    async def is_revoked(self, jti: UUID) -> bool:
+        """Check whether a token id has been revoked"""
+        pass
+    
+    @abstractmethod
+    async def get_revoked_since(self, since: Optional[datetime] = None) -> List[Tuple[UUID, datetime]]:
+        """Get unexpired revoked ids with their revocation time, optionally only newer than ``since``"""
+        pass
+    
+    @abstractmethod
+    async def purge_expired(self) -> int:
+        """Delete ids whose tokens have expired anyway; returns the number removed"""
+        pass
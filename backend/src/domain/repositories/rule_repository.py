@@ -16,6 +16,11 @@ class RuleRepository(ABC):
     async def get_by_id(self, rule_id: UUID) -> Optional[Rule]:
         pass
     
+    @abstractmethod
+    async def get_by_id_for_owner(self, rule_id: UUID, owner_id: UUID) -> Optional[Rule]:
+        """Get rule by ID if its organization is owned by the user"""
+        pass
+    
     @abstractmethod
     async def get_by_organization(self, org_id: UUID) -> List[Rule]:
         pass
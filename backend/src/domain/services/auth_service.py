@@ -1,3 +1,5 @@
+from typing import Optional
+
 from passlib.context import CryptContext
 from ..entities.user import User
 from ..exceptions import InvalidCredentialsError
@@ -6,8 +8,8 @@ from ..exceptions import InvalidCredentialsError
 class AuthenticationService:
     """Domain service for authentication logic"""
     
-    def __init__(self):
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    def __init__(self, pwd_context: Optional[CryptContext] = None):
+        self.pwd_context = pwd_context or CryptContext(schemes=["bcrypt"], deprecated="auto")
     
     def hash_password(self, password: str) -> str:
         """Hash a password"""
@@ -26,3 +28,21 @@ class AuthenticationService:
             raise InvalidCredentialsError()
         
         return user
+    
+    async def hash_password_async(self, password: str) -> str:
+        """
+        Hash a password from async code
+        Runs inline here; infrastructure adapters offload it from the event loop
+        """
+        return self.hash_password(password)
+    
+    async def verify_password_async(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify password against hash from async code"""
+        return self.verify_password(plain_password, hashed_password)
+    
+    async def authenticate_user_async(self, user: User, password: str) -> User:
+        """Async variant of authenticate_user"""
+        if not await self.verify_password_async(password, user.password_hash):
+            raise InvalidCredentialsError()
+        
+        return user
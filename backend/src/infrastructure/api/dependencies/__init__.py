@@ -1,55 +1,170 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 from uuid import UUID
 
 from ...database import get_db
-from ...security.jwt import decode_access_token
+from ...security.auth_cache import auth_cache, bearer_user_id
+from ...security.jwt import decode_stream_token
+from ...security.password_hashing import auth_service
+from ...security.revocation import revocation_list
+from ..middleware.read_routing import read_router
+from ...reports.pdf_report import report_cache
+from ...messaging.progress import progress_broker
+from ...datasets.audit_data_store import audit_data_store
 from ...persistence.repositories import (
     SQLAlchemyUserRepository,
     SQLAlchemyOrganizationRepository,
     SQLAlchemyAuditRepository,
     SQLAlchemyRuleRepository,
-    SQLAlchemyFindingRepository
+    SQLAlchemyFindingRepository,
+    SQLAlchemyMetricsRepository,
+    SQLAlchemyTrendRepository,
+    SQLAlchemyAuditProfileRepository,
+    SQLAlchemyRevokedTokenRepository
+)
+from ...persistence.unit_of_work import SQLAlchemyUnitOfWork
+from ...persistence.memory import (
+    InMemoryUserRepository,
+    InMemoryOrganizationRepository,
+    InMemoryAuditRepository,
+    InMemoryRuleRepository,
+    InMemoryFindingRepository,
+    InMemoryMetricsRepository,
+    InMemoryTrendRepository,
+    InMemoryAuditProfileRepository,
+    InMemoryRevokedTokenRepository,
+    InMemoryUnitOfWork,
+    create_memory_store
 )
 from ....domain.services import AuthenticationService, AuditService
+from ....domain.entities import Audit, Organization, Rule
 from ....domain.entities.user import User
 from ....application.use_cases import *
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 
 # ============ REPOSITORIES ============
+# With REPOSITORY_BACKEND=memory every port is served from this store
+# instead of Postgres; tests may also swap in a fresh InMemoryStore
+
+memory_store = create_memory_store()
+
+
+def _repository(sqlalchemy_repository, memory_repository, db: AsyncSession):
+    if memory_store is not None:
+        return memory_repository(memory_store)
+    return sqlalchemy_repository(db)
+
+
+def get_user_repository(db: AsyncSession = Depends(get_db)):
+    return _repository(SQLAlchemyUserRepository, InMemoryUserRepository, db)
+
+
+def get_organization_repository(db: AsyncSession = Depends(get_db)):
+    return _repository(SQLAlchemyOrganizationRepository, InMemoryOrganizationRepository, db)
+
+
+def get_audit_repository(db: AsyncSession = Depends(get_db)):
+    return _repository(SQLAlchemyAuditRepository, InMemoryAuditRepository, db)
+
+
+def get_rule_repository(db: AsyncSession = Depends(get_db)):
+    return _repository(SQLAlchemyRuleRepository, InMemoryRuleRepository, db)
+
+
+def get_finding_repository(db: AsyncSession = Depends(get_db)):
+    return _repository(SQLAlchemyFindingRepository, InMemoryFindingRepository, db)
+
+
+# ============ READ REPLICA ============
+# GET routes send read-only repository calls here. They reach the replica
+# when one is configured, current, and the user has not just written;
+# otherwise the primary serves them.
+
+async def get_read_db(request: Request, db: AsyncSession = Depends(get_db)):
+    """Replica session, or the request's primary session"""
+    async with read_router.session(request.method, bearer_user_id(request.headers.get("authorization")), db) as session:
+        yield session
+
 
-def get_user_repository(db: Session = Depends(get_db)):
-    return SQLAlchemyUserRepository(db)
+async def get_separate_read_db(request: Request, db: AsyncSession = Depends(get_db, use_cache=False)):
+    """Replica session, or a primary session of its own for concurrent use"""
+    async with read_router.session(request.method, bearer_user_id(request.headers.get("authorization")), db) as session:
+        yield session
 
 
-def get_organization_repository(db: Session = Depends(get_db)):
-    return SQLAlchemyOrganizationRepository(db)
+def get_read_organization_repository(db: AsyncSession = Depends(get_read_db)):
+    return _repository(SQLAlchemyOrganizationRepository, InMemoryOrganizationRepository, db)
 
 
-def get_audit_repository(db: Session = Depends(get_db)):
-    return SQLAlchemyAuditRepository(db)
+def get_read_audit_repository(db: AsyncSession = Depends(get_read_db)):
+    return _repository(SQLAlchemyAuditRepository, InMemoryAuditRepository, db)
 
 
-def get_rule_repository(db: Session = Depends(get_db)):
-    return SQLAlchemyRuleRepository(db)
+def get_read_rule_repository(db: AsyncSession = Depends(get_read_db)):
+    return _repository(SQLAlchemyRuleRepository, InMemoryRuleRepository, db)
 
 
-def get_finding_repository(db: Session = Depends(get_db)):
-    return SQLAlchemyFindingRepository(db)
+def get_read_finding_repository(db: AsyncSession = Depends(get_read_db)):
+    return _repository(SQLAlchemyFindingRepository, InMemoryFindingRepository, db)
+
+
+# Read-only ports get their own session so routes can gather them
+# concurrently with lookups on the request session
+
+def get_metrics_repository(db: AsyncSession = Depends(get_separate_read_db)):
+    return _repository(SQLAlchemyMetricsRepository, InMemoryMetricsRepository, db)
+
+
+def get_trend_repository(db: AsyncSession = Depends(get_separate_read_db)):
+    return _repository(SQLAlchemyTrendRepository, InMemoryTrendRepository, db)
+
+
+def get_audit_profile_repository(db: AsyncSession = Depends(get_db)):
+    return _repository(SQLAlchemyAuditProfileRepository, InMemoryAuditProfileRepository, db)
+
+
+def get_revoked_token_repository(db: AsyncSession = Depends(get_db)):
+    return _repository(SQLAlchemyRevokedTokenRepository, InMemoryRevokedTokenRepository, db)
+
+
+# Repositories above share the request session, so they join this
+# unit of work while it is active
+def get_unit_of_work(db: AsyncSession = Depends(get_db)):
+    if memory_store is not None:
+        return InMemoryUnitOfWork(memory_store)
+    return SQLAlchemyUnitOfWork(db)
 
 
 # ============ SERVICES ============
 
-def get_auth_service():
-    return AuthenticationService()
+def get_auth_service() -> AuthenticationService:
+    return auth_service
 
 
 def get_audit_service():
     return AuditService()
 
 
+def get_report_cache():
+    return report_cache
+
+
+def get_progress_broker():
+    return progress_broker
+
+
+def get_audit_data_store():
+    return audit_data_store
+
+
+def get_revocation_list():
+    return revocation_list
+
+
 # ============ USER USE CASES ============
 
 def get_register_user_use_case(
@@ -72,7 +187,7 @@ def get_create_organization_use_case(org_repo=Depends(get_organization_repositor
     return CreateOrganizationUseCase(org_repo)
 
 
-def get_user_organizations_use_case(org_repo=Depends(get_organization_repository)):
+def get_user_organizations_use_case(org_repo=Depends(get_read_organization_repository)):
     return GetUserOrganizationsUseCase(org_repo)
 
 
@@ -106,12 +221,13 @@ def get_process_audit_use_case(
     audit_repo=Depends(get_audit_repository),
     rule_repo=Depends(get_rule_repository),
     finding_repo=Depends(get_finding_repository),
-    audit_service=Depends(get_audit_service)
+    audit_service=Depends(get_audit_service),
+    unit_of_work=Depends(get_unit_of_work)
 ):
-    return ProcessAuditUseCase(audit_repo, rule_repo, finding_repo, audit_service)
+    return ProcessAuditUseCase(audit_repo, rule_repo, finding_repo, audit_service, unit_of_work)
 
 
-def get_audit_findings_use_case(finding_repo=Depends(get_finding_repository)):
+def get_audit_findings_use_case(finding_repo=Depends(get_read_finding_repository)):
     return GetAuditFindingsUseCase(finding_repo)
 
 
@@ -143,22 +259,25 @@ def get_active_rules_by_audit_type_use_case(rule_repo=Depends(get_rule_repositor
 
 # ============ CURRENT USER ============
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    user_repo=Depends(get_user_repository)
-) -> User:
-    """Get current authenticated user"""
-    token = credentials.credentials
-    payload = decode_access_token(token)
-    
-    if not payload or "sub" not in payload:
+async def _resolve_user(token: str, user_repo) -> User:
+    # Recently verified tokens and their users are served from memory,
+    # so an authenticated request costs no extra DB round-trip
+    payload = auth_cache.payload_for(token)
+    if not payload:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials"
         )
-    
-    user_id = UUID(payload["sub"])
-    user = await user_repo.get_by_id(user_id)
+    return await _load_user(UUID(payload["sub"]), user_repo)
+
+
+async def _load_user(user_id: UUID, user_repo) -> User:
+    user = auth_cache.get_user(user_id)
+    if user is None:
+        generation = auth_cache.generation
+        user = await user_repo.get_by_id(user_id)
+        if user:
+            auth_cache.set_user(user, generation)
     
     if not user:
         raise HTTPException(
@@ -167,3 +286,99 @@ async def get_current_user(
         )
     
     return user
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    user_repo=Depends(get_user_repository)
+) -> User:
+    """Get current authenticated user"""
+    return await _resolve_user(credentials.credentials, user_repo)
+
+
+async def get_current_user_for_stream(
+    audit_id: UUID,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+    stream_token: Optional[str] = Query(None),
+    user_repo=Depends(get_user_repository)
+) -> User:
+    """
+    Get current user for an audit's event stream
+    
+    Browsers' EventSource cannot send headers, so instead of the bearer
+    header the stream accepts a ``stream_token`` query parameter: a
+    short-lived token valid for this audit only (``POST
+    /audits/{audit_id}/events/token``). Access tokens never go in the URL.
+    """
+    if credentials:
+        return await _resolve_user(credentials.credentials, user_repo)
+    if not stream_token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated"
+        )
+    payload = decode_stream_token(stream_token, audit_id)
+    if not payload:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials"
+        )
+    return await _load_user(UUID(payload["sub"]), user_repo)
+
+
+# ============ AUTHORIZATION ============
+# Each dependency loads the resource and checks ownership in one query.
+# Resources the user does not own are reported as missing.
+
+async def get_owned_organization(
+    organization_id: UUID,
+    current_user: User = Depends(get_current_user),
+    org_repo=Depends(get_organization_repository)
+) -> Organization:
+    """Organization from the ``organization_id`` query parameter, owned by the current user"""
+    org = await org_repo.get_by_id_for_owner(organization_id, current_user.id)
+    if not org:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Organization not found"
+        )
+    return org
+
+
+async def get_owned_audit(
+    audit_id: UUID,
+    current_user: User = Depends(get_current_user),
+    audit_repo=Depends(get_audit_repository)
+) -> Audit:
+    """Audit from the ``audit_id`` path parameter, owned by the current user"""
+    audit = await audit_repo.get_by_id_for_owner(audit_id, current_user.id)
+    if not audit:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Audit not found")
+    return audit
+
+
+async def get_owned_audit_for_stream(
+    audit_id: UUID,
+    current_user: User = Depends(get_current_user_for_stream),
+    audit_repo=Depends(get_audit_repository)
+) -> Audit:
+    """Like get_owned_audit, authenticating as streaming endpoints do"""
+    audit = await audit_repo.get_by_id_for_owner(audit_id, current_user.id)
+    if not audit:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Audit not found")
+    return audit
+
+
+async def get_owned_rule(
+    rule_id: UUID,
+    current_user: User = Depends(get_current_user),
+    rule_repo=Depends(get_rule_repository)
+) -> Rule:
+    """Rule from the ``rule_id`` path parameter, owned by the current user"""
+    rule = await rule_repo.get_by_id_for_owner(rule_id, current_user.id)
+    if not rule:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Rule not found"
+        )
+    return rule
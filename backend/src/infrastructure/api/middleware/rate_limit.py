@@ -0,0 +1,109 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+import json
+import math
+import os
+
+from ...security.auth_cache import bearer_user_id
+from ...security.rate_limit import RateLimit, RateLimitBackend, create_rate_limit_backend
+
+# Only honour X-Forwarded-For behind a trusted reverse proxy
+RATE_LIMIT_TRUST_FORWARDED = os.getenv("RATE_LIMIT_TRUST_FORWARDED", "false").lower() == "true"
+
+
+@dataclass(frozen=True)
+class RouteGroup:
+    """Endpoints sharing a budget; each client gets one bucket per group"""
+    name: str
+    routes: Tuple[Tuple[str, str], ...]
+    per_ip: Optional[RateLimit] = None
+    per_user: Optional[RateLimit] = None
+
+
+DEFAULT_ROUTE_GROUPS = (
+    # Login and registration are unauthenticated, so only the client IP is known
+    RouteGroup(
+        name="auth",
+        routes=(("POST", "/auth/login"), ("POST", "/auth/register"), ("POST", "/auth/refresh")),
+        per_ip=RateLimit.parse(os.getenv("RATE_LIMIT_AUTH_PER_IP", "20/60"))
+    ),
+    RouteGroup(
+        name="upload",
+        routes=(("POST", "/audits/upload"),),
+        per_ip=RateLimit.parse(os.getenv("RATE_LIMIT_UPLOAD_PER_IP", "60/3600")),
+        per_user=RateLimit.parse(os.getenv("RATE_LIMIT_UPLOAD_PER_USER", "30/3600"))
+    ),
+)
+
+
+class RateLimitMiddleware:
+    """
+    ASGI middleware applying token-bucket limits per route group
+
+    Requests outside every group cost one dictionary lookup. Limited
+    requests are checked against a per-IP bucket and, when a bearer token
+    is present, a per-user bucket; the first empty bucket answers 429 with
+    ``Retry-After``.
+    """
+
+    def __init__(
+        self,
+        app,
+        backend: Optional[RateLimitBackend] = None,
+        groups: Iterable[RouteGroup] = DEFAULT_ROUTE_GROUPS
+    ):
+        self.app = app
+        self.backend = backend or rate_limit_backend
+        self.routes: Dict[Tuple[str, str], RouteGroup] = {
+            route: group for group in groups for route in group.routes
+        }
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        group = self.routes.get((scope["method"], scope["path"]))
+        if group is None:
+            await self.app(scope, receive, send)
+            return
+
+        retry_after = 0.0
+        if group.per_ip is not None:
+            retry_after = await self.backend.consume(f"{group.name}:ip:{_client_ip(scope)}", group.per_ip)
+        if not retry_after and group.per_user is not None:
+            user_id = bearer_user_id(dict(scope.get("headers", [])).get(b"authorization"))
+            if user_id is not None:
+                retry_after = await self.backend.consume(f"{group.name}:user:{user_id}", group.per_user)
+
+        if retry_after:
+            await _send_too_many_requests(send, retry_after)
+            return
+
+        await self.app(scope, receive, send)
+
+
+def _client_ip(scope) -> str:
+    if RATE_LIMIT_TRUST_FORWARDED:
+        for name, value in scope.get("headers", []):
+            if name == b"x-forwarded-for":
+                return value.decode("latin-1").split(",")[0].strip()
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+async def _send_too_many_requests(send, retry_after: float) -> None:
+    body = json.dumps({"detail": "Too many requests"}).encode()
+    await send({
+        "type": "http.response.start",
+        "status": 429,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+            (b"retry-after", str(max(1, math.ceil(retry_after))).encode("latin-1")),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+rate_limit_backend = create_rate_limit_backend()
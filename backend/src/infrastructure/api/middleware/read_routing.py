@@ -0,0 +1,38 @@
+from typing import Optional
+
+from ...persistence.replica import READ_METHODS, ReadRouter, create_read_router
+from ...security.auth_cache import bearer_user_id
+
+
+class ReadYourWritesMiddleware:
+    """
+    ASGI middleware pinning a user's reads to the primary after a write
+
+    Any authenticated request other than GET/HEAD counts as a write; the
+    pin starts when its response starts, so it also covers long uploads.
+    Only installed when a read replica is configured.
+    """
+
+    def __init__(self, app, router: Optional[ReadRouter] = None):
+        self.app = app
+        self.router = router or read_router
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in READ_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        user_id = bearer_user_id(dict(scope.get("headers", [])).get(b"authorization"))
+        if user_id is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def pin_on_response(message):
+            if message["type"] == "http.response.start":
+                self.router.pin(user_id)
+            await send(message)
+
+        await self.app(scope, receive, pin_on_response)
+
+
+read_router = create_read_router()
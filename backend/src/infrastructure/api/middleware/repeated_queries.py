@@ -0,0 +1,44 @@
+import logging
+import os
+
+from ...observability.db_metrics import RequestQueries, repeated_statements, request_queries
+from .request_metrics import route_label
+
+logger = logging.getLogger(__name__)
+
+# Development aid, on with ENVIRONMENT=development: keeping every statement
+# of every request is too costly for production
+REPEATED_QUERY_WARNINGS = os.getenv("ENVIRONMENT") == "development"
+# Executions of one statement shape per request before a warning
+REPEATED_QUERY_LIMIT = int(os.getenv("REPEATED_QUERY_LIMIT", "5"))
+
+
+class RepeatedQueryMiddleware:
+    """
+    Warn when a request runs the same statement shape over and over
+
+    That is the signature of an N+1: a query issued once per row of an
+    earlier result instead of one query for all of them. Statements are
+    compared by fingerprint, so different parameters count as repeats.
+    """
+
+    def __init__(self, app, limit: int = REPEATED_QUERY_LIMIT):
+        self.app = app
+        self.limit = limit
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        queries = RequestQueries(keep_statements=True, parent=request_queries.get())
+        token = request_queries.set(queries)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_queries.reset(token)
+            for shape, count in repeated_statements(queries.statements, more_than=self.limit):
+                logger.warning(
+                    "%s %s ran the same statement %d times (possible N+1): %s",
+                    scope["method"], route_label(scope), count, shape
+                )
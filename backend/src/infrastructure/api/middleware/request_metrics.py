@@ -0,0 +1,64 @@
+import time
+
+from ...observability.app_metrics import HttpMetrics, http_metrics
+from ...observability.db_metrics import RequestQueries, request_queries
+from .response_cache import CACHEABLE_PATHS
+
+# Label for requests no route matched, so unknown paths can't grow the label set
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def route_label(scope) -> str:
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    # Cache hits are answered before routing, on fixed paths
+    if scope["path"] in CACHEABLE_PATHS:
+        return scope["path"]
+    return UNMATCHED_ROUTE
+
+
+class RequestMetricsMiddleware:
+    """
+    Per-route latency, response size and SQL statement count
+
+    Registered outermost so cached responses, 429s and CORS preflights are
+    measured too. Routes are labelled by template (``/audits/{audit_id}``),
+    which keeps the number of series bounded.
+    """
+
+    def __init__(self, app, metrics: HttpMetrics = http_metrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        queries = RequestQueries()
+        token = request_queries.set(queries)
+        response = {"status": 500, "size": 0}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+            elif message["type"] == "http.response.body":
+                response["size"] += len(message.get("body", b""))
+            await send(message)
+
+        self.metrics.in_flight.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.metrics.in_flight.dec()
+            request_queries.reset(token)
+            self.metrics.observe(
+                scope["method"],
+                route_label(scope),
+                response["status"],
+                time.perf_counter() - started,
+                response["size"],
+                queries.count
+            )
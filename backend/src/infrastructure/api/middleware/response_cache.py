@@ -0,0 +1,256 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+import hashlib
+import os
+import threading
+import time
+
+from ....domain.events import EventBus, OrganizationChanged, OrganizationEvent, UserChanged, event_bus
+from ...security.auth_cache import bearer_user_id
+
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "2048"))
+# Domain events only reach the worker that made the change; the TTL bounds
+# how long other workers keep serving the previous data
+RESPONSE_CACHE_TTL_SECONDS = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "30"))
+
+CACHEABLE_PATHS = {"/dashboard/metrics", "/audits", "/rules"}
+
+CacheKey = Tuple[str, str, bytes]
+
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    etag: str
+    media_type: str
+    tags: Tuple[Hashable, ...]
+    expires_at: float
+
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag over the exact response bytes"""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+class ResponseCache:
+    """
+    Bounded LRU of serialized GET responses keyed by user, path and query
+
+    Each entry is tagged with the organizations it was built from (and the
+    owner, for cross-organization listings) and with the requesting user, so
+    a domain event drops every response derived from the changed data, and
+    ``UserChanged`` drops a deleted or modified user's responses.
+
+    The cache is per process and events are published in process: with
+    several workers, the others serve their copy until it expires, so data
+    can be up to ``ttl_seconds`` (``RESPONSE_CACHE_TTL_SECONDS``) stale there.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = RESPONSE_CACHE_TTL_SECONDS
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[CacheKey, CachedResponse]" = OrderedDict()
+        self._by_tag: Dict[Hashable, Set[CacheKey]] = {}
+        self._lock = threading.Lock()
+        # Bumped on every invalidation so in-flight misses don't store stale data
+        self.generation = 0
+
+    def get(self, key: CacheKey) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at < time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(
+        self,
+        key: CacheKey,
+        body: bytes,
+        media_type: str,
+        tags: Iterable[Hashable],
+        generation: Optional[int] = None
+    ) -> CachedResponse:
+        entry = CachedResponse(
+            body=body,
+            etag=make_etag(body),
+            media_type=media_type,
+            tags=tuple(tags),
+            expires_at=time.monotonic() + self.ttl_seconds
+        )
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return entry
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            for tag in entry.tags:
+                self._by_tag.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+        return entry
+
+    def invalidate(self, tag: Hashable) -> None:
+        with self._lock:
+            self.generation += 1
+            for key in self._by_tag.pop(tag, set()):
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_tag.clear()
+
+    def handle_event(self, event: OrganizationEvent) -> None:
+        if event.organization_id is not None:
+            self.invalidate(event.organization_id)
+        if isinstance(event, OrganizationChanged):
+            self.invalidate(owner_tag(event.owner_id))
+
+    def handle_user_event(self, event: UserChanged) -> None:
+        self.invalidate(user_tag(event.user_id))
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry.tags:
+            keys = self._by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_tag[tag]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def owner_tag(owner_id: UUID) -> Tuple[str, UUID]:
+    return ("owner", owner_id)
+
+
+def user_tag(user_id) -> Tuple[str, str]:
+    # Keys hold the token's ``sub``, events the UUID
+    return ("user", str(user_id))
+
+
+def cache_response_for(request, organization_ids: Iterable[UUID], owner_id: Optional[UUID] = None) -> None:
+    """
+    Mark the current response as cacheable and tag it with its organizations
+
+    Pass ``owner_id`` when the response spans all of a user's organizations,
+    so creating or deleting one of them invalidates it too.
+    """
+    tags: List[Hashable] = list(organization_ids)
+    if owner_id is not None:
+        tags.append(owner_tag(owner_id))
+    request.state.cache_tags = tags
+
+
+class ResponseCacheMiddleware:
+    """
+    ASGI middleware serving cached GET responses for polled endpoints
+
+    A hit costs a memoized token check and one dictionary lookup: no dependency
+    resolution and no database access. Routes opt in by calling
+    ``cache_response_for`` with the organizations the response depends on.
+    """
+
+    def __init__(
+        self,
+        app,
+        cache: Optional[ResponseCache] = None,
+        bus: EventBus = event_bus,
+        paths: Set[str] = CACHEABLE_PATHS
+    ):
+        self.app = app
+        self.cache = cache if cache is not None else response_cache
+        self.paths = paths
+        bus.subscribe(OrganizationEvent, self.cache.handle_event)
+        bus.subscribe(UserChanged, self.cache.handle_user_event)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        headers = _headers(scope)
+        user_id = bearer_user_id(headers.get(b"authorization"))
+        if user_id is None:
+            await self.app(scope, receive, send)
+            return
+
+        key = (user_id, scope["path"], scope.get("query_string", b""))
+        if_none_match = headers.get(b"if-none-match", b"").decode("latin-1")
+
+        entry = self.cache.get(key)
+        if entry is not None:
+            await _send_cached(send, entry, if_none_match)
+            return
+
+        # Miss: buffer the response so it can be stored and tagged
+        start: Dict = {}
+        chunks: List[bytes] = []
+        scope.setdefault("state", {})
+        generation = self.cache.generation
+
+        async def capture(message):
+            if message["type"] == "http.response.start":
+                start.update(message)
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, capture)
+
+        body = b"".join(chunks)
+        tags = scope["state"].get("cache_tags")
+        if start.get("status") != 200 or tags is None:
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        media_type = dict(start.get("headers", [])).get(b"content-type", b"application/json").decode("latin-1")
+        entry = self.cache.set(key, body, media_type, [*tags, user_tag(user_id)], generation)
+        await _send_cached(send, entry, if_none_match)
+
+
+def _headers(scope) -> Dict[bytes, bytes]:
+    return {name.lower(): value for name, value in scope.get("headers", [])}
+
+
+async def _send_cached(send, entry: CachedResponse, if_none_match: str) -> None:
+    headers = [
+        (b"etag", entry.etag.encode("latin-1")),
+        (b"cache-control", b"private, no-cache"),
+        (b"vary", b"Authorization"),
+    ]
+    if etag_matches(if_none_match, entry.etag):
+        await send({"type": "http.response.start", "status": 304, "headers": headers})
+        await send({"type": "http.response.body", "body": b""})
+        return
+
+    headers += [
+        (b"content-type", entry.media_type.encode("latin-1")),
+        (b"content-length", str(len(entry.body)).encode("latin-1")),
+    ]
+    await send({"type": "http.response.start", "status": 200, "headers": headers})
+    await send({"type": "http.response.body", "body": entry.body})
+
+
+response_cache = ResponseCache()
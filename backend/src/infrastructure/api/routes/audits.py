@@ -1,16 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status, UploadFile, File, Form
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID, uuid4
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
+import asyncio
+import base64
+import binascii
+import json
+import logging
 import os
-import pandas as pd
 
-from ....application.dto import AuditResponseDTO, AuditListResponse, FindingListResponse, FindingResponseDTO
+from ....application.dto import (
+    AuditResponseDTO, AuditListResponse, FindingListResponse, FindingResponseDTO, AuditProfileResponseDTO, StreamTokenResponseDTO
+)
 from ....application.use_cases import CreateAuditUseCase, GetAuditFindingsUseCase
-from ....domain.entities import User, AuditType, AuditStatus
+from ....domain.entities import User, Audit, AuditType, AuditStatus, AuditCursor
 from ....domain.entities.finding import Finding
-from ....domain.repositories import AuditRepository, OrganizationRepository, RuleRepository, FindingRepository
-from ....domain.exceptions import EntityNotFoundError
+from ....domain.repositories import AuditRepository, OrganizationRepository, RuleRepository, FindingRepository, AuditProfileRepository
+from ....domain.exceptions import EntityNotFoundError, ValidationError
+from ....domain.events import AuditPhase, AuditProgress
+from ....application.unit_of_work import UnitOfWork
+from ...database import get_db
 from ..dependencies import (
     get_create_audit_use_case,
     get_audit_findings_use_case,
@@ -18,16 +29,34 @@ from ..dependencies import (
     get_audit_repository,
     get_organization_repository,
     get_rule_repository,
-    get_finding_repository
+    get_finding_repository,
+    get_read_audit_repository,
+    get_report_cache,
+    get_progress_broker,
+    get_owned_audit,
+    get_owned_audit_for_stream,
+    get_audit_data_store,
+    get_audit_profile_repository,
+    get_unit_of_work
 )
+from ..middleware.response_cache import cache_response_for, etag_matches
+from ...reports.pdf_report import AuditReportCache
+from ...security.jwt import STREAM_TOKEN_EXPIRE_SECONDS, create_stream_token
+from ...messaging.progress import ProgressBroker
+from ...observability.app_metrics import audit_metrics
+from ...datasets.audit_data_store import AuditDataStore, parse_filter, parse_sort, read_upload, MAX_PAGE_SIZE
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/audits", tags=["Audits"])
 
 UPLOAD_DIR = os.getenv("UPLOAD_DIR", "uploads")
 MAX_FILE_SIZE = 10 * 1024 * 1024
 ALLOWED_EXTENSIONS = {".csv", ".xlsx"}
-
-os.makedirs(UPLOAD_DIR, exist_ok=True)
+PROGRESS_INTERVAL_ROWS = 500
+DEFAULT_AUDIT_PAGE_SIZE = 50
+MAX_AUDIT_PAGE_SIZE = 200
+SSE_KEEPALIVE_SECONDS = 15
 
 
 @router.post("/upload", response_model=AuditResponseDTO, status_code=status.HTTP_201_CREATED)
@@ -40,13 +69,17 @@ async def upload_audit(
     org_repository: OrganizationRepository = Depends(get_organization_repository),
     audit_repository: AuditRepository = Depends(get_audit_repository),
     rule_repository: RuleRepository = Depends(get_rule_repository),
-    finding_repository: FindingRepository = Depends(get_finding_repository)
+    finding_repository: FindingRepository = Depends(get_finding_repository),
+    progress: ProgressBroker = Depends(get_progress_broker),
+    data_store: AuditDataStore = Depends(get_audit_data_store),
+    profile_repository: AuditProfileRepository = Depends(get_audit_profile_repository),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work)
 ):
     """Upload a CSV file for audit analysis and process immediately"""
     
     # Verify organization ownership
-    org = await org_repository.get_by_id(organization_id)
-    if not org or org.owner_id != current_user.id:
+    org = await org_repository.get_by_id_for_owner(organization_id, current_user.id)
+    if not org:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Organization not found")
     
     # Validate file extension
@@ -66,6 +99,7 @@ async def upload_audit(
         )
     
     # Save file
+    os.makedirs(UPLOAD_DIR, exist_ok=True)
     file_path = os.path.join(UPLOAD_DIR, f"{organization_id}_{file.filename}")
     with open(file_path, "wb") as f:
         f.write(content)
@@ -92,12 +126,14 @@ async def upload_audit(
         # PROCESS IMMEDIATELY
         try:
             # Read CSV
-            df = pd.read_csv(file_path)
+            await _publish(progress, audit, AuditProgress(audit_id=audit.id, phase=AuditPhase.PARSING))
+            df = read_upload(file_path)
+            await _ingest_dataframe(audit, df, data_store, profile_repository, unit_of_work)
             csv_data = df.to_dict('records')
+            rows_total = len(csv_data)
             
-            # Mark as processing
+            # Mark as processing; written together with the final status below
             audit.status = AuditStatus.PROCESSING
-            await audit_repository.update(audit)
             
             # Get active rules
             rules = await rule_repository.get_active_by_audit_type(
@@ -108,8 +144,9 @@ async def upload_audit(
             # Process data
             findings = []
             total_cost = 0.0
+            await _publish(progress, audit, AuditProgress(audit_id=audit.id, phase=AuditPhase.EVALUATING, rows_total=rows_total))
             
-            for row in csv_data:
+            for index, row in enumerate(csv_data, start=1):
                 for rule in rules:
                     # Evaluate rule
                     if rule.evaluate(row):
@@ -135,21 +172,52 @@ async def upload_audit(
                                 pass
                         
                         findings.append(finding)
-                        await finding_repository.create(finding)
+                
+                if index % PROGRESS_INTERVAL_ROWS == 0:
+                    await _publish(progress, audit, AuditProgress(
+                        audit_id=audit.id,
+                        phase=AuditPhase.EVALUATING,
+                        rows_total=rows_total,
+                        rows_processed=index,
+                        findings=len(findings)
+                    ))
             
-            # Calculate optimization score (0-100)
-            severity_weights = {'low': 2, 'medium': 5, 'high': 10, 'critical': 15}
-            penalty = sum(severity_weights.get(f.severity.value, 5) for f in findings)
-            score = max(0, min(100, 100 - penalty))
+            # Findings and the final status are written in one transaction,
+            # one batched INSERT per progress step
+            async with unit_of_work:
+                for start in range(0, len(findings), PROGRESS_INTERVAL_ROWS):
+                    await _publish(progress, audit, AuditProgress(
+                        audit_id=audit.id,
+                        phase=AuditPhase.PERSISTING,
+                        rows_total=rows_total,
+                        rows_processed=rows_total,
+                        findings=start
+                    ))
+                    await finding_repository.create_many(findings[start:start + PROGRESS_INTERVAL_ROWS])
+                
+                # Calculate optimization score (0-100)
+                severity_weights = {'low': 2, 'medium': 5, 'high': 10, 'critical': 15}
+                penalty = sum(severity_weights.get(f.severity.value, 5) for f in findings)
+                score = max(0, min(100, 100 - penalty))
+                
+                # Update audit
+                audit.mark_as_completed(score, total_cost if total_cost > 0 else None)
+                audit = await audit_repository.update(audit)
             
-            # Update audit
-            audit.mark_as_completed(score, total_cost if total_cost > 0 else None)
-            audit = await audit_repository.update(audit)
+            await _publish(progress, audit, AuditProgress(
+                audit_id=audit.id,
+                phase=AuditPhase.COMPLETED,
+                rows_total=rows_total,
+                rows_processed=rows_total,
+                findings=len(findings),
+                optimization_score=score
+            ))
             
         except Exception as e:
-            # Mark as failed
+            # Mark as failed; findings from the rolled-back transaction are gone
             audit.mark_as_failed(str(e))
             await audit_repository.update(audit)
+            await _publish(progress, audit, AuditProgress(audit_id=audit.id, phase=AuditPhase.FAILED, error_message=str(e)))
         
         return AuditResponseDTO.from_orm(audit)
         
@@ -160,76 +228,100 @@ async def upload_audit(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+async def _publish(progress: ProgressBroker, audit: Audit, update: AuditProgress) -> None:
+    audit_metrics.record(update, audit.audit_type.value)
+    await progress.publish(update)
+
+
+async def _ingest_dataframe(
+    audit,
+    df,
+    data_store: AuditDataStore,
+    profile_repository: AuditProfileRepository,
+    unit_of_work: UnitOfWork
+):
+    """Build the column profile and typed data copy from the frame parsed for processing"""
+    from ...datasets.profiler import profile_dataframe
+    
+    try:
+        profile = await asyncio.to_thread(profile_dataframe, audit.id, df)
+        # A failed save is rolled back with its unit of work, so the shared
+        # session stays usable for the audit's own writes
+        async with unit_of_work:
+            await profile_repository.save(profile)
+        await data_store.ensure(audit, df)
+    except Exception:
+        # Both are rebuilt lazily on first read, never fail the audit for them
+        logger.exception("Failed to profile audit %s", audit.id)
+
+
 @router.get("", response_model=AuditListResponse)
 async def list_audits(
+    request: Request,
     organization_id: Optional[UUID] = None,
+    audit_status: Optional[AuditStatus] = Query(None, alias="status"),
+    audit_type: Optional[AuditType] = None,
+    limit: int = Query(DEFAULT_AUDIT_PAGE_SIZE, ge=1, le=MAX_AUDIT_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
     current_user: User = Depends(get_current_user),
-    audit_repository: AuditRepository = Depends(get_audit_repository),
-    org_repository: OrganizationRepository = Depends(get_organization_repository)
+    audit_repository: AuditRepository = Depends(get_read_audit_repository)
 ):
-    """List all audits for user's organizations"""
-    user_orgs = await org_repository.get_by_owner(current_user.id)
-    user_org_ids = [org.id for org in user_orgs]
+    """
+    List audits of the user's organizations, newest first
     
-    if not user_org_ids:
-        return AuditListResponse(audits=[], total=0)
+    Optionally filtered by organization, status and type. Pages are keyset
+    paginated: pass the returned ``next_cursor`` to get the following one.
+    ``total`` counts every matching audit.
+    """
+    page = await audit_repository.list_for_owner(
+        current_user.id,
+        organization_id=organization_id,
+        status=audit_status,
+        audit_type=audit_type,
+        limit=limit,
+        after=_decode_cursor(cursor) if cursor else None
+    )
     
     if organization_id:
-        if organization_id not in user_org_ids:
+        if not page.organization_ids:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Organization not found")
-        audits = await audit_repository.get_by_organization(organization_id)
+        cache_response_for(request, [organization_id])
     else:
-        all_audits = []
-        for org_id in user_org_ids:
-            org_audits = await audit_repository.get_by_organization(org_id)
-            all_audits.extend(org_audits)
-        audits = all_audits
+        cache_response_for(request, page.organization_ids, owner_id=current_user.id)
     
     return AuditListResponse(
-        audits=[AuditResponseDTO.from_orm(audit) for audit in audits],
-        total=len(audits)
+        audits=[AuditResponseDTO.from_orm(audit) for audit in page.audits],
+        total=page.total,
+        next_cursor=_encode_cursor(page.next_cursor) if page.next_cursor else None
     )
 
 
+def _encode_cursor(position: AuditCursor) -> str:
+    created_at, audit_id = position
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{audit_id}".encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> AuditCursor:
+    try:
+        created_at, _, audit_id = base64.urlsafe_b64decode(cursor.encode()).decode().partition("|")
+        return datetime.fromisoformat(created_at), UUID(audit_id)
+    except (ValueError, UnicodeDecodeError, binascii.Error):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
 @router.get("/{audit_id}", response_model=AuditResponseDTO)
-async def get_audit(
-    audit_id: UUID,
-    current_user: User = Depends(get_current_user),
-    audit_repository: AuditRepository = Depends(get_audit_repository),
-    org_repository: OrganizationRepository = Depends(get_organization_repository)
-):
+async def get_audit(audit: Audit = Depends(get_owned_audit)):
     """Get details of a specific audit"""
-    audit = await audit_repository.get_by_id(audit_id)
-    
-    if not audit:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Audit not found")
-    
-    org = await org_repository.get_by_id(audit.organization_id)
-    if not org or org.owner_id != current_user.id:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Audit not found")
-    
     return AuditResponseDTO.from_orm(audit)
 
 
 @router.get("/{audit_id}/findings", response_model=FindingListResponse)
 async def get_audit_findings(
-    audit_id: UUID,
-    current_user: User = Depends(get_current_user),
-    use_case: GetAuditFindingsUseCase = Depends(get_audit_findings_use_case),
-    audit_repository: AuditRepository = Depends(get_audit_repository),
-    org_repository: OrganizationRepository = Depends(get_organization_repository)
+    audit: Audit = Depends(get_owned_audit),
+    use_case: GetAuditFindingsUseCase = Depends(get_audit_findings_use_case)
 ):
     """Get all findings for a specific audit"""
-    audit = await audit_repository.get_by_id(audit_id)
-    
-    if not audit:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Audit not found")
-    
-    org = await org_repository.get_by_id(audit.organization_id)
-    if not org or org.owner_id != current_user.id:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Audit not found")
-    
-    findings = await use_case.execute(audit_id=audit_id)
+    findings = await use_case.execute(audit_id=audit.id)
     
     return FindingListResponse(
         findings=[FindingResponseDTO.from_orm(finding) for finding in findings],
@@ -238,22 +330,201 @@ async def get_audit_findings(
 
 @router.get("/{audit_id}/data")
 async def get_audit_data(
-    audit_id: UUID,
-    current_user: User = Depends(get_current_user),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    columns: Optional[str] = Query(None, description="Comma-separated list of columns to return"),
+    filters: List[str] = Query([], alias="filter", description="Repeatable, e.g. cost>100, region==eu-west-1, name~prod"),
+    sort: Optional[str] = Query(None, description="Comma-separated columns, prefix with - for descending"),
+    audit: Audit = Depends(get_owned_audit),
+    data_store: AuditDataStore = Depends(get_audit_data_store)
+):
+    """
+    Get a page of the uploaded audit data
+    
+    Served from a typed copy of the file built on first access, so only
+    the requested rows and columns are read and serialized.
+    """
+    if not os.path.exists(audit.file_path) and not os.path.exists(data_store.path_for(audit.id)):
+        raise HTTPException(status_code=404, detail="CSV file not found")
+    
+    try:
+        page = await data_store.query(
+            audit,
+            columns=[c.strip() for c in columns.split(",") if c.strip()] if columns else None,
+            filters=[parse_filter(expression) for expression in filters],
+            sort=parse_sort(sort),
+            offset=offset,
+            limit=limit
+        )
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    return {
+        "data": page.rows,
+        "columns": page.columns,
+        "total": page.total,
+        "offset": page.offset,
+        "limit": page.limit,
+        "next_offset": page.next_offset
+    }
+
+
+@router.get("/{audit_id}/profile", response_model=AuditProfileResponseDTO)
+async def get_audit_profile(
+    audit: Audit = Depends(get_owned_audit),
+    profile_repository: AuditProfileRepository = Depends(get_audit_profile_repository)
+):
+    """
+    Get column profiles of the uploaded audit data
+    
+    For each column: inferred type, null count, min/max/mean, approximate
+    distinct count, top values and a histogram for numeric columns.
+    """
+    profile = await profile_repository.get_by_audit(audit.id)
+    if not profile:
+        # Audits uploaded before profiling existed are profiled on first request
+        if not os.path.exists(audit.file_path):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="CSV file not found")
+        from ...datasets.profiler import profile_dataframe
+        
+        df = await asyncio.to_thread(read_upload, audit.file_path)
+        profile = await profile_repository.save(await asyncio.to_thread(profile_dataframe, audit.id, df))
+    
+    return AuditProfileResponseDTO.from_orm(profile)
+
+
+@router.get("/{audit_id}/report.pdf")
+async def get_audit_report(
+    request: Request,
+    audit: Audit = Depends(get_owned_audit),
+    # Primary, like the status check: a lagging replica could return no
+    # findings for a just-completed audit, and the PDF is cached for good
+    finding_repository: FindingRepository = Depends(get_finding_repository),
+    report_cache: AuditReportCache = Depends(get_report_cache)
+):
+    """
+    Download the PDF report of a completed audit
+    
+    The report is rendered once in a worker thread and cached on disk;
+    repeat downloads are streamed from the cached file. Clients revalidate
+    with the ETag, which changes with the report template, and get a 304
+    while their copy is current.
+    """
+    if not report_cache.is_cacheable(audit):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Reports are only available for completed audits"
+        )
+    
+    headers = {"Cache-Control": "private, no-cache", "ETag": report_cache.etag_for(audit.id)}
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    path = report_cache.path_for(audit.id)
+    if not os.path.exists(path):
+        findings = await finding_repository.get_by_audit(audit.id)
+        path = await report_cache.get_or_render(audit, findings)
+    
+    report_name = os.path.splitext(audit.file_name)[0]
+    return FileResponse(
+        path,
+        media_type="application/pdf",
+        filename=f"{report_name}_report.pdf",
+        headers=headers
+    )
+
+
+@router.post("/{audit_id}/events/token", response_model=StreamTokenResponseDTO)
+async def create_audit_events_token(
+    audit: Audit = Depends(get_owned_audit),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Issue a short-lived token for `GET /audits/{audit_id}/events`
+    
+    Pass it as the `stream_token` query parameter where the Authorization
+    header cannot be set, e.g. from a browser EventSource.
+    """
+    return StreamTokenResponseDTO(
+        stream_token=create_stream_token(current_user.id, audit.id),
+        expires_in=STREAM_TOKEN_EXPIRE_SECONDS
+    )
+
+
+@router.get("/{audit_id}/events")
+async def stream_audit_events(
+    request: Request,
+    audit: Audit = Depends(get_owned_audit_for_stream),
     audit_repository: AuditRepository = Depends(get_audit_repository),
-    org_repository: OrganizationRepository = Depends(get_organization_repository)
+    progress: ProgressBroker = Depends(get_progress_broker),
+    db: AsyncSession = Depends(get_db)
 ):
+    """
+    Stream audit progress as Server-Sent Events
     
-    audit = await audit_repository.get_by_id(audit_id)
-    if not audit:
-        raise HTTPException(status_code=404, detail="Audit not found")
+    Emits `progress` events with the processing phase (parsing, evaluating,
+    persisting, completed, failed), rows processed and findings so far.
+    The stream closes once the audit reaches a final phase.
+    """
+    # Subscribe before re-reading the status: an audit that finished after
+    # the ownership check either shows up as final here or its final
+    # message reaches the subscription
+    events = progress.subscribe(audit.id)
+    db.expire_all()
+    audit = await audit_repository.get_by_id(audit.id) or audit
     
-    org = await org_repository.get_by_id(audit.organization_id)
-    if not org or org.owner_id != current_user.id:
-        raise HTTPException(status_code=404, detail="Audit not found")
+    # Release the DB connection, the stream may stay open for a long time
+    await db.close()
     
-    if not os.path.exists(audit.file_path):
-        raise HTTPException(status_code=404, detail="CSV file not found")
+    if audit.status in (AuditStatus.COMPLETED, AuditStatus.FAILED):
+        await events.aclose()
+        final = progress.latest(audit.id)
+        if final is None or not final.phase.is_final:
+            final = AuditProgress(
+                audit_id=audit.id,
+                phase=AuditPhase.COMPLETED if audit.status == AuditStatus.COMPLETED else AuditPhase.FAILED,
+                optimization_score=audit.optimization_score,
+                error_message=audit.error_message
+            )
+        events = _single_event(final)
     
-    df = pd.read_csv(audit.file_path)
-    return {"data": df.to_dict('records'), "columns": list(df.columns)}
\ No newline at end of file
+    return StreamingResponse(
+        _sse_stream(request, events),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+async def _single_event(event: AuditProgress):
+    yield event
+
+
+async def _sse_stream(request: Request, events):
+    iterator = events.__aiter__()
+    next_event = None
+    try:
+        while True:
+            if next_event is None:
+                next_event = asyncio.ensure_future(iterator.__anext__())
+            done, _ = await asyncio.wait({next_event}, timeout=SSE_KEEPALIVE_SECONDS)
+            
+            if not done:
+                if await request.is_disconnected():
+                    break
+                yield ": keep-alive\n\n"
+                continue
+            
+            try:
+                event = next_event.result()
+            except StopAsyncIteration:
+                break
+            next_event = None
+            yield f"event: progress\ndata: {json.dumps(event.to_dict())}\n\n"
+    finally:
+        if next_event is not None and not next_event.done():
+            next_event.cancel()
+            try:
+                await next_event
+            except (asyncio.CancelledError, StopAsyncIteration):
+                pass
+        await iterator.aclose()
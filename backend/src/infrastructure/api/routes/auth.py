@@ -1,15 +1,37 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime
+from uuid import UUID
 
-from ....application.dto import UserCreateDTO, UserLoginDTO, TokenResponseDTO, UserResponseDTO
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+
+from ....application.dto import UserCreateDTO, UserLoginDTO, RefreshTokenDTO, TokenResponseDTO, UserResponseDTO
 from ....application.use_cases import RegisterUserUseCase, LoginUserUseCase
-from ....domain.entities.user import UserRole
+from ....domain.entities.user import User, UserRole
 from ....domain.exceptions import EntityAlreadyExistsError, InvalidCredentialsError
-from ...security.jwt import create_access_token
-from ..dependencies import get_register_user_use_case, get_login_user_use_case, get_current_user
+from ...security.jwt import create_access_token, create_refresh_token, decode_refresh_token
+from ...security.revocation import RevocationList
+from ..dependencies import (
+    get_register_user_use_case,
+    get_login_user_use_case,
+    get_current_user,
+    get_user_repository,
+    get_revoked_token_repository,
+    get_revocation_list
+)
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
+def _issue_tokens(user: User) -> TokenResponseDTO:
+    access_token = create_access_token({"sub": str(user.id)})
+    refresh_token, _, _ = create_refresh_token(user.id)
+    
+    return TokenResponseDTO(
+        access_token=access_token,
+        refresh_token=refresh_token,
+        user=UserResponseDTO.from_orm(user)
+    )
+
+
 @router.post("/register", response_model=TokenResponseDTO, status_code=status.HTTP_201_CREATED)
 async def register(
     data: UserCreateDTO,
@@ -23,15 +45,7 @@ async def register(
             role=UserRole(data.role)
         )
         
-        # Generate tokens
-        access_token = create_access_token({"sub": str(user.id)})
-        refresh_token = create_access_token({"sub": str(user.id)}, expires_days=7)
-        
-        return TokenResponseDTO(
-            access_token=access_token,
-            refresh_token=refresh_token,
-            user=UserResponseDTO.from_orm(user)
-        )
+        return _issue_tokens(user)
     except EntityAlreadyExistsError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -48,19 +62,54 @@ async def login(
             password=data.password
         )
         
-        # Generate tokens
-        access_token = create_access_token({"sub": str(user.id)})
-        refresh_token = create_access_token({"sub": str(user.id)}, expires_days=7)
-        
-        return TokenResponseDTO(
-            access_token=access_token,
-            refresh_token=refresh_token,
-            user=UserResponseDTO.from_orm(user)
-        )
+        return _issue_tokens(user)
     except InvalidCredentialsError as e:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
 
 
+@router.post("/refresh", response_model=TokenResponseDTO)
+async def refresh(
+    data: RefreshTokenDTO,
+    user_repo=Depends(get_user_repository),
+    revoked_token_repo=Depends(get_revoked_token_repository),
+    revocations: RevocationList = Depends(get_revocation_list)
+):
+    """Exchange a refresh token for a new token pair; the old refresh token is revoked"""
+    payload = decode_refresh_token(data.refresh_token)
+    if not payload:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
+    
+    jti = UUID(payload["jti"])
+    if await revocations.is_revoked(jti, revoked_token_repo):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token has been revoked")
+    
+    user = await user_repo.get_by_id(UUID(payload["sub"]))
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+    
+    # Rotation: losing this race means the token was already used
+    expires_at = datetime.utcfromtimestamp(payload["exp"])
+    if not await revocations.revoke(jti, expires_at, revoked_token_repo):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token has been revoked")
+    
+    return _issue_tokens(user)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    data: RefreshTokenDTO,
+    revoked_token_repo=Depends(get_revoked_token_repository),
+    revocations: RevocationList = Depends(get_revocation_list)
+):
+    """Revoke a refresh token"""
+    payload = decode_refresh_token(data.refresh_token)
+    if payload:
+        expires_at = datetime.utcfromtimestamp(payload["exp"])
+        await revocations.revoke(UUID(payload["jti"]), expires_at, revoked_token_repo)
+    
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
 @router.get("/me", response_model=UserResponseDTO)
 async def get_me(current_user = Depends(get_current_user)):
     """Get current user"""
@@ -1,31 +1,28 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from datetime import date
+import asyncio
+from typing import Optional
 from uuid import UUID
 
-from ....domain.entities import User, AuditStatus
-from ....domain.repositories import (
-    AuditRepository,
-    FindingRepository,
-    RuleRepository,
-    OrganizationRepository
-)
+from ....domain.entities import User, TrendGranularity
+from ....domain.repositories import MetricsRepository, OrganizationRepository, TrendRepository
 from ..dependencies import (
     get_current_user,
-    get_audit_repository,
-    get_finding_repository,
-    get_rule_repository,
-    get_organization_repository
+    get_metrics_repository,
+    get_organization_repository,
+    get_trend_repository
 )
+from ..middleware.response_cache import cache_response_for
 
 router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 
 
 @router.get("/metrics")
 async def get_dashboard_metrics(
+    request: Request,
     organization_id: UUID,
     current_user: User = Depends(get_current_user),
-    audit_repository: AuditRepository = Depends(get_audit_repository),
-    finding_repository: FindingRepository = Depends(get_finding_repository),
-    rule_repository: RuleRepository = Depends(get_rule_repository),
+    metrics_repository: MetricsRepository = Depends(get_metrics_repository),
     org_repository: OrganizationRepository = Depends(get_organization_repository)
 ):
     """
@@ -36,56 +33,80 @@ async def get_dashboard_metrics(
     - Number of completed audits
     - Total findings across all audits
     - Average optimization score
+    - Total cost impact of findings
     - Number of active rules
     
     Query parameter:
     - **organization_id**: UUID of the organization (required)
     """
-    # Verify organization ownership
-    org = await org_repository.get_by_id(organization_id)
-    if not org or org.owner_id != current_user.id:
+    # Ownership check and counters run concurrently on separate sessions;
+    # counters are maintained on write, so the read is a primary-key lookup
+    org, metrics = await asyncio.gather(
+        org_repository.get_by_id_for_owner(organization_id, current_user.id),
+        metrics_repository.get_dashboard_metrics(organization_id)
+    )
+    if not org:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Organization not found"
         )
     
-    # Get all audits for organization
-    audits = await audit_repository.get_by_organization(organization_id)
-    
-    # Calculate metrics
-    total_audits = len(audits)
-    
-    completed_audits = [
-        audit for audit in audits 
-        if audit.status == AuditStatus.COMPLETED
-    ]
-    completed_count = len(completed_audits)
+    cache_response_for(request, [organization_id])
+    avg_score = metrics.avg_optimization_score
     
-    # Count total findings across all audits
-    total_findings = 0
-    for audit in audits:
-        findings = await finding_repository.get_by_audit(audit.id)
-        total_findings += len(findings)
+    return {
+        "total_audits": metrics.total_audits,
+        "completed_audits": metrics.completed_audits,
+        "total_findings": metrics.total_findings,
+        "avg_optimization_score": round(avg_score, 1) if avg_score is not None else None,
+        "total_cost_impact": metrics.total_cost_impact,
+        "active_rules": metrics.active_rules
+    }
+
+
+@router.get("/trends")
+async def get_dashboard_trends(
+    organization_id: UUID,
+    granularity: TrendGranularity = TrendGranularity.DAY,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    current_user: User = Depends(get_current_user),
+    trend_repository: TrendRepository = Depends(get_trend_repository),
+    org_repository: OrganizationRepository = Depends(get_organization_repository)
+):
+    """
+    Get score and cost trends for organization dashboard
     
-    # Calculate average optimization score
-    avg_score = None
-    if completed_audits:
-        scores = [
-            audit.optimization_score 
-            for audit in completed_audits 
-            if audit.optimization_score is not None
-        ]
-        if scores:
-            avg_score = sum(scores) / len(scores)
+    Buckets are pre-rolled when each audit completes, so a year of daily
+    data reads at most a few hundred rows.
     
-    # Count active rules
-    all_rules = await rule_repository.get_by_organization(organization_id)
-    active_rules = len([rule for rule in all_rules if rule.is_active])
+    Query parameters:
+    - **organization_id**: UUID of the organization (required)
+    - **granularity**: day, week or month (default: day)
+    - **since** / **until**: optional date range (inclusive)
+    """
+    # Verify organization ownership while the buckets are read
+    org, buckets = await asyncio.gather(
+        org_repository.get_by_id_for_owner(organization_id, current_user.id),
+        trend_repository.get_trends(organization_id, granularity, since, until)
+    )
+    if not org:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Organization not found"
+        )
     
     return {
-        "total_audits": total_audits,
-        "completed_audits": completed_count,
-        "total_findings": total_findings,
-        "avg_optimization_score": round(avg_score, 1) if avg_score else None,
-        "active_rules": active_rules
+        "organization_id": organization_id,
+        "granularity": granularity.value,
+        "buckets": [
+            {
+                "bucket_start": bucket.bucket_start,
+                "audit_count": bucket.audit_count,
+                "avg_optimization_score": round(bucket.avg_optimization_score, 1) if bucket.avg_optimization_score is not None else None,
+                "total_cost_impact": bucket.total_cost_impact,
+                "severity_counts": bucket.severity_counts
+            }
+            for bucket in buckets
+        ]
     }
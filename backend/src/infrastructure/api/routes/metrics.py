@@ -0,0 +1,45 @@
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from ...database import async_engine, replica_engine
+from ...observability.app_metrics import render_metrics
+from ...observability.prometheus import CONTENT_TYPE
+from ...observability.db_metrics import db_metrics, replica_db_metrics
+from ..middleware.read_routing import read_router
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get("")
+async def get_metrics():
+    """
+    Prometheus metrics in the text exposition format
+    
+    - **http_***: latency, response size and SQL statements per route template, requests in flight
+    - **audit_***: processing phase durations, rows processed and findings created per audit type
+    - **db_***: the figures of `/metrics/db`
+    
+    With ``PROMETHEUS_MULTIPROC_DIR`` set, the figures cover every worker
+    of the server rather than only the one answering.
+    """
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE)
+
+
+@router.get("/db")
+async def get_db_metrics():
+    """
+    Connection pool and query metrics for this worker
+    
+    - **pool**: size, checked out, overflow, idle, checkout wait histogram and timeouts
+    - **queries**: statement count, errors and latency histograms per statement kind
+    
+    A growing checkout wait with idle == 0 means the pool is exhausted;
+    slow statements show up in the latency histograms instead.
+    
+    With a read replica configured, **replica** has the same figures for
+    its pool plus the last measured lag and how reads were routed.
+    """
+    data = db_metrics.snapshot(async_engine)
+    if replica_engine is not None:
+        data["replica"] = {**replica_db_metrics.snapshot(replica_engine), **read_router.snapshot()}
+    return data
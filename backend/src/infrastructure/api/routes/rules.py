@@ -1,17 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 
 from ....application.dto import RuleCreateDTO, RuleUpdateDTO, RuleResponseDTO, RuleListResponse
 from ....application.use_cases import CreateRuleUseCase
-from ....domain.entities import User
+from ....domain.entities import Organization, Rule, User
 from ....domain.repositories import RuleRepository, OrganizationRepository
 from ....domain.exceptions import EntityNotFoundError
 from ..dependencies import (
     get_create_rule_use_case,
     get_current_user,
     get_rule_repository,
-    get_organization_repository
+    get_read_rule_repository,
+    get_organization_repository,
+    get_owned_organization,
+    get_owned_rule
 )
+from ..middleware.response_cache import cache_response_for
 
 router = APIRouter(prefix="/rules", tags=["Rules"])
 
@@ -40,8 +43,8 @@ async def create_rule(
     Supported operators: >, <, >=, <=, ==, !=
     """
     # Verify organization ownership
-    org = await org_repository.get_by_id(data.organization_id)
-    if not org or org.owner_id != current_user.id:
+    org = await org_repository.get_by_id_for_owner(data.organization_id, current_user.id)
+    if not org:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Organization not found"
@@ -80,10 +83,9 @@ async def create_rule(
 
 @router.get("", response_model=RuleListResponse)
 async def list_rules(
-    organization_id: UUID,
-    current_user: User = Depends(get_current_user),
-    rule_repository: RuleRepository = Depends(get_rule_repository),
-    org_repository: OrganizationRepository = Depends(get_organization_repository)
+    request: Request,
+    org: Organization = Depends(get_owned_organization),
+    rule_repository: RuleRepository = Depends(get_read_rule_repository)
 ):
     """
     List all rules for an organization
@@ -91,16 +93,8 @@ async def list_rules(
     Query parameter:
     - **organization_id**: UUID of the organization (required)
     """
-    # Verify organization ownership
-    org = await org_repository.get_by_id(organization_id)
-    if not org or org.owner_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Organization not found"
-        )
-    
-    # Get rules
-    rules = await rule_repository.get_by_organization(organization_id)
+    rules = await rule_repository.get_by_organization(org.id)
+    cache_response_for(request, [org.id])
     
     return RuleListResponse(
         rules=[RuleResponseDTO.from_orm(rule) for rule in rules],
@@ -110,34 +104,15 @@ async def list_rules(
 
 @router.put("/{rule_id}", response_model=RuleResponseDTO)
 async def update_rule(
-    rule_id: UUID,
     data: RuleUpdateDTO,
-    current_user: User = Depends(get_current_user),
-    rule_repository: RuleRepository = Depends(get_rule_repository),
-    org_repository: OrganizationRepository = Depends(get_organization_repository)
+    rule: Rule = Depends(get_owned_rule),
+    rule_repository: RuleRepository = Depends(get_rule_repository)
 ):
     """
     Update an existing rule
     
     All fields are optional - only provided fields will be updated.
     """
-    # Get rule
-    rule = await rule_repository.get_by_id(rule_id)
-    
-    if not rule:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Rule not found"
-        )
-    
-    # Verify user owns the organization
-    org = await org_repository.get_by_id(rule.organization_id)
-    if not org or org.owner_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Rule not found"
-        )
-    
     # Update fields
     if data.name is not None:
         rule.name = data.name
@@ -160,10 +135,8 @@ async def update_rule(
 
 @router.delete("/{rule_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_rule(
-    rule_id: UUID,
-    current_user: User = Depends(get_current_user),
-    rule_repository: RuleRepository = Depends(get_rule_repository),
-    org_repository: OrganizationRepository = Depends(get_organization_repository)
+    rule: Rule = Depends(get_owned_rule),
+    rule_repository: RuleRepository = Depends(get_rule_repository)
 ):
     """
     Delete a rule
@@ -171,24 +144,7 @@ async def delete_rule(
     This will also remove the rule from any future audit processing.
     Existing findings linked to this rule will remain.
     """
-    # Get rule
-    rule = await rule_repository.get_by_id(rule_id)
-    
-    if not rule:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Rule not found"
-        )
-    
-    # Verify user owns the organization
-    org = await org_repository.get_by_id(rule.organization_id)
-    if not org or org.owner_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Rule not found"
-        )
-    
     # Delete rule
-    await rule_repository.delete(rule_id)
+    await rule_repository.delete(rule.id)
     
     return None
@@ -0,0 +1,199 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from uuid import UUID
+import asyncio
+import os
+import re
+import sqlite3
+
+from ...domain.entities import Audit
+from ...domain.exceptions import ValidationError
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+DATA_CACHE_DIR = os.getenv("DATA_CACHE_DIR", "data_cache")
+
+# Bump when the on-disk layout changes so cached copies are rebuilt
+DATA_CACHE_VERSION = 1
+
+DATA_TABLE = "audit_rows"
+MAX_PAGE_SIZE = 1000
+
+FILTER_PATTERN = re.compile(r"^\s*(?P<field>[^<>=!~]+?)\s*(?P<operator>>=|<=|==|!=|>|<|~)\s*(?P<value>.*)$")
+SQL_OPERATORS = {">": ">", "<": "<", ">=": ">=", "<=": "<=", "==": "=", "!=": "!=", "~": "LIKE"}
+
+
+@dataclass
+class DataFilter:
+    field: str
+    operator: str
+    value: Any
+
+
+@dataclass
+class DataPage:
+    columns: List[str]
+    rows: List[Dict[str, Any]]
+    total: int
+    offset: int
+    limit: int
+
+    @property
+    def next_offset(self) -> Optional[int]:
+        following = self.offset + len(self.rows)
+        return following if following < self.total else None
+
+
+def read_upload(file_path: str) -> "pd.DataFrame":
+    """Parse an uploaded audit file into a typed DataFrame"""
+    # pandas (and openpyxl, through read_excel) load on the first upload, not at boot
+    import pandas as pd
+
+    if os.path.splitext(file_path)[1].lower() == ".xlsx":
+        return pd.read_excel(file_path)
+    return pd.read_csv(file_path)
+
+
+def parse_filter(expression: str) -> DataFilter:
+    """
+    Parse a filter expression such as ``cost>100``, ``region==eu-west-1``
+    or ``name~prod`` (substring match)
+    """
+    match = FILTER_PATTERN.match(expression)
+    if not match:
+        raise ValidationError(f"Invalid filter expression: {expression}")
+
+    operator = match.group("operator")
+    raw_value = match.group("value").strip()
+    value: Any = raw_value
+    if operator == "~":
+        value = f"%{raw_value}%"
+    else:
+        try:
+            value = float(raw_value)
+        except ValueError:
+            pass
+    return DataFilter(field=match.group("field").strip(), operator=operator, value=value)
+
+
+def parse_sort(expression: Optional[str]) -> List[Tuple[str, bool]]:
+    """Parse ``-cost,region`` into [(column, descending)]"""
+    if not expression:
+        return []
+    keys = []
+    for part in expression.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        descending = part.startswith("-")
+        keys.append((part.lstrip("+-"), descending))
+    return keys
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+class AuditDataStore:
+    """
+    Typed, queryable copy of each audit's uploaded file
+
+    The upload is parsed once into a per-audit SQLite file; pages are then
+    served with projection, filters, sorting and LIMIT/OFFSET in SQL so a
+    request only materializes the rows it returns.
+    """
+
+    def __init__(self, cache_dir: str = DATA_CACHE_DIR, version: int = DATA_CACHE_VERSION):
+        self.cache_dir = cache_dir
+        self.version = version
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def path_for(self, audit_id: UUID) -> str:
+        return os.path.join(self.cache_dir, f"{audit_id}_v{self.version}.sqlite")
+
+    async def ensure(self, audit: Audit, df: Optional["pd.DataFrame"] = None) -> str:
+        """Return the cached copy for an audit, building it in a worker thread on a miss"""
+        path = self.path_for(audit.id)
+        if os.path.exists(path):
+            return path
+
+        lock = self._locks.setdefault(path, asyncio.Lock())
+        async with lock:
+            if not os.path.exists(path):
+                await asyncio.to_thread(self._build, audit.file_path, path, df)
+        self._locks.pop(path, None)
+        return path
+
+    async def query(
+        self,
+        audit: Audit,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[DataFilter]] = None,
+        sort: Optional[List[Tuple[str, bool]]] = None,
+        offset: int = 0,
+        limit: int = 100
+    ) -> DataPage:
+        path = await self.ensure(audit)
+        return await asyncio.to_thread(
+            self._query, path, columns or [], filters or [], sort or [], offset, min(limit, MAX_PAGE_SIZE)
+        )
+
+    @staticmethod
+    def _build(file_path: str, path: str, df: Optional["pd.DataFrame"]) -> None:
+        if df is None:
+            df = read_upload(file_path)
+        # Created on first build, so importing the app writes nothing
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+        conn = sqlite3.connect(tmp_path)
+        try:
+            df.to_sql(DATA_TABLE, conn, index=False)
+            conn.commit()
+        finally:
+            conn.close()
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _query(
+        path: str,
+        columns: List[str],
+        filters: List[DataFilter],
+        sort: List[Tuple[str, bool]],
+        offset: int,
+        limit: int
+    ) -> DataPage:
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            available = [row[1] for row in conn.execute(f"PRAGMA table_info({DATA_TABLE})")]
+            known = set(available)
+
+            for name in [*columns, *(f.field for f in filters), *(key for key, _ in sort)]:
+                if name not in known:
+                    raise ValidationError(f"Unknown column: {name}")
+
+            selected = columns or available
+            where, params = "", []
+            if filters:
+                where = " WHERE " + " AND ".join(f"{_quote(f.field)} {SQL_OPERATORS[f.operator]} ?" for f in filters)
+                params = [f.value for f in filters]
+
+            order = ", ".join(f"{_quote(key)} {'DESC' if descending else 'ASC'}" for key, descending in sort)
+            order_by = f" ORDER BY {order + ', ' if order else ''}rowid"
+
+            total = conn.execute(f"SELECT COUNT(*) FROM {DATA_TABLE}{where}", params).fetchone()[0]
+            cursor = conn.execute(
+                f"SELECT {', '.join(_quote(c) for c in selected)} FROM {DATA_TABLE}{where}{order_by} LIMIT ? OFFSET ?",
+                [*params, limit, offset]
+            )
+            rows = [dict(zip(selected, values)) for values in cursor]
+        finally:
+            conn.close()
+
+        return DataPage(columns=selected, rows=rows, total=total, offset=offset, limit=limit)
+
+
+audit_data_store = AuditDataStore()
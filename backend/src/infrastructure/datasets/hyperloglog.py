@@ -0,0 +1,58 @@
+import math
+
+import numpy as np
+
+
+class HyperLogLog:
+    """
+    HyperLogLog distinct-count sketch over 64-bit hashes
+
+    Registers are updated with vectorized numpy operations so a whole
+    column is added in one call; memory is 2**precision bytes regardless
+    of cardinality (16 KiB at the default precision, ~0.8% std error).
+    """
+
+    def __init__(self, precision: int = 14):
+        # At least 11, so the remaining 64 - precision hash bits are exact
+        # as a float64 and ``add_hashes`` can rank them with ``frexp``
+        if not 11 <= precision <= 18:
+            raise ValueError("precision must be between 11 and 18")
+        self.precision = precision
+        self.num_registers = 1 << precision
+        self.registers = np.zeros(self.num_registers, dtype=np.uint8)
+
+    def add_hashes(self, hashes: np.ndarray) -> None:
+        """Add an array of uint64 hashes"""
+        if len(hashes) == 0:
+            return
+        hashes = hashes.astype(np.uint64, copy=False)
+        value_bits = 64 - self.precision
+
+        index = (hashes >> np.uint64(value_bits)).astype(np.int64)
+        remainder = hashes & np.uint64((1 << value_bits) - 1)
+
+        # Position of the leftmost 1-bit in the remaining bits; frexp gives
+        # the exact bit length because value_bits <= 53 (integers below 2**53
+        # convert to float64 without rounding)
+        _, bit_length = np.frexp(remainder.astype(np.float64))
+        rank = (value_bits - bit_length + 1).astype(np.uint8)
+
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge sketches with different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def count(self) -> int:
+        m = self.num_registers
+        alpha = 0.7213 / (1 + 1.079 / m)
+
+        estimate = alpha * m * m / float(np.sum(np.power(2.0, -self.registers.astype(np.float64))))
+
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            # Small-range correction (linear counting)
+            estimate = m * math.log(m / zeros)
+
+        return int(round(estimate))
@@ -0,0 +1,82 @@
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+import numpy as np
+import pandas as pd
+from pandas.api import types as ptypes
+
+from ...domain.entities.profile import AuditProfile, ColumnProfile
+from .hyperloglog import HyperLogLog
+
+TOP_K = 10
+HISTOGRAM_BINS = 10
+# Top values of ID-like columns are meaningless and expensive to count
+TOP_K_MAX_CARDINALITY = 10_000
+
+
+def profile_dataframe(audit_id: UUID, df: pd.DataFrame) -> AuditProfile:
+    """Profile every column of an already parsed upload"""
+    return AuditProfile(
+        audit_id=audit_id,
+        row_count=len(df),
+        created_at=datetime.utcnow(),
+        columns=[profile_column(str(name), df[name]) for name in df.columns]
+    )
+
+
+def infer_type(series: pd.Series) -> str:
+    if ptypes.is_bool_dtype(series):
+        return "boolean"
+    if ptypes.is_integer_dtype(series):
+        return "integer"
+    if ptypes.is_float_dtype(series):
+        return "float"
+    if ptypes.is_datetime64_any_dtype(series):
+        return "datetime"
+    return "string"
+
+
+def profile_column(name: str, series: pd.Series) -> ColumnProfile:
+    non_null = series.dropna()
+    inferred_type = infer_type(series)
+
+    sketch = HyperLogLog()
+    sketch.add_hashes(pd.util.hash_pandas_object(non_null, index=False).to_numpy())
+    distinct = min(sketch.count(), len(non_null))
+
+    profile = ColumnProfile(
+        name=name,
+        inferred_type=inferred_type,
+        count=len(series),
+        null_count=len(series) - len(non_null),
+        distinct_estimate=distinct
+    )
+
+    if inferred_type in ("integer", "float") and len(non_null):
+        values = non_null.to_numpy(dtype=np.float64)
+        values = values[np.isfinite(values)]
+        if len(values):
+            profile.min = _to_python(values.min())
+            profile.max = _to_python(values.max())
+            profile.mean = float(values.mean())
+            counts, edges = np.histogram(values, bins=HISTOGRAM_BINS)
+            profile.histogram = {"edges": edges.tolist(), "counts": counts.tolist()}
+    elif inferred_type == "datetime" and len(non_null):
+        profile.min = _to_python(non_null.min())
+        profile.max = _to_python(non_null.max())
+
+    if 0 < distinct <= TOP_K_MAX_CARDINALITY:
+        top = non_null.value_counts().head(TOP_K)
+        profile.top_values = [{"value": _to_python(value), "count": int(count)} for value, count in top.items()]
+
+    return profile
+
+
+def _to_python(value: Any) -> Any:
+    """Convert numpy/pandas scalars into JSON-serializable Python values"""
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
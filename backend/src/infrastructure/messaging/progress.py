@@ -0,0 +1,205 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict, defaultdict
+from typing import Dict, Optional, Set
+from uuid import UUID
+import asyncio
+import json
+import logging
+import os
+import select
+import threading
+import time
+
+from ...domain.events import AuditProgress
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_BROKER = os.getenv("PROGRESS_BROKER", "memory")
+SUBSCRIBER_QUEUE_SIZE = 256
+MAX_TRACKED_AUDITS = 1024
+LISTEN_TIMEOUT_SECONDS = 10.0
+LISTEN_POLL_SECONDS = 5.0
+
+
+class ProgressBroker(ABC):
+    """
+    Pub/sub for audit progress
+
+    Subclasses decide how a published message reaches every process; the
+    base class fans delivered messages out to local subscribers and keeps
+    the latest message per audit so late subscribers start from the
+    current state.
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[UUID, Set[asyncio.Queue]] = defaultdict(set)
+        self._latest: "OrderedDict[UUID, AuditProgress]" = OrderedDict()
+
+    @abstractmethod
+    async def publish(self, progress: AuditProgress) -> None:
+        """Publish a progress message for an audit"""
+        pass
+
+    def latest(self, audit_id: UUID) -> Optional[AuditProgress]:
+        return self._latest.get(audit_id)
+
+    async def start(self) -> None:
+        """Begin receiving messages published by other processes"""
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    def subscribe(self, audit_id: UUID) -> "Subscription":
+        """Progress for an audit from now until it reaches a final phase"""
+        return Subscription(self, audit_id)
+
+    def _unsubscribe(self, audit_id: UUID, queue: asyncio.Queue) -> None:
+        queues = self._subscribers.get(audit_id)
+        if queues is not None:
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[audit_id]
+
+    def _dispatch(self, progress: AuditProgress) -> None:
+        self._latest[progress.audit_id] = progress
+        self._latest.move_to_end(progress.audit_id)
+        while len(self._latest) > MAX_TRACKED_AUDITS:
+            self._latest.popitem(last=False)
+
+        for queue in self._subscribers.get(progress.audit_id, ()):
+            if queue.full():
+                # Slow consumer: drop the oldest update, progress is cumulative
+                queue.get_nowait()
+            queue.put_nowait(progress)
+
+
+class Subscription:
+    """
+    Async iterator over one audit's progress, ending after a final phase
+
+    The queue is registered when the subscription is created, so the
+    caller can re-check the audit's stored status afterwards without a
+    window in which the final message is missed. It starts with the latest
+    known message; ``aclose`` unregisters it.
+    """
+
+    def __init__(self, broker: ProgressBroker, audit_id: UUID):
+        self.broker = broker
+        self.audit_id = audit_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self.closed = False
+        broker._subscribers[audit_id].add(self.queue)
+        latest = broker.latest(audit_id)
+        if latest is not None:
+            self.queue.put_nowait(latest)
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> AuditProgress:
+        if self.closed:
+            raise StopAsyncIteration
+        progress = await self.queue.get()
+        if progress.phase.is_final:
+            await self.aclose()
+        return progress
+
+    async def aclose(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self.broker._unsubscribe(self.audit_id, self.queue)
+
+
+class InMemoryProgressBroker(ProgressBroker):
+    """Single-process broker: publishers and subscribers share one event loop"""
+
+    async def publish(self, progress: AuditProgress) -> None:
+        self._dispatch(progress)
+        # Give streaming responses a chance to flush between processing steps
+        await asyncio.sleep(0)
+
+
+class PostgresProgressBroker(ProgressBroker):
+    """
+    Multi-process broker on Postgres LISTEN/NOTIFY
+
+    Publishing issues ``pg_notify`` on a pooled async connection; each process
+    runs one listener thread on a dedicated connection and hands
+    notifications to its event loop. The listener starts with the app
+    (``start``), not on the first subscription, so messages published
+    before anyone subscribes still update ``latest``.
+    """
+
+    CHANNEL = "audit_progress"
+
+    def __init__(self, engine):
+        super().__init__()
+        self.engine = engine
+        self._listener: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._listening = threading.Event()
+        self._stopping = threading.Event()
+
+    async def publish(self, progress: AuditProgress) -> None:
+        from sqlalchemy import text
+
+        payload = json.dumps(progress.to_dict())
+        async with self.engine.connect() as conn:
+            await conn.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": self.CHANNEL, "payload": payload})
+            await conn.commit()
+
+    async def start(self) -> None:
+        """Start the listener thread and wait until LISTEN is in effect"""
+        if self._listener is not None and self._listener.is_alive():
+            return
+        self._loop = asyncio.get_running_loop()
+        self._listening.clear()
+        self._stopping.clear()
+        self._listener = threading.Thread(target=self._listen, name="audit-progress-listener", daemon=True)
+        self._listener.start()
+        if not await asyncio.to_thread(self._listening.wait, LISTEN_TIMEOUT_SECONDS):
+            logger.warning("Audit progress listener not ready after %ss, continuing", LISTEN_TIMEOUT_SECONDS)
+
+    async def stop(self) -> None:
+        self._stopping.set()
+        if self._listener is not None:
+            await asyncio.to_thread(self._listener.join, LISTEN_POLL_SECONDS + 1.0)
+            self._listener = None
+
+    def _listen(self) -> None:
+        import psycopg2
+
+        dsn = self.engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+        while not self._stopping.is_set():
+            conn = None
+            try:
+                conn = psycopg2.connect(dsn)
+                conn.autocommit = True
+                with conn.cursor() as cursor:
+                    cursor.execute(f"LISTEN {self.CHANNEL}")
+                self._listening.set()
+                while not self._stopping.is_set():
+                    if select.select([conn], [], [], LISTEN_POLL_SECONDS) == ([], [], []):
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        notify = conn.notifies.pop(0)
+                        progress = AuditProgress.from_dict(json.loads(notify.payload))
+                        self._loop.call_soon_threadsafe(self._dispatch, progress)
+            except Exception:
+                logger.exception("Audit progress listener failed, reconnecting")
+                time.sleep(1.0)
+            finally:
+                if conn is not None:
+                    conn.close()
+
+
+def create_progress_broker() -> ProgressBroker:
+    if PROGRESS_BROKER == "postgres":
+        from ..database import async_engine
+        return PostgresProgressBroker(async_engine)
+    return InMemoryProgressBroker()
+
+
+progress_broker = create_progress_broker()
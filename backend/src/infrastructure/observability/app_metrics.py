@@ -0,0 +1,136 @@
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+import os
+import threading
+import time
+
+from ...domain.events import AuditPhase, AuditProgress
+from ..database import async_engine, replica_engine
+from .db_metrics import db_metrics, replica_db_metrics
+from .histogram import LATENCY_BUCKETS
+from .prometheus import Family, MetricsRegistry, MultiprocessCollector, family, histogram_sample, render
+
+# One JSON file per worker under this directory; unset serves this process only
+METRICS_MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+METRICS_WRITE_INTERVAL = float(os.getenv("METRICS_WRITE_INTERVAL", "5"))
+
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 500)
+# Seconds; audit phases run from milliseconds to minutes on large uploads
+PHASE_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+
+class HttpMetrics:
+    """Latency, size and statement count per route template"""
+
+    def __init__(self, registry: MetricsRegistry):
+        self.duration = registry.histogram(
+            "http_request_duration_seconds", "Request latency by route template",
+            ["method", "route", "status"], LATENCY_BUCKETS
+        )
+        self.in_flight = registry.gauge("http_requests_in_flight", "Requests being handled")
+        self.response_size = registry.histogram(
+            "http_response_size_bytes", "Response body size by route template", ["method", "route"], SIZE_BUCKETS
+        )
+        self.db_queries = registry.histogram(
+            "http_request_db_queries", "SQL statements executed per request", ["method", "route"], QUERY_COUNT_BUCKETS
+        )
+
+    def observe(self, method: str, route: str, status: int, seconds: float, size: int, queries: int) -> None:
+        self.duration.labels(method, route, str(status)).observe(seconds)
+        self.response_size.labels(method, route).observe(size)
+        self.db_queries.labels(method, route).observe(queries)
+
+
+class AuditMetrics:
+    """
+    Processing phase durations, rows and findings of uploaded audits
+
+    Fed the same progress messages the upload route publishes: a phase
+    lasts from its first message to the first message of the next one.
+    """
+
+    def __init__(self, registry: MetricsRegistry):
+        self.phase_duration = registry.histogram(
+            "audit_phase_duration_seconds", "Time spent in each audit processing phase",
+            ["audit_type", "phase"], PHASE_BUCKETS
+        )
+        self.rows_processed = registry.counter(
+            "audit_rows_processed_total", "Rows evaluated by completed audits", ["audit_type"]
+        )
+        self.findings_created = registry.counter(
+            "audit_findings_created_total", "Findings created by completed audits", ["audit_type"]
+        )
+        self.outcomes = registry.counter("audits_processed_total", "Audits processed by outcome", ["audit_type", "phase"])
+        self._current: Dict[UUID, Tuple[AuditPhase, float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, progress: AuditProgress, audit_type: str) -> None:
+        now = time.perf_counter()
+        with self._lock:
+            current = self._current.get(progress.audit_id)
+            if current is not None and current[0] == progress.phase:
+                return
+            if progress.phase.is_final:
+                self._current.pop(progress.audit_id, None)
+            else:
+                self._current[progress.audit_id] = (progress.phase, now)
+        if current is not None:
+            self.phase_duration.labels(audit_type, current[0].value).observe(now - current[1])
+        if progress.phase.is_final:
+            self.outcomes.labels(audit_type, progress.phase.value).inc()
+        if progress.phase == AuditPhase.COMPLETED:
+            self.rows_processed.labels(audit_type).inc(progress.rows_processed)
+            self.findings_created.labels(audit_type).inc(progress.findings)
+
+
+def _database_families() -> Dict[str, Family]:
+    """Expose the figures of /metrics/db, read at scrape time"""
+    databases = [("primary", db_metrics, async_engine)]
+    if replica_engine is not None:
+        databases.append(("replica", replica_db_metrics, replica_engine))
+
+    latency, errors, wait, timeouts, connections = [], [], [], [], []
+    for database, metrics, engine in databases:
+        for kind, histogram in list(metrics.query_latency.items()):
+            latency.append(((database, kind), histogram_sample(histogram)))
+        errors.append(((database,), metrics.query_errors))
+        wait.append(((database,), histogram_sample(metrics.checkout_wait)))
+        timeouts.append(((database,), metrics.checkout_timeouts))
+        pool = engine.pool
+        if hasattr(pool, "checkedout"):
+            connections.extend([
+                ((database, "checked_out"), pool.checkedout()),
+                ((database, "idle"), pool.checkedin()),
+                ((database, "overflow"), pool.overflow())
+            ])
+
+    return {
+        "db_query_duration_seconds": family(
+            "histogram", "Statement latency by statement kind", ["database", "kind"], latency, LATENCY_BUCKETS
+        ),
+        "db_query_errors_total": family("counter", "Statements that raised", ["database"], errors),
+        "db_pool_checkout_wait_seconds": family(
+            "histogram", "Time waited for a pooled connection", ["database"], wait, LATENCY_BUCKETS
+        ),
+        "db_pool_checkout_timeouts_total": family("counter", "Pool checkouts that timed out", ["database"], timeouts),
+        "db_pool_connections": family("gauge", "Pooled connections by state", ["database", "state"], connections)
+    }
+
+
+def create_multiprocess_collector() -> Optional[MultiprocessCollector]:
+    if not METRICS_MULTIPROC_DIR:
+        return None
+    return MultiprocessCollector(METRICS_MULTIPROC_DIR, registry, METRICS_WRITE_INTERVAL)
+
+
+def render_metrics() -> str:
+    families = multiprocess.collect() if multiprocess is not None else registry.collect()
+    return render(families)
+
+
+registry = MetricsRegistry()
+registry.add_collector(_database_families)
+http_metrics = HttpMetrics(registry)
+audit_metrics = AuditMetrics(registry)
+multiprocess = create_multiprocess_collector()
@@ -0,0 +1,165 @@
+from collections import Counter, defaultdict
+from contextvars import ContextVar
+from typing import Dict, Iterable, List, Optional, Tuple, Type
+import re
+import time
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from .histogram import Histogram
+
+STATEMENT_KINDS = ("SELECT", "INSERT", "UPDATE", "DELETE")
+
+
+def statement_kind(statement: str) -> str:
+    """Coarse statement label; keeps the histogram set bounded"""
+    keyword = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    return keyword if keyword in STATEMENT_KINDS else "OTHER"
+
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\$\d+(?:::\w+(?:\[\])?)?|%\(\w+\)s|%s|(?<![:\w]):\w+|\b\d+(?:\.\d+)?\b")
+_PARAMETER_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_ROW_LISTS = re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+")
+
+
+def statement_fingerprint(statement: str) -> str:
+    """
+    Shape of a statement, independent of its parameters
+
+    Literals and bind parameters become ``?`` and parameter lists
+    ``(...)``, so one query run per row of a loop maps to one fingerprint.
+    """
+    shape = _LITERALS.sub("?", statement)
+    shape = _ROW_LISTS.sub("(...)", _PARAMETER_LISTS.sub("(...)", shape))
+    return " ".join(shape.split())
+
+
+def repeated_statements(statements: Iterable[str], more_than: int = 1) -> List[Tuple[str, int]]:
+    """Fingerprints executed more than ``more_than`` times, most repeated first"""
+    counts = Counter(statement_fingerprint(statement) for statement in statements)
+    return [(shape, count) for shape, count in counts.most_common() if count > more_than]
+
+
+class DatabaseMetrics:
+    """Pool checkout wait, query counts and per-statement-kind latency"""
+
+    def __init__(self):
+        self.checkout_wait = Histogram()
+        self.checkout_timeouts = 0
+        self.query_latency: Dict[str, Histogram] = defaultdict(Histogram)
+        self.query_errors = 0
+
+    @property
+    def query_count(self) -> int:
+        return sum(histogram.count for histogram in self.query_latency.values())
+
+    def snapshot(self, engine=None) -> Dict:
+        data = {
+            "queries": {
+                "count": self.query_count,
+                "errors": self.query_errors,
+                "latency_seconds": {kind: histogram.snapshot() for kind, histogram in self.query_latency.items()}
+            },
+            "pool": {
+                "checkout_wait_seconds": self.checkout_wait.snapshot(),
+                "checkout_timeouts": self.checkout_timeouts
+            }
+        }
+        if engine is not None:
+            pool = engine.pool
+            data["pool"].update({
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+                "idle": pool.checkedin()
+            })
+        return data
+
+
+class RequestQueries:
+    """
+    Statements executed while handling one request
+
+    Only counted unless ``keep_statements`` is set; a nested instance
+    (e.g. a middleware's inside the metrics middleware's) also records into
+    its ``parent``.
+    """
+
+    __slots__ = ("count", "statements", "parent")
+
+    def __init__(self, keep_statements: bool = False, parent: Optional["RequestQueries"] = None):
+        self.count = 0
+        self.statements: Optional[List[str]] = [] if keep_statements else None
+        self.parent = parent
+
+    def record(self, statement: str) -> None:
+        self.count += 1
+        if self.statements is not None:
+            self.statements.append(statement)
+        if self.parent is not None:
+            self.parent.record(statement)
+
+
+# Set by the request metrics middleware; SQLAlchemy runs the cursor events
+# in the calling task's context, so statements land on the right request
+request_queries: ContextVar[Optional[RequestQueries]] = ContextVar("request_queries", default=None)
+
+
+db_metrics = DatabaseMetrics()
+# Queries sent to the read replica, when one is configured
+replica_db_metrics = DatabaseMetrics()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that records how long each checkout waited for a connection
+
+    Records into the class's ``metrics``; use ``instrumented_pool_class`` for
+    an engine reporting elsewhere. A class attribute rather than a
+    constructor argument, since ``Pool.recreate`` (on dispose) rebuilds the
+    pool from its class and standard arguments only.
+    """
+
+    metrics: DatabaseMetrics = db_metrics
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.checkout_timeouts += 1
+            raise
+        finally:
+            self.metrics.checkout_wait.observe(time.perf_counter() - started)
+
+
+def instrumented_pool_class(metrics: DatabaseMetrics) -> Type[InstrumentedAsyncQueuePool]:
+    """``poolclass`` for an engine whose checkout waits go to ``metrics``"""
+    if metrics is db_metrics:
+        return InstrumentedAsyncQueuePool
+    return type("InstrumentedAsyncQueuePool", (InstrumentedAsyncQueuePool,), {"metrics": metrics})
+
+
+def instrument_engine(engine, metrics: DatabaseMetrics = db_metrics) -> None:
+    """Record per-statement latency on a (sync or async) engine"""
+    target = getattr(engine, "sync_engine", engine)
+
+    @event.listens_for(target, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(target, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_started"].pop()
+        metrics.query_latency[statement_kind(statement)].observe(time.perf_counter() - started)
+        queries = request_queries.get()
+        if queries is not None:
+            queries.record(statement)
+
+    @event.listens_for(target, "handle_error")
+    def handle_error(exception_context):
+        metrics.query_errors += 1
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_started"):
+            conn.info["query_started"].pop()
@@ -0,0 +1,312 @@
+from glob import glob
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import asyncio
+import json
+import math
+import os
+import threading
+
+from .histogram import Histogram, LATENCY_BUCKETS
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# A family as collected: {"type", "help", "labelnames", "samples": [[label values, sample]]}
+# plus "buckets" for histograms. Counter and gauge samples are numbers;
+# histogram samples are {"counts", "sum", "count"} with one count per bucket
+# and a final overflow count, as kept by Histogram.
+Family = Dict[str, Any]
+
+
+class _Value:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class MetricFamily:
+    """
+    A named metric with one child per combination of label values
+
+    Children are created on first use and cached, so recording is a dict
+    lookup plus the child's own update.
+    """
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str):
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def collect(self) -> Family:
+        return family(
+            self.kind,
+            self.documentation,
+            self.labelnames,
+            [(values, self._sample(child)) for values, child in list(self._children.items())]
+        )
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _sample(self, child):
+        return child.value
+
+
+class Counter(MetricFamily):
+    kind = "counter"
+
+    def _new_child(self) -> _Value:
+        return _Value()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+
+class Gauge(MetricFamily):
+    """Gauge; in multiprocess mode the values of live workers are summed"""
+
+    kind = "gauge"
+
+    def _new_child(self) -> _Value:
+        return _Value()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.labels().dec(amount)
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+
+class HistogramFamily(MetricFamily):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> Histogram:
+        return Histogram(self.buckets)
+
+    def _sample(self, child: Histogram) -> Dict:
+        return histogram_sample(child)
+
+    def collect(self) -> Family:
+        return {**super().collect(), "buckets": list(self.buckets)}
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+
+def family(kind: str, documentation: str, labelnames: Sequence[str], samples: Iterable, buckets=None) -> Family:
+    """A collected family, for collectors exposing state kept elsewhere"""
+    collected = {
+        "type": kind,
+        "help": documentation,
+        "labelnames": list(labelnames),
+        "samples": [[list(values), sample] for values, sample in samples]
+    }
+    if buckets is not None:
+        collected["buckets"] = list(buckets)
+    return collected
+
+
+def histogram_sample(histogram: Histogram) -> Dict:
+    return {"counts": list(histogram.counts), "sum": histogram.sum, "count": histogram.count}
+
+
+class MetricsRegistry:
+    """Metric families of one process plus collectors evaluated at scrape time"""
+
+    def __init__(self):
+        self._families: Dict[str, MetricFamily] = {}
+        self._collectors: List[Callable[[], Dict[str, Family]]] = []
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> HistogramFamily:
+        return self._register(HistogramFamily(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collector: Callable[[], Dict[str, Family]]) -> None:
+        self._collectors.append(collector)
+
+    def collect(self) -> Dict[str, Family]:
+        families = {name: metric.collect() for name, metric in self._families.items()}
+        for collector in self._collectors:
+            families.update(collector())
+        return families
+
+    def _register(self, metric: MetricFamily):
+        existing = self._families.get(metric.name)
+        if existing is not None:
+            if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                raise ValueError(f"Metric {metric.name} is already registered differently")
+            return existing
+        self._families[metric.name] = metric
+        return metric
+
+
+class MultiprocessCollector:
+    """
+    Metrics of every worker of a multi-process server
+
+    Each worker writes its collected registry to ``<directory>/<pid>.json``
+    every ``interval`` seconds and on shutdown; a scrape writes the serving
+    worker's file and merges them all, so the answer covers every worker
+    whichever one serves it, at most one interval late. Counters and
+    histograms of exited workers keep counting; their gauges are dropped.
+    Empty the directory before starting the server.
+    """
+
+    def __init__(self, directory: str, registry: MetricsRegistry, interval: float = 5.0):
+        self.directory = directory
+        self.registry = registry
+        self.interval = interval
+        os.makedirs(directory, exist_ok=True)
+
+    def write(self) -> None:
+        path = os.path.join(self.directory, f"{os.getpid()}.json")
+        temporary = f"{path}.tmp"
+        with open(temporary, "w") as f:
+            json.dump(self.registry.collect(), f)
+        os.replace(temporary, path)
+
+    async def write_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            self.write()
+
+    def collect(self) -> Dict[str, Family]:
+        self.write()
+        merged: Dict[str, Family] = {}
+        samples: Dict[str, Dict[Tuple[str, ...], Any]] = {}
+        for path in glob(os.path.join(self.directory, "*.json")):
+            try:
+                pid = int(os.path.basename(path)[:-len(".json")])
+                with open(path) as f:
+                    families = json.load(f)
+            except (OSError, ValueError):
+                continue
+            alive = _is_alive(pid)
+            for name, collected in families.items():
+                if collected["type"] == "gauge" and not alive:
+                    continue
+                merged.setdefault(name, collected)
+                by_labels = samples.setdefault(name, {})
+                for values, sample in collected["samples"]:
+                    key = tuple(values)
+                    by_labels[key] = _add(by_labels.get(key), sample)
+        for name, collected in merged.items():
+            collected["samples"] = [[list(key), sample] for key, sample in samples[name].items()]
+        return merged
+
+
+def _is_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _add(total: Optional[Any], sample: Any) -> Any:
+    if total is None:
+        return sample
+    if isinstance(sample, dict):
+        return {
+            "counts": [a + b for a, b in zip(total["counts"], sample["counts"])],
+            "sum": total["sum"] + sample["sum"],
+            "count": total["count"] + sample["count"]
+        }
+    return total + sample
+
+
+# ============ TEXT EXPOSITION ============
+
+def render(families: Dict[str, Family]) -> str:
+    """Prometheus text exposition format (version 0.0.4)"""
+    lines = []
+    for name, collected in sorted(families.items()):
+        lines.append(f"# HELP {name} {_escape(collected['help'])}")
+        lines.append(f"# TYPE {name} {collected['type']}")
+        labelnames = collected["labelnames"]
+        for values, sample in collected["samples"]:
+            labels = list(zip(labelnames, values))
+            if collected["type"] != "histogram":
+                lines.append(f"{name}{_labels(labels)} {_number(sample)}")
+                continue
+            cumulative = 0
+            for bound, count in zip(collected["buckets"], sample["counts"]):
+                cumulative += count
+                lines.append(f"{name}_bucket{_labels(labels + [('le', _number(bound))])} {cumulative}")
+            lines.append(f"{name}_bucket{_labels(labels + [('le', '+Inf')])} {sample['count']}")
+            lines.append(f"{name}_sum{_labels(labels)} {_number(sample['sum'])}")
+            lines.append(f"{name}_count{_labels(labels)} {sample['count']}")
+    return "\n".join(lines) + "\n"
+
+
+def _labels(pairs) -> str:
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value), quote=True)}"' for name, value in pairs) + "}"
+
+
+def _escape(text: str, quote: bool = False) -> str:
+    text = text.replace("\\", "\\\\").replace("\n", "\\n")
+    return text.replace('"', '\\"') if quote else text
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if float(value).is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
@@ -0,0 +1,579 @@
+from collections import defaultdict
+from copy import copy
+from datetime import date, datetime
+from operator import attrgetter
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+from uuid import UUID
+import os
+
+from ...application.unit_of_work import UnitOfWork
+from ...domain.entities import User, Organization, Audit, Rule, Finding, DashboardMetrics, TrendBucket, TrendGranularity
+from ...domain.entities.audit import AuditType, AuditStatus, AuditPage, AuditCursor
+from ...domain.entities.profile import AuditProfile
+from ...domain.events import (
+    AuditChanged,
+    DomainEvent,
+    EventBus,
+    FindingsChanged,
+    OrganizationChanged,
+    RuleChanged,
+    UserChanged,
+    event_bus
+)
+from ...domain.exceptions import EntityAlreadyExistsError, EntityNotFoundError
+from ...domain.repositories import (
+    UserRepository,
+    OrganizationRepository,
+    AuditRepository,
+    RuleRepository,
+    FindingRepository,
+    MetricsRepository,
+    TrendRepository,
+    AuditProfileRepository,
+    RevokedTokenRepository
+)
+
+# "memory" serves every repository port from a process-local InMemoryStore
+# (tests and benchmarks only: nothing is persisted or shared between workers)
+REPOSITORY_BACKEND = os.getenv("REPOSITORY_BACKEND", "postgres")
+
+SEVERITIES = ("critical", "high", "medium", "low")
+
+
+class Table:
+    """
+    Rows by primary key plus secondary indexes kept in step on every write
+
+    Each index maps a key computed from the row to the primary keys having
+    it, in insertion order. Rows are copied in and out, so callers never
+    share state with the store, as with rows loaded from a database.
+    """
+
+    def __init__(self, **indexes: Callable[[Any], Hashable]):
+        self.rows: Dict[Hashable, Any] = {}
+        self._index_keys = indexes
+        self._indexes: Dict[str, Dict[Hashable, Dict[Hashable, None]]] = {name: defaultdict(dict) for name in indexes}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def get(self, pk: Hashable) -> Optional[Any]:
+        row = self.rows.get(pk)
+        return copy(row) if row is not None else None
+
+    def find(self, index: str, key: Hashable) -> List[Any]:
+        return [copy(self.rows[pk]) for pk in self._indexes[index].get(key, ())]
+
+    def count(self, index: str, key: Hashable) -> int:
+        return len(self._indexes[index].get(key, ()))
+
+    def all(self) -> List[Any]:
+        return [copy(row) for row in self.rows.values()]
+
+    def put(self, pk: Hashable, row: Any) -> Optional[Any]:
+        """Insert or replace a row; returns the row it replaced"""
+        old = self._unindex(pk)
+        self.rows[pk] = copy(row)
+        for name, key_of in self._index_keys.items():
+            self._indexes[name][key_of(row)][pk] = None
+        return old
+
+    def remove(self, pk: Hashable) -> Optional[Any]:
+        """Delete a row; returns it, or None if there was none"""
+        return self._unindex(pk)
+
+    def _unindex(self, pk: Hashable) -> Optional[Any]:
+        old = self.rows.pop(pk, None)
+        if old is None:
+            return None
+        for name, key_of in self._index_keys.items():
+            bucket = self._indexes[name][key_of(old)]
+            del bucket[pk]
+            if not bucket:
+                del self._indexes[name][key_of(old)]
+        return old
+
+
+class InMemoryStore:
+    """
+    Tables and indexes behind the in-memory repositories
+
+    Mirrors the Postgres schema closely enough for the ports' semantics:
+    unique emails, ``(organization, audit type, active)`` rule lookups and
+    audit profiles removed with their audit. Foreign keys are not
+    enforced, and dashboard metrics and trends are computed from the rows
+    on read, which matches counters and rollups after a rebuild.
+    """
+
+    def __init__(self, bus: EventBus = event_bus):
+        self.bus = bus
+        self.users = Table(email=attrgetter("email"))
+        self.organizations = Table(owner_id=attrgetter("owner_id"))
+        self.audits = Table(organization_id=attrgetter("organization_id"), status=attrgetter("status"))
+        self.rules = Table(
+            organization_id=attrgetter("organization_id"),
+            active_by_type=lambda rule: (rule.organization_id, rule.audit_type, rule.is_active)
+        )
+        self.findings = Table(audit_id=attrgetter("audit_id"))
+        self.audit_profiles = Table()
+        self.revoked_tokens = Table()
+        self.unit_of_work: Optional["InMemoryUnitOfWork"] = None
+
+    def put(self, table: Table, pk: Hashable, row: Any) -> None:
+        old = table.put(pk, row)
+        if self.unit_of_work is not None:
+            self.unit_of_work.undo.append((table, pk, old))
+
+    def remove(self, table: Table, pk: Hashable) -> Optional[Any]:
+        old = table.remove(pk)
+        if old is not None and self.unit_of_work is not None:
+            self.unit_of_work.undo.append((table, pk, old))
+        return old
+
+    def publish(self, *events: DomainEvent) -> None:
+        """Publish now, or once the active unit of work commits"""
+        if self.unit_of_work is not None:
+            self.unit_of_work.events.extend(events)
+            return
+        for event in events:
+            self.bus.publish(event)
+
+
+class InMemoryUnitOfWork(UnitOfWork):
+    """
+    Unit of work over an InMemoryStore
+
+    Writes apply immediately and are journaled; a rollback replays the
+    journal backwards. One unit of work is active per store at a time,
+    which is what single-client tests and benchmarks need.
+    """
+
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+        self.undo: List[Tuple[Table, Hashable, Optional[Any]]] = []
+        self.events: List[DomainEvent] = []
+        self._depth = 0
+
+    async def begin(self) -> None:
+        if self._depth == 0:
+            self.store.unit_of_work = self
+        self._depth += 1
+
+    async def commit(self) -> None:
+        self._depth -= 1
+        if self._depth:
+            return
+        events = self._close()
+        for event in events:
+            self.store.bus.publish(event)
+
+    async def rollback(self) -> None:
+        self._depth -= 1
+        if self._depth:
+            return
+        for table, pk, old in reversed(self.undo):
+            if old is None:
+                table.remove(pk)
+            else:
+                table.put(pk, old)
+        self._close()
+
+    async def flush(self) -> None:
+        pass
+
+    def _close(self) -> List[DomainEvent]:
+        self.store.unit_of_work = None
+        events, self.events, self.undo = self.events, [], []
+        return events
+
+
+def _require(row: Optional[Any], entity_name: str, entity_id: UUID) -> Any:
+    if row is None:
+        raise EntityNotFoundError(entity_name, str(entity_id))
+    return row
+
+
+# ============ REPOSITORIES ============
+
+class InMemoryUserRepository(UserRepository):
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+
+    async def create(self, user: User) -> User:
+        if self.store.users.count("email", user.email):
+            raise EntityAlreadyExistsError("User", "email", user.email)
+        self.store.put(self.store.users, user.id, user)
+        return copy(user)
+
+    async def get_by_id(self, user_id: UUID) -> Optional[User]:
+        return self.store.users.get(user_id)
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        users = self.store.users.find("email", email)
+        return users[0] if users else None
+
+    async def update(self, user: User) -> User:
+        stored = _require(self.store.users.get(user.id), "User", user.id)
+        if user.email != stored.email and self.store.users.count("email", user.email):
+            raise EntityAlreadyExistsError("User", "email", user.email)
+        stored.email = user.email
+        stored.password_hash = user.password_hash
+        stored.role = user.role
+        self.store.put(self.store.users, stored.id, stored)
+        self.store.publish(UserChanged(user_id=stored.id))
+        return stored
+
+    async def delete(self, user_id: UUID) -> bool:
+        if self.store.remove(self.store.users, user_id) is None:
+            return False
+        self.store.publish(UserChanged(user_id=user_id))
+        return True
+
+    async def list_all(self) -> List[User]:
+        return self.store.users.all()
+
+
+class InMemoryOrganizationRepository(OrganizationRepository):
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+
+    async def create(self, organization: Organization) -> Organization:
+        self.store.put(self.store.organizations, organization.id, organization)
+        self.store.publish(OrganizationChanged(organization_id=organization.id, owner_id=organization.owner_id))
+        return copy(organization)
+
+    async def get_by_id(self, org_id: UUID) -> Optional[Organization]:
+        return self.store.organizations.get(org_id)
+
+    async def get_by_id_for_owner(self, org_id: UUID, owner_id: UUID) -> Optional[Organization]:
+        organization = self.store.organizations.get(org_id)
+        if not organization or organization.owner_id != owner_id:
+            return None
+        return organization
+
+    async def get_by_owner(self, owner_id: UUID) -> List[Organization]:
+        return self.store.organizations.find("owner_id", owner_id)
+
+    async def update(self, organization: Organization) -> Organization:
+        stored = _require(self.store.organizations.get(organization.id), "Organization", organization.id)
+        stored.name = organization.name
+        self.store.put(self.store.organizations, stored.id, stored)
+        self.store.publish(OrganizationChanged(organization_id=stored.id, owner_id=stored.owner_id))
+        return stored
+
+    async def delete(self, org_id: UUID) -> bool:
+        removed = self.store.remove(self.store.organizations, org_id)
+        if removed is None:
+            return False
+        self.store.publish(OrganizationChanged(organization_id=org_id, owner_id=removed.owner_id))
+        return True
+
+    async def list_all(self) -> List[Organization]:
+        return self.store.organizations.all()
+
+
+class InMemoryAuditRepository(AuditRepository):
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+
+    async def create(self, audit: Audit) -> Audit:
+        self.store.put(self.store.audits, audit.id, audit)
+        self.store.publish(AuditChanged(organization_id=audit.organization_id, audit_id=audit.id))
+        return copy(audit)
+
+    async def get_by_id(self, audit_id: UUID) -> Optional[Audit]:
+        return self.store.audits.get(audit_id)
+
+    async def get_by_id_for_owner(self, audit_id: UUID, owner_id: UUID) -> Optional[Audit]:
+        audit = self.store.audits.get(audit_id)
+        if audit is None:
+            return None
+        organization = self.store.organizations.rows.get(audit.organization_id)
+        if organization is None or organization.owner_id != owner_id:
+            return None
+        return audit
+
+    async def get_by_organization(self, org_id: UUID) -> List[Audit]:
+        return self.store.audits.find("organization_id", org_id)
+
+    async def list_for_owner(
+        self,
+        owner_id: UUID,
+        organization_id: Optional[UUID] = None,
+        status: Optional[AuditStatus] = None,
+        audit_type: Optional[AuditType] = None,
+        limit: int = 50,
+        after: Optional[AuditCursor] = None
+    ) -> AuditPage:
+        org_ids = [
+            organization.id for organization in self.store.organizations.find("owner_id", owner_id)
+            if organization_id is None or organization.id == organization_id
+        ]
+        audits = [
+            audit
+            for org_id in org_ids
+            for audit in self.store.audits.find("organization_id", org_id)
+            if (status is None or audit.status == status) and (audit_type is None or audit.audit_type == audit_type)
+        ]
+        total = len(audits)
+
+        audits.sort(key=lambda audit: (audit.created_at, audit.id), reverse=True)
+        if after is not None:
+            audits = [audit for audit in audits if (audit.created_at, audit.id) < tuple(after)]
+
+        next_cursor = None
+        if len(audits) > limit:
+            audits = audits[:limit]
+            next_cursor = (audits[-1].created_at, audits[-1].id)
+        return AuditPage(audits=audits, total=total, organization_ids=org_ids, next_cursor=next_cursor)
+
+    async def get_by_status(self, status: AuditStatus) -> List[Audit]:
+        return self.store.audits.find("status", status)
+
+    async def update(self, audit: Audit) -> Audit:
+        stored = _require(self.store.audits.get(audit.id), "Audit", audit.id)
+        stored.status = audit.status
+        stored.optimization_score = audit.optimization_score
+        stored.total_cost_or_revenue = audit.total_cost_or_revenue
+        stored.error_message = audit.error_message
+        stored.completed_at = audit.completed_at
+        self.store.put(self.store.audits, stored.id, stored)
+        self.store.publish(AuditChanged(organization_id=stored.organization_id, audit_id=stored.id))
+        return stored
+
+    async def delete(self, audit_id: UUID) -> bool:
+        removed = self.store.remove(self.store.audits, audit_id)
+        if removed is None:
+            return False
+        self.store.remove(self.store.audit_profiles, audit_id)
+        self.store.publish(AuditChanged(organization_id=removed.organization_id, audit_id=audit_id))
+        return True
+
+    async def count_by_organization(self, org_id: UUID) -> int:
+        return self.store.audits.count("organization_id", org_id)
+
+
+class InMemoryRuleRepository(RuleRepository):
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+
+    async def create(self, rule: Rule) -> Rule:
+        self.store.put(self.store.rules, rule.id, rule)
+        self.store.publish(RuleChanged(organization_id=rule.organization_id, rule_id=rule.id))
+        return copy(rule)
+
+    async def get_by_id(self, rule_id: UUID) -> Optional[Rule]:
+        return self.store.rules.get(rule_id)
+
+    async def get_by_id_for_owner(self, rule_id: UUID, owner_id: UUID) -> Optional[Rule]:
+        rule = self.store.rules.get(rule_id)
+        if rule is None:
+            return None
+        organization = self.store.organizations.rows.get(rule.organization_id)
+        if organization is None or organization.owner_id != owner_id:
+            return None
+        return rule
+
+    async def get_by_organization(self, org_id: UUID) -> List[Rule]:
+        return self.store.rules.find("organization_id", org_id)
+
+    async def get_active_by_audit_type(self, org_id: UUID, audit_type: str) -> List[Rule]:
+        return self.store.rules.find("active_by_type", (org_id, audit_type, True))
+
+    async def update(self, rule: Rule) -> Rule:
+        stored = _require(self.store.rules.get(rule.id), "Rule", rule.id)
+        stored.name = rule.name
+        stored.conditions = rule.conditions
+        stored.severity = rule.severity
+        stored.is_active = rule.is_active
+        stored.updated_at = rule.updated_at
+        self.store.put(self.store.rules, stored.id, stored)
+        self.store.publish(RuleChanged(organization_id=stored.organization_id, rule_id=stored.id))
+        return stored
+
+    async def delete(self, rule_id: UUID) -> bool:
+        removed = self.store.remove(self.store.rules, rule_id)
+        if removed is None:
+            return False
+        self.store.publish(RuleChanged(organization_id=removed.organization_id, rule_id=rule_id))
+        return True
+
+
+class InMemoryFindingRepository(FindingRepository):
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+
+    def _changed(self, audit_id: UUID) -> FindingsChanged:
+        audit = self.store.audits.rows.get(audit_id)
+        return FindingsChanged(organization_id=audit.organization_id if audit else None, audit_id=audit_id)
+
+    async def create(self, finding: Finding) -> Finding:
+        self.store.put(self.store.findings, finding.id, finding)
+        self.store.publish(self._changed(finding.audit_id))
+        return copy(finding)
+
+    async def create_many(self, findings: List[Finding]) -> List[Finding]:
+        for finding in findings:
+            self.store.put(self.store.findings, finding.id, finding)
+        audit_ids = dict.fromkeys(finding.audit_id for finding in findings)
+        self.store.publish(*[self._changed(audit_id) for audit_id in audit_ids])
+        return [copy(finding) for finding in findings]
+
+    async def get_by_id(self, finding_id: UUID) -> Optional[Finding]:
+        return self.store.findings.get(finding_id)
+
+    async def get_by_audit(self, audit_id: UUID) -> List[Finding]:
+        return self.store.findings.find("audit_id", audit_id)
+
+    async def get_by_severity(self, audit_id: UUID, severity: str) -> List[Finding]:
+        return [finding for finding in self.store.findings.find("audit_id", audit_id) if finding.severity == severity]
+
+    async def delete(self, finding_id: UUID) -> bool:
+        removed = self.store.remove(self.store.findings, finding_id)
+        if removed is None:
+            return False
+        self.store.publish(self._changed(removed.audit_id))
+        return True
+
+    async def delete_by_audit(self, audit_id: UUID) -> int:
+        findings = self.store.findings.find("audit_id", audit_id)
+        for finding in findings:
+            self.store.remove(self.store.findings, finding.id)
+        if findings:
+            self.store.publish(self._changed(audit_id))
+        return len(findings)
+
+
+def _finding_totals(store: InMemoryStore, audit_ids) -> Tuple[int, float, Dict[str, int]]:
+    """Finding count, cost impact and per-severity counts over some audits"""
+    count, cost_impact = 0, 0.0
+    severity_counts = dict.fromkeys(SEVERITIES, 0)
+    for audit_id in audit_ids:
+        for finding in store.findings.find("audit_id", audit_id):
+            count += 1
+            cost_impact += finding.cost_impact or 0.0
+            severity = finding.severity.lower()
+            if severity in severity_counts:
+                severity_counts[severity] += 1
+    return count, cost_impact, severity_counts
+
+
+def _average(scores: List[Optional[int]]) -> Optional[float]:
+    scored = [score for score in scores if score is not None]
+    return sum(scored) / len(scored) if scored else None
+
+
+class InMemoryMetricsRepository(MetricsRepository):
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+
+    async def get_dashboard_metrics(self, org_id: UUID) -> DashboardMetrics:
+        audits = self.store.audits.find("organization_id", org_id)
+        completed = [audit for audit in audits if audit.status == AuditStatus.COMPLETED]
+        total_findings, total_cost_impact, _ = _finding_totals(self.store, [audit.id for audit in audits])
+        return DashboardMetrics(
+            organization_id=org_id,
+            total_audits=len(audits),
+            completed_audits=len(completed),
+            total_findings=total_findings,
+            avg_optimization_score=_average([audit.optimization_score for audit in completed]),
+            total_cost_impact=total_cost_impact,
+            active_rules=sum(rule.is_active for rule in self.store.rules.find("organization_id", org_id))
+        )
+
+    async def rebuild(self, org_id: Optional[UUID] = None) -> int:
+        # Nothing to rebuild: metrics are computed on read
+        if org_id is not None:
+            return int(org_id in self.store.organizations.rows)
+        return len(self.store.organizations)
+
+
+class InMemoryTrendRepository(TrendRepository):
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+
+    async def get_trends(
+        self,
+        org_id: UUID,
+        granularity: TrendGranularity,
+        since: Optional[date] = None,
+        until: Optional[date] = None
+    ) -> List[TrendBucket]:
+        buckets: Dict[date, List[Audit]] = defaultdict(list)
+        for audit in self.store.audits.find("organization_id", org_id):
+            if audit.status == AuditStatus.COMPLETED and audit.completed_at is not None:
+                buckets[granularity.bucket_start(audit.completed_at)].append(audit)
+
+        first = granularity.bucket_start(since) if since is not None else None
+        trends = []
+        for bucket_start in sorted(buckets):
+            if (first is not None and bucket_start < first) or (until is not None and bucket_start > until):
+                continue
+            audits = buckets[bucket_start]
+            _, total_cost_impact, severity_counts = _finding_totals(self.store, [audit.id for audit in audits])
+            trends.append(TrendBucket(
+                organization_id=org_id,
+                granularity=granularity,
+                bucket_start=bucket_start,
+                audit_count=len(audits),
+                avg_optimization_score=_average([audit.optimization_score for audit in audits]),
+                total_cost_impact=total_cost_impact,
+                severity_counts=severity_counts
+            ))
+        return trends
+
+    async def rebuild(self, org_id: Optional[UUID] = None) -> int:
+        # Nothing to rebuild: trends are computed on read; report the bucket count
+        org_ids = [org_id] if org_id is not None else list(self.store.organizations.rows)
+        written = 0
+        for organization_id in org_ids:
+            for granularity in TrendGranularity:
+                written += len(await self.get_trends(organization_id, granularity))
+        return written
+
+
+class InMemoryAuditProfileRepository(AuditProfileRepository):
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+
+    async def save(self, profile: AuditProfile) -> AuditProfile:
+        self.store.put(self.store.audit_profiles, profile.audit_id, profile)
+        return copy(profile)
+
+    async def get_by_audit(self, audit_id: UUID) -> Optional[AuditProfile]:
+        return self.store.audit_profiles.get(audit_id)
+
+
+class InMemoryRevokedTokenRepository(RevokedTokenRepository):
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+
+    async def revoke(self, jti: UUID, expires_at: datetime) -> bool:
+        if jti in self.store.revoked_tokens.rows:
+            return False
+        self.store.put(self.store.revoked_tokens, jti, (expires_at, datetime.utcnow()))
+        return True
+
+    async def is_revoked(self, jti: UUID) -> bool:
+        return jti in self.store.revoked_tokens.rows
+
+    async def get_revoked_since(self, since: Optional[datetime] = None) -> List[Tuple[UUID, datetime]]:
+        now = datetime.utcnow()
+        return [
+            (jti, revoked_at)
+            for jti, (expires_at, revoked_at) in self.store.revoked_tokens.rows.items()
+            if expires_at > now and (since is None or revoked_at > since)
+        ]
+
+    async def purge_expired(self) -> int:
+        now = datetime.utcnow()
+        expired = [jti for jti, (expires_at, _) in self.store.revoked_tokens.rows.items() if expires_at <= now]
+        for jti in expired:
+            self.store.remove(self.store.revoked_tokens, jti)
+        return len(expired)
+
+
+def create_memory_store() -> Optional[InMemoryStore]:
+    if REPOSITORY_BACKEND == "memory":
+        return InMemoryStore()
+    return None
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Float, Integer, ForeignKey, Enum as SQLEnum, Text, Boolean, JSON
+from sqlalchemy import Column, String, Date, DateTime, Float, Integer, BigInteger, ForeignKey, Enum as SQLEnum, Text, Boolean, JSON, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.declarative import declarative_base
@@ -34,6 +34,10 @@ class OrganizationModel(Base):
     owner = relationship("UserModel", back_populates="owned_organizations", foreign_keys=[owner_id])
     audits = relationship("AuditModel", back_populates="organization")
     rules = relationship("RuleModel", back_populates="organization")
+    
+    __table_args__ = (
+        Index("ix_organizations_owner_id", owner_id),
+    )
 
 
 class AuditModel(Base):
@@ -55,6 +59,11 @@ class AuditModel(Base):
     organization = relationship("OrganizationModel", back_populates="audits")
     created_by_user = relationship("UserModel", back_populates="audits")
     findings = relationship("FindingModel", back_populates="audit")
+    
+    # Per-organization listings, newest first, with the keyset cursor
+    __table_args__ = (
+        Index("ix_audits_organization_id_created_at_id", organization_id, created_at.desc(), id.desc()),
+    )
 
 
 class RuleModel(Base):
@@ -74,6 +83,11 @@ class RuleModel(Base):
     
     organization = relationship("OrganizationModel", back_populates="rules")
     findings = relationship("FindingModel", back_populates="rule")
+    
+    # Active rules per audit type; the prefix also serves per-organization listings
+    __table_args__ = (
+        Index("ix_rules_organization_id_audit_type_is_active", organization_id, audit_type, is_active),
+    )
 
 
 class FindingModel(Base):
@@ -92,3 +106,68 @@ class FindingModel(Base):
     
     audit = relationship("AuditModel", back_populates="findings")
     rule = relationship("RuleModel", back_populates="findings")
+    
+    # Findings of an audit, optionally by severity
+    __table_args__ = (
+        Index("ix_findings_audit_id_severity", audit_id, severity),
+    )
+
+
+class OrganizationMetricsModel(Base):
+    """Running dashboard counters, maintained in the same transaction as the source writes"""
+    __tablename__ = 'organization_metrics'
+    
+    organization_id = Column(UUID(as_uuid=True), ForeignKey('organizations.id', ondelete='CASCADE'), primary_key=True)
+    total_audits = Column(Integer, default=0, server_default='0', nullable=False)
+    completed_audits = Column(Integer, default=0, server_default='0', nullable=False)
+    scored_audits = Column(Integer, default=0, server_default='0', nullable=False)
+    score_sum = Column(BigInteger, default=0, server_default='0', nullable=False)
+    total_findings = Column(Integer, default=0, server_default='0', nullable=False)
+    total_cost_impact = Column(Float, default=0.0, server_default='0', nullable=False)
+    active_rules = Column(Integer, default=0, server_default='0', nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class AuditRollupModel(Base):
+    """Per-bucket audit aggregates, written when an audit completes"""
+    __tablename__ = 'audit_rollups'
+    
+    organization_id = Column(UUID(as_uuid=True), ForeignKey('organizations.id', ondelete='CASCADE'), primary_key=True)
+    granularity = Column(String, primary_key=True)
+    bucket_start = Column(Date, primary_key=True)
+    audit_count = Column(Integer, default=0, server_default='0', nullable=False)
+    scored_audits = Column(Integer, default=0, server_default='0', nullable=False)
+    score_sum = Column(BigInteger, default=0, server_default='0', nullable=False)
+    total_cost_impact = Column(Float, default=0.0, server_default='0', nullable=False)
+    critical_count = Column(Integer, default=0, server_default='0', nullable=False)
+    high_count = Column(Integer, default=0, server_default='0', nullable=False)
+    medium_count = Column(Integer, default=0, server_default='0', nullable=False)
+    low_count = Column(Integer, default=0, server_default='0', nullable=False)
+
+
+class AuditProfileModel(Base):
+    __tablename__ = 'audit_profiles'
+    
+    audit_id = Column(UUID(as_uuid=True), ForeignKey('audits.id', ondelete='CASCADE'), primary_key=True)
+    row_count = Column(Integer, nullable=False)
+    columns = Column(JSON, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class RevokedTokenModel(Base):
+    """Revoked refresh-token ids, kept only until the token would expire"""
+    __tablename__ = 'revoked_tokens'
+    
+    jti = Column(UUID(as_uuid=True), primary_key=True)
+    expires_at = Column(DateTime, nullable=False, index=True)
+    revoked_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+
+
+class RateLimitBucketModel(Base):
+    """Shared token buckets for the postgres rate-limit backend"""
+    __tablename__ = 'rate_limit_buckets'
+    
+    key = Column(String, primary_key=True)
+    tokens = Column(Float, nullable=False)
+    allowed = Column(Boolean, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
@@ -0,0 +1,146 @@
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+import asyncio
+import os
+import time
+
+# Replica reads are refused once replay falls further behind than this
+DB_REPLICA_MAX_LAG_SECONDS = float(os.getenv("DB_REPLICA_MAX_LAG_SECONDS", "2"))
+DB_REPLICA_LAG_CHECK_SECONDS = float(os.getenv("DB_REPLICA_LAG_CHECK_SECONDS", "1"))
+# How long a user's reads stay on the primary after they write
+DB_REPLICA_PIN_SECONDS = float(os.getenv("DB_REPLICA_PIN_SECONDS", "5"))
+DB_REPLICA_MAX_PINS = int(os.getenv("DB_REPLICA_MAX_PINS", "100000"))
+
+READ_METHODS = frozenset({"GET", "HEAD"})
+
+
+class ReplicaLagMonitor:
+    """
+    Replication lag of a streaming replica, checked at most once per interval
+
+    A replica that has replayed everything it received counts as zero lag,
+    even if the primary has been idle for a while. A server that is not in
+    recovery, or that cannot be reached, is reported as unusable.
+    """
+
+    LAG_SQL = """
+        SELECT CASE
+            WHEN NOT pg_is_in_recovery() THEN NULL
+            WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+            ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+        END
+    """
+
+    def __init__(
+        self,
+        engine,
+        max_lag_seconds: float = DB_REPLICA_MAX_LAG_SECONDS,
+        check_interval_seconds: float = DB_REPLICA_LAG_CHECK_SECONDS
+    ):
+        self.engine = engine
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self.lag_seconds: Optional[float] = None
+        self._checked_at = float("-inf")
+        self._lock = asyncio.Lock()
+
+    async def is_usable(self) -> bool:
+        # Requests arriving while a check runs use the previous result
+        if time.monotonic() - self._checked_at >= self.check_interval_seconds and not self._lock.locked():
+            async with self._lock:
+                self.lag_seconds = await self.measure()
+                self._checked_at = time.monotonic()
+        return self.lag_seconds is not None and self.lag_seconds <= self.max_lag_seconds
+
+    async def measure(self) -> Optional[float]:
+        from sqlalchemy import text
+
+        try:
+            async with self.engine.connect() as conn:
+                lag = (await conn.execute(text(self.LAG_SQL))).scalar()
+        except Exception:
+            return None
+        return float(lag) if lag is not None else None
+
+
+class ReadRouter:
+    """
+    Chooses between the replica and the primary for read-only queries
+
+    Reads of GET requests go to the replica unless it is lagging or the
+    user wrote something in the last ``pin_seconds`` (read-your-writes).
+    Pins are kept per process in a bounded LRU; with several workers the
+    lag bound is what covers a follow-up request landing on another one.
+    """
+
+    def __init__(
+        self,
+        session_factory=None,
+        monitor: Optional[ReplicaLagMonitor] = None,
+        pin_seconds: float = DB_REPLICA_PIN_SECONDS,
+        max_pins: int = DB_REPLICA_MAX_PINS
+    ):
+        self.session_factory = session_factory
+        self.monitor = monitor
+        self.pin_seconds = pin_seconds
+        self.max_pins = max_pins
+        self._pins: "OrderedDict[str, float]" = OrderedDict()
+        self.routed: Dict[str, int] = {"replica": 0, "primary_pinned": 0, "primary_lagging": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.session_factory is not None
+
+    def pin(self, user_id: str) -> None:
+        """Keep this user's reads on the primary for the pin window"""
+        self._pins[user_id] = time.monotonic() + self.pin_seconds
+        self._pins.move_to_end(user_id)
+        while len(self._pins) > self.max_pins:
+            self._pins.popitem(last=False)
+
+    def is_pinned(self, user_id: str) -> bool:
+        pinned_until = self._pins.get(user_id)
+        if pinned_until is None:
+            return False
+        if pinned_until < time.monotonic():
+            del self._pins[user_id]
+            return False
+        return True
+
+    async def use_replica(self, method: str, user_id: Optional[str]) -> bool:
+        if not self.enabled or method not in READ_METHODS:
+            return False
+        if user_id is not None and self.is_pinned(user_id):
+            self.routed["primary_pinned"] += 1
+            return False
+        if self.monitor is not None and not await self.monitor.is_usable():
+            self.routed["primary_lagging"] += 1
+            return False
+        self.routed["replica"] += 1
+        return True
+
+    @asynccontextmanager
+    async def session(self, method: str, user_id: Optional[str], primary) -> AsyncIterator:
+        """A replica session when safe, otherwise the given primary session"""
+        if await self.use_replica(method, user_id):
+            async with self.session_factory() as db:
+                yield db
+        else:
+            yield primary
+
+    def snapshot(self) -> Dict:
+        return {
+            "enabled": self.enabled,
+            "lag_seconds": self.monitor.lag_seconds if self.monitor is not None else None,
+            "pinned_users": len(self._pins),
+            "routed": dict(self.routed)
+        }
+
+
+def create_read_router() -> ReadRouter:
+    from ..database import ReplicaSessionLocal, replica_engine
+
+    if replica_engine is None:
+        return ReadRouter()
+    return ReadRouter(ReplicaSessionLocal, ReplicaLagMonitor(replica_engine))
@@ -1,28 +1,43 @@
 # SQLAlchemy Repository Implementations
 
-from typing import Optional, List
+from dataclasses import asdict
+from datetime import date, datetime
+from typing import Optional, List, Tuple
 from uuid import UUID
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, bindparam, column, func, select, literal, delete, true, tuple_, Date
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PGUUID, insert as pg_insert
+from sqlalchemy.orm import aliased
 
-from ....domain.entities import User, Organization, Audit, Rule, Finding
-from ....domain.entities.audit import AuditType, AuditStatus
+from ....domain.entities import User, Organization, Audit, Rule, Finding, DashboardMetrics, TrendBucket, TrendGranularity
+from ....domain.entities.profile import AuditProfile, ColumnProfile
+from ....domain.entities.audit import AuditType, AuditStatus, AuditPage, AuditCursor
 from ....domain.entities.user import UserRole
 from ....domain.entities.rule import RuleSeverity
+from ....domain.events import AuditChanged, FindingsChanged, OrganizationChanged, RuleChanged, UserChanged
 from ....domain.repositories import (
     UserRepository,
     OrganizationRepository,
     AuditRepository,
     RuleRepository,
-    FindingRepository
+    FindingRepository,
+    MetricsRepository,
+    TrendRepository,
+    AuditProfileRepository,
+    RevokedTokenRepository
 )
 from ..models import (
     UserModel,
     OrganizationModel,
     AuditModel,
     RuleModel,
-    FindingModel
+    FindingModel,
+    OrganizationMetricsModel,
+    AuditRollupModel,
+    AuditProfileModel,
+    RevokedTokenModel
 )
+from ..unit_of_work import commit_or_defer
 
 
 # ============ MAPPERS ============
@@ -175,224 +190,732 @@ class FindingMapper:
         )
 
 
+class AuditProfileMapper:
+    @staticmethod
+    def to_domain(model: AuditProfileModel) -> AuditProfile:
+        return AuditProfile(
+            audit_id=model.audit_id,
+            row_count=model.row_count,
+            created_at=model.created_at,
+            columns=[ColumnProfile(**column) for column in model.columns]
+        )
+    
+    @staticmethod
+    def to_model(entity: AuditProfile) -> AuditProfileModel:
+        return AuditProfileModel(
+            audit_id=entity.audit_id,
+            row_count=entity.row_count,
+            created_at=entity.created_at,
+            columns=[asdict(column) for column in entity.columns]
+        )
+
+
+# ============ METRICS COUNTERS ============
+
+def _audit_contribution(status: str, score: Optional[int]) -> dict:
+    """Counters an audit row contributes to its organization's metrics"""
+    completed = status == AuditStatus.COMPLETED.value
+    scored = completed and score is not None
+    return {
+        "total_audits": 1,
+        "completed_audits": int(completed),
+        "scored_audits": int(scored),
+        "score_sum": score if scored else 0
+    }
+
+
+def _diff(new: dict, old: dict) -> dict:
+    return {key: new[key] - old[key] for key in new}
+
+
+def _negate(deltas: dict) -> dict:
+    return {key: -value for key, value in deltas.items()}
+
+
+async def _increment_metrics(
+    session: AsyncSession,
+    deltas: dict,
+    org_id: Optional[UUID] = None,
+    audit_id: Optional[UUID] = None
+) -> Optional[UUID]:
+    """
+    Apply counter deltas to organization_metrics inside the caller's transaction
+    
+    The organization is given directly or resolved from ``audit_id`` in the
+    same statement (INSERT ... SELECT), so no extra round-trip is needed.
+    Returns the affected organization id, or None if nothing changed.
+    """
+    deltas = {key: value for key, value in deltas.items() if value}
+    if not deltas:
+        return org_id
+    
+    # Rows added earlier in a unit of work must exist for the FK and the lookup
+    await session.flush()
+    
+    if audit_id is not None:
+        source = select(
+            AuditModel.organization_id,
+            *[literal(value) for value in deltas.values()]
+        ).where(AuditModel.id == audit_id)
+        stmt = pg_insert(OrganizationMetricsModel).from_select(["organization_id", *deltas], source)
+    else:
+        stmt = pg_insert(OrganizationMetricsModel).values(organization_id=org_id, **deltas)
+    
+    updates = {key: getattr(OrganizationMetricsModel, key) + getattr(stmt.excluded, key) for key in deltas}
+    updates["updated_at"] = func.now()
+    stmt = stmt.on_conflict_do_update(index_elements=[OrganizationMetricsModel.organization_id], set_=updates)
+    stmt = stmt.returning(OrganizationMetricsModel.organization_id)
+    return (await session.execute(stmt)).scalar()
+
+
+SEVERITY_COUNT_COLUMNS = {
+    "critical": "critical_count",
+    "high": "high_count",
+    "medium": "medium_count",
+    "low": "low_count"
+}
+
+
+def _severity_count_columns(severity_column):
+    return [
+        func.count().filter(func.lower(severity_column) == severity).label(column)
+        for severity, column in SEVERITY_COUNT_COLUMNS.items()
+    ]
+
+
+async def _record_completion_rollups(session: AsyncSession, model: AuditModel) -> None:
+    """Add a newly completed audit to its day, week and month trend buckets"""
+    await session.flush()
+    findings = (await session.execute(
+        select(
+            func.coalesce(func.sum(FindingModel.cost_impact), 0.0).label("total_cost_impact"),
+            *_severity_count_columns(FindingModel.severity)
+        ).where(FindingModel.audit_id == model.id)
+    )).one()
+    
+    scored = model.optimization_score is not None
+    row = {
+        "audit_count": 1,
+        "scored_audits": int(scored),
+        "score_sum": model.optimization_score if scored else 0,
+        "total_cost_impact": float(findings.total_cost_impact),
+        **{column: getattr(findings, column) for column in SEVERITY_COUNT_COLUMNS.values()}
+    }
+    completed_at = model.completed_at or datetime.utcnow()
+    
+    stmt = pg_insert(AuditRollupModel).values([
+        {
+            "organization_id": model.organization_id,
+            "granularity": granularity.value,
+            "bucket_start": granularity.bucket_start(completed_at),
+            **row
+        }
+        for granularity in TrendGranularity
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[AuditRollupModel.organization_id, AuditRollupModel.granularity, AuditRollupModel.bucket_start],
+        set_={key: getattr(AuditRollupModel, key) + getattr(stmt.excluded, key) for key in row}
+    )
+    await session.execute(stmt)
+
+
+async def _get_for_write(session: AsyncSession, model_class, pk):
+    """
+    Load a row to modify, from the session's identity map when possible
+    
+    Rows inserted earlier in the same unit of work are still pending and
+    invisible to lookups, so they are flushed first.
+    """
+    if session.new:
+        await session.flush()
+    return await session.get(model_class, pk)
+
+
 # ============ REPOSITORIES ============
 
 class SQLAlchemyUserRepository(UserRepository):
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self.session = session
     
     async def create(self, user: User) -> User:
         model = UserMapper.to_model(user)
         self.session.add(model)
-        self.session.commit()
-        self.session.refresh(model)
+        await commit_or_defer(self.session)
         return UserMapper.to_domain(model)
     
     async def get_by_id(self, user_id: UUID) -> Optional[User]:
-        model = self.session.query(UserModel).filter(UserModel.id == user_id).first()
+        model = await self.session.scalar(select(UserModel).where(UserModel.id == user_id))
         return UserMapper.to_domain(model) if model else None
     
     async def get_by_email(self, email: str) -> Optional[User]:
-        model = self.session.query(UserModel).filter(UserModel.email == email).first()
+        model = await self.session.scalar(select(UserModel).where(UserModel.email == email))
         return UserMapper.to_domain(model) if model else None
     
     async def update(self, user: User) -> User:
-        model = self.session.query(UserModel).filter(UserModel.id == user.id).first()
+        model = await _get_for_write(self.session, UserModel, user.id)
         if model:
             model.email = user.email
             model.password_hash = user.password_hash
             model.role = user.role.value
-            self.session.commit()
-            self.session.refresh(model)
+            await commit_or_defer(self.session, UserChanged(user_id=model.id))
         return UserMapper.to_domain(model)
     
     async def delete(self, user_id: UUID) -> bool:
-        model = self.session.query(UserModel).filter(UserModel.id == user_id).first()
+        model = await _get_for_write(self.session, UserModel, user_id)
         if model:
-            self.session.delete(model)
-            self.session.commit()
+            await self.session.delete(model)
+            await commit_or_defer(self.session, UserChanged(user_id=user_id))
             return True
         return False
     
     async def list_all(self) -> List[User]:
-        models = self.session.query(UserModel).all()
+        models = (await self.session.scalars(select(UserModel))).all()
         return [UserMapper.to_domain(m) for m in models]
 
 
 class SQLAlchemyOrganizationRepository(OrganizationRepository):
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self.session = session
     
     async def create(self, organization: Organization) -> Organization:
         model = OrganizationMapper.to_model(organization)
         self.session.add(model)
-        self.session.commit()
-        self.session.refresh(model)
+        await commit_or_defer(self.session, OrganizationChanged(organization_id=model.id, owner_id=model.owner_id))
         return OrganizationMapper.to_domain(model)
     
     async def get_by_id(self, org_id: UUID) -> Optional[Organization]:
-        model = self.session.query(OrganizationModel).filter(OrganizationModel.id == org_id).first()
+        # Identity-map lookup: organizations already loaded by this request's
+        # session (e.g. by an ownership join) are served without a query
+        model = await self.session.get(OrganizationModel, org_id)
         return OrganizationMapper.to_domain(model) if model else None
     
+    async def get_by_id_for_owner(self, org_id: UUID, owner_id: UUID) -> Optional[Organization]:
+        model = await self.session.get(OrganizationModel, org_id)
+        if not model or model.owner_id != owner_id:
+            return None
+        return OrganizationMapper.to_domain(model)
+    
     async def get_by_owner(self, owner_id: UUID) -> List[Organization]:
-        models = self.session.query(OrganizationModel).filter(OrganizationModel.owner_id == owner_id).all()
+        models = (await self.session.scalars(select(OrganizationModel).where(OrganizationModel.owner_id == owner_id))).all()
         return [OrganizationMapper.to_domain(m) for m in models]
     
     async def update(self, organization: Organization) -> Organization:
-        model = self.session.query(OrganizationModel).filter(OrganizationModel.id == organization.id).first()
+        model = await _get_for_write(self.session, OrganizationModel, organization.id)
         if model:
             model.name = organization.name
-            self.session.commit()
-            self.session.refresh(model)
+            await commit_or_defer(self.session, OrganizationChanged(organization_id=model.id, owner_id=model.owner_id))
         return OrganizationMapper.to_domain(model)
     
     async def delete(self, org_id: UUID) -> bool:
-        model = self.session.query(OrganizationModel).filter(OrganizationModel.id == org_id).first()
+        model = await _get_for_write(self.session, OrganizationModel, org_id)
         if model:
-            self.session.delete(model)
-            self.session.commit()
+            await self.session.delete(model)
+            await commit_or_defer(self.session, OrganizationChanged(organization_id=org_id, owner_id=model.owner_id))
             return True
         return False
     
     async def list_all(self) -> List[Organization]:
-        models = self.session.query(OrganizationModel).all()
+        models = (await self.session.scalars(select(OrganizationModel))).all()
         return [OrganizationMapper.to_domain(m) for m in models]
 
 
+def _audit_page_query(org_ids: List[UUID], filters, limit: int, after: Optional[AuditCursor]):
+    """
+    Keyset page of audits across organizations, newest first
+
+    One LATERAL subquery per organization walks
+    ix_audits_organization_id_created_at_id with the (created_at, id) cursor
+    as an index condition and stops after limit + 1 matches, so deep pages
+    cost the same as the first one. status and audit_type are filtered on
+    the rows walked; only the per-organization heads are merged and sorted.
+    """
+    organizations = func.unnest(
+        bindparam("organization_ids", org_ids, type_=ARRAY(PGUUID(as_uuid=True)))
+    ).table_valued(column("id", PGUUID(as_uuid=True))).render_derived()
+    per_organization = select(AuditModel).where(AuditModel.organization_id == organizations.c.id, *filters)
+    if after is not None:
+        per_organization = per_organization.where(
+            tuple_(AuditModel.created_at, AuditModel.id)
+            < tuple_(*after, types=[AuditModel.created_at.type, AuditModel.id.type])
+        )
+    per_organization = (
+        per_organization
+        .order_by(AuditModel.created_at.desc(), AuditModel.id.desc())
+        .limit(limit + 1)
+        .lateral("organization_audits")
+    )
+    page = aliased(AuditModel, per_organization)
+    return (
+        select(page)
+        .select_from(organizations)
+        .join(per_organization, true())
+        .order_by(page.created_at.desc(), page.id.desc())
+        .limit(limit + 1)
+    )
+
+
 class SQLAlchemyAuditRepository(AuditRepository):
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self.session = session
     
     async def create(self, audit: Audit) -> Audit:
         model = AuditMapper.to_model(audit)
         self.session.add(model)
-        self.session.commit()
-        self.session.refresh(model)
+        await _increment_metrics(
+            self.session,
+            _audit_contribution(model.status, model.optimization_score),
+            org_id=model.organization_id
+        )
+        await commit_or_defer(self.session, AuditChanged(organization_id=model.organization_id, audit_id=model.id))
         return AuditMapper.to_domain(model)
     
     async def get_by_id(self, audit_id: UUID) -> Optional[Audit]:
-        model = self.session.query(AuditModel).filter(AuditModel.id == audit_id).first()
+        model = await self.session.get(AuditModel, audit_id)
         return AuditMapper.to_domain(model) if model else None
     
+    async def get_by_id_for_owner(self, audit_id: UUID, owner_id: UUID) -> Optional[Audit]:
+        # One joined query; the organization row lands in the identity map too
+        row = (await self.session.execute(
+            select(AuditModel, OrganizationModel)
+            .join(OrganizationModel, AuditModel.organization_id == OrganizationModel.id)
+            .where(AuditModel.id == audit_id, OrganizationModel.owner_id == owner_id)
+        )).first()
+        return AuditMapper.to_domain(row[0]) if row else None
+    
     async def get_by_organization(self, org_id: UUID) -> List[Audit]:
-        models = self.session.query(AuditModel).filter(AuditModel.organization_id == org_id).all()
+        models = (await self.session.scalars(select(AuditModel).where(AuditModel.organization_id == org_id))).all()
         return [AuditMapper.to_domain(m) for m in models]
     
+    async def list_for_owner(
+        self,
+        owner_id: UUID,
+        organization_id: Optional[UUID] = None,
+        status: Optional[AuditStatus] = None,
+        audit_type: Optional[AuditType] = None,
+        limit: int = 50,
+        after: Optional[AuditCursor] = None
+    ) -> AuditPage:
+        filters = []
+        if status is not None:
+            filters.append(AuditModel.status == status.value)
+        if audit_type is not None:
+            filters.append(AuditModel.audit_type == audit_type.value)
+        
+        # Organizations in scope and their matching audit counts in one query;
+        # organizations without audits still come back, for cache tagging
+        scope = (
+            select(OrganizationModel.id, func.count(AuditModel.id))
+            .outerjoin(AuditModel, and_(AuditModel.organization_id == OrganizationModel.id, *filters))
+            .where(OrganizationModel.owner_id == owner_id)
+            .group_by(OrganizationModel.id)
+        )
+        if organization_id is not None:
+            scope = scope.where(OrganizationModel.id == organization_id)
+        counts = (await self.session.execute(scope)).all()
+        org_ids = [org_id for org_id, _ in counts]
+        total = sum(count for _, count in counts)
+        if not total:
+            return AuditPage(audits=[], total=0, organization_ids=org_ids)
+        
+        query = _audit_page_query(org_ids, filters, limit, after)
+        models = (await self.session.scalars(query)).all()
+        
+        next_cursor = None
+        if len(models) > limit:
+            models = models[:limit]
+            next_cursor = (models[-1].created_at, models[-1].id)
+        return AuditPage(
+            audits=[AuditMapper.to_domain(m) for m in models],
+            total=total,
+            organization_ids=org_ids,
+            next_cursor=next_cursor
+        )
+    
     async def get_by_status(self, status: AuditStatus) -> List[Audit]:
-        models = self.session.query(AuditModel).filter(AuditModel.status == status.value).all()
+        models = (await self.session.scalars(select(AuditModel).where(AuditModel.status == status.value))).all()
         return [AuditMapper.to_domain(m) for m in models]
     
     async def update(self, audit: Audit) -> Audit:
-        model = self.session.query(AuditModel).filter(AuditModel.id == audit.id).first()
+        model = await _get_for_write(self.session, AuditModel, audit.id)
         if model:
+            before = _audit_contribution(model.status, model.optimization_score)
             model.status = audit.status.value
             model.optimization_score = audit.optimization_score
             model.total_cost_or_revenue = audit.total_cost_or_revenue
             model.error_message = audit.error_message
             model.completed_at = audit.completed_at
-            self.session.commit()
-            self.session.refresh(model)
+            deltas = _diff(_audit_contribution(model.status, model.optimization_score), before)
+            await _increment_metrics(self.session, deltas, org_id=model.organization_id)
+            if deltas["completed_audits"] > 0:
+                await _record_completion_rollups(self.session, model)
+            await commit_or_defer(self.session, AuditChanged(organization_id=model.organization_id, audit_id=model.id))
         return AuditMapper.to_domain(model)
     
     async def delete(self, audit_id: UUID) -> bool:
-        model = self.session.query(AuditModel).filter(AuditModel.id == audit_id).first()
+        model = await _get_for_write(self.session, AuditModel, audit_id)
         if model:
-            self.session.delete(model)
-            self.session.commit()
+            await _increment_metrics(
+                self.session,
+                _negate(_audit_contribution(model.status, model.optimization_score)),
+                org_id=model.organization_id
+            )
+            await self.session.delete(model)
+            await commit_or_defer(self.session, AuditChanged(organization_id=model.organization_id, audit_id=audit_id))
             return True
         return False
     
     async def count_by_organization(self, org_id: UUID) -> int:
-        return self.session.query(AuditModel).filter(AuditModel.organization_id == org_id).count()
+        return await self.session.scalar(
+            select(func.count(AuditModel.id)).where(AuditModel.organization_id == org_id)
+        )
 
 
 class SQLAlchemyRuleRepository(RuleRepository):
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self.session = session
     
     async def create(self, rule: Rule) -> Rule:
         model = RuleMapper.to_model(rule)
         self.session.add(model)
-        self.session.commit()
-        self.session.refresh(model)
+        await _increment_metrics(self.session, {"active_rules": int(model.is_active)}, org_id=model.organization_id)
+        await commit_or_defer(self.session, RuleChanged(organization_id=model.organization_id, rule_id=model.id))
         return RuleMapper.to_domain(model)
     
     async def get_by_id(self, rule_id: UUID) -> Optional[Rule]:
-        model = self.session.query(RuleModel).filter(RuleModel.id == rule_id).first()
+        model = await self.session.get(RuleModel, rule_id)
         return RuleMapper.to_domain(model) if model else None
     
+    async def get_by_id_for_owner(self, rule_id: UUID, owner_id: UUID) -> Optional[Rule]:
+        row = (await self.session.execute(
+            select(RuleModel, OrganizationModel)
+            .join(OrganizationModel, RuleModel.organization_id == OrganizationModel.id)
+            .where(RuleModel.id == rule_id, OrganizationModel.owner_id == owner_id)
+        )).first()
+        return RuleMapper.to_domain(row[0]) if row else None
+    
     async def get_by_organization(self, org_id: UUID) -> List[Rule]:
-        models = self.session.query(RuleModel).filter(RuleModel.organization_id == org_id).all()
+        models = (await self.session.scalars(select(RuleModel).where(RuleModel.organization_id == org_id))).all()
         return [RuleMapper.to_domain(m) for m in models]
     
     async def get_active_by_audit_type(self, org_id: UUID, audit_type: str) -> List[Rule]:
-        models = self.session.query(RuleModel).filter(
-            and_(
-                RuleModel.organization_id == org_id,
-                RuleModel.audit_type == audit_type,
-                RuleModel.is_active == True
+        models = (await self.session.scalars(
+            select(RuleModel).where(
+                and_(
+                    RuleModel.organization_id == org_id,
+                    RuleModel.audit_type == audit_type,
+                    RuleModel.is_active == True
+                )
             )
-        ).all()
+        )).all()
         return [RuleMapper.to_domain(m) for m in models]
     
     async def update(self, rule: Rule) -> Rule:
-        model = self.session.query(RuleModel).filter(RuleModel.id == rule.id).first()
+        model = await _get_for_write(self.session, RuleModel, rule.id)
         if model:
+            was_active = model.is_active
             model.name = rule.name
             model.conditions = rule.conditions
             model.severity = rule.severity.value
             model.is_active = rule.is_active
             model.updated_at = rule.updated_at
-            self.session.commit()
-            self.session.refresh(model)
+            await _increment_metrics(
+                self.session,
+                {"active_rules": int(model.is_active) - int(was_active)},
+                org_id=model.organization_id
+            )
+            await commit_or_defer(self.session, RuleChanged(organization_id=model.organization_id, rule_id=model.id))
         return RuleMapper.to_domain(model)
     
     async def delete(self, rule_id: UUID) -> bool:
-        model = self.session.query(RuleModel).filter(RuleModel.id == rule_id).first()
+        model = await _get_for_write(self.session, RuleModel, rule_id)
         if model:
-            self.session.delete(model)
-            self.session.commit()
+            await _increment_metrics(self.session, {"active_rules": -int(model.is_active)}, org_id=model.organization_id)
+            await self.session.delete(model)
+            await commit_or_defer(self.session, RuleChanged(organization_id=model.organization_id, rule_id=rule_id))
             return True
         return False
 
 
 class SQLAlchemyFindingRepository(FindingRepository):
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self.session = session
     
     async def create(self, finding: Finding) -> Finding:
         model = FindingMapper.to_model(finding)
         self.session.add(model)
-        self.session.commit()
-        self.session.refresh(model)
+        org_id = await _increment_metrics(
+            self.session,
+            {"total_findings": 1, "total_cost_impact": model.cost_impact or 0.0},
+            audit_id=model.audit_id
+        )
+        await commit_or_defer(self.session, FindingsChanged(organization_id=org_id, audit_id=model.audit_id))
         return FindingMapper.to_domain(model)
     
+    async def create_many(self, findings: List[Finding]) -> List[Finding]:
+        if not findings:
+            return []
+        models = [FindingMapper.to_model(finding) for finding in findings]
+        self.session.add_all(models)
+        # One batched INSERT for the findings, one counter update per audit
+        per_audit = {}
+        for model in models:
+            totals = per_audit.setdefault(model.audit_id, {"total_findings": 0, "total_cost_impact": 0.0})
+            totals["total_findings"] += 1
+            totals["total_cost_impact"] += model.cost_impact or 0.0
+        events = []
+        for audit_id, deltas in per_audit.items():
+            org_id = await _increment_metrics(self.session, deltas, audit_id=audit_id)
+            events.append(FindingsChanged(organization_id=org_id, audit_id=audit_id))
+        await commit_or_defer(self.session, *events)
+        return [FindingMapper.to_domain(model) for model in models]
+    
     async def get_by_id(self, finding_id: UUID) -> Optional[Finding]:
-        model = self.session.query(FindingModel).filter(FindingModel.id == finding_id).first()
+        model = await self.session.scalar(select(FindingModel).where(FindingModel.id == finding_id))
         return FindingMapper.to_domain(model) if model else None
     
     async def get_by_audit(self, audit_id: UUID) -> List[Finding]:
-        models = self.session.query(FindingModel).filter(FindingModel.audit_id == audit_id).all()
+        models = (await self.session.scalars(select(FindingModel).where(FindingModel.audit_id == audit_id))).all()
         return [FindingMapper.to_domain(m) for m in models]
     
     async def get_by_severity(self, audit_id: UUID, severity: str) -> List[Finding]:
-        models = self.session.query(FindingModel).filter(
-            and_(
-                FindingModel.audit_id == audit_id,
-                FindingModel.severity == severity
+        models = (await self.session.scalars(
+            select(FindingModel).where(
+                and_(
+                    FindingModel.audit_id == audit_id,
+                    FindingModel.severity == severity
+                )
             )
-        ).all()
+        )).all()
         return [FindingMapper.to_domain(m) for m in models]
     
     async def delete(self, finding_id: UUID) -> bool:
-        model = self.session.query(FindingModel).filter(FindingModel.id == finding_id).first()
+        model = await _get_for_write(self.session, FindingModel, finding_id)
         if model:
-            self.session.delete(model)
-            self.session.commit()
+            org_id = await _increment_metrics(
+                self.session,
+                {"total_findings": -1, "total_cost_impact": -(model.cost_impact or 0.0)},
+                audit_id=model.audit_id
+            )
+            await self.session.delete(model)
+            await commit_or_defer(self.session, FindingsChanged(organization_id=org_id, audit_id=model.audit_id))
             return True
         return False
     
     async def delete_by_audit(self, audit_id: UUID) -> int:
-        count = self.session.query(FindingModel).filter(FindingModel.audit_id == audit_id).delete()
-        self.session.commit()
+        removed = (await self.session.execute(
+            select(func.count(FindingModel.id), func.coalesce(func.sum(FindingModel.cost_impact), 0.0))
+            .where(FindingModel.audit_id == audit_id)
+        )).one()
+        org_id = await _increment_metrics(
+            self.session,
+            {"total_findings": -removed[0], "total_cost_impact": -float(removed[1])},
+            audit_id=audit_id
+        )
+        count = (await self.session.execute(
+            delete(FindingModel).where(FindingModel.audit_id == audit_id)
+        )).rowcount
+        events = [FindingsChanged(organization_id=org_id, audit_id=audit_id)] if count else []
+        await commit_or_defer(self.session, *events)
         return count
+
+
+class SQLAlchemyMetricsRepository(MetricsRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+    
+    async def get_dashboard_metrics(self, org_id: UUID) -> DashboardMetrics:
+        # Counters are maintained on write, so reading them is a primary-key lookup
+        model = await self.session.get(OrganizationMetricsModel, org_id)
+        if not model:
+            return DashboardMetrics(organization_id=org_id)
+        
+        return DashboardMetrics(
+            organization_id=org_id,
+            total_audits=model.total_audits,
+            completed_audits=model.completed_audits,
+            total_findings=model.total_findings,
+            avg_optimization_score=model.score_sum / model.scored_audits if model.scored_audits else None,
+            total_cost_impact=model.total_cost_impact,
+            active_rules=model.active_rules
+        )
+    
+    async def rebuild(self, org_id: Optional[UUID] = None) -> int:
+        completed = AuditModel.status == AuditStatus.COMPLETED.value
+        
+        audits = select(
+            AuditModel.organization_id.label("organization_id"),
+            func.count(AuditModel.id).label("total_audits"),
+            func.count(AuditModel.id).filter(completed).label("completed_audits"),
+            func.count(AuditModel.optimization_score).filter(completed).label("scored_audits"),
+            func.sum(AuditModel.optimization_score).filter(completed).label("score_sum")
+        ).group_by(AuditModel.organization_id).subquery()
+        
+        findings = select(
+            AuditModel.organization_id.label("organization_id"),
+            func.count(FindingModel.id).label("total_findings"),
+            func.sum(FindingModel.cost_impact).label("total_cost_impact")
+        ).join(AuditModel, FindingModel.audit_id == AuditModel.id).group_by(AuditModel.organization_id).subquery()
+        
+        rules = select(
+            RuleModel.organization_id.label("organization_id"),
+            func.count(RuleModel.id).filter(RuleModel.is_active == True).label("active_rules")
+        ).group_by(RuleModel.organization_id).subquery()
+        
+        source = select(
+            OrganizationModel.id,
+            func.coalesce(audits.c.total_audits, 0),
+            func.coalesce(audits.c.completed_audits, 0),
+            func.coalesce(audits.c.scored_audits, 0),
+            func.coalesce(audits.c.score_sum, 0),
+            func.coalesce(findings.c.total_findings, 0),
+            func.coalesce(findings.c.total_cost_impact, 0.0),
+            func.coalesce(rules.c.active_rules, 0),
+            func.now()
+        ).outerjoin(audits, audits.c.organization_id == OrganizationModel.id) \
+         .outerjoin(findings, findings.c.organization_id == OrganizationModel.id) \
+         .outerjoin(rules, rules.c.organization_id == OrganizationModel.id)
+        if org_id is not None:
+            source = source.where(OrganizationModel.id == org_id)
+        
+        columns = [
+            "organization_id", "total_audits", "completed_audits", "scored_audits", "score_sum",
+            "total_findings", "total_cost_impact", "active_rules", "updated_at"
+        ]
+        stmt = pg_insert(OrganizationMetricsModel).from_select(columns, source)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[OrganizationMetricsModel.organization_id],
+            set_={column: getattr(stmt.excluded, column) for column in columns[1:]}
+        )
+        result = await self.session.execute(stmt)
+        await commit_or_defer(self.session)
+        return result.rowcount
+
+
+class SQLAlchemyTrendRepository(TrendRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+    
+    async def get_trends(
+        self,
+        org_id: UUID,
+        granularity: TrendGranularity,
+        since: Optional[date] = None,
+        until: Optional[date] = None
+    ) -> List[TrendBucket]:
+        query = select(AuditRollupModel).where(
+            AuditRollupModel.organization_id == org_id,
+            AuditRollupModel.granularity == granularity.value
+        )
+        if since is not None:
+            query = query.where(AuditRollupModel.bucket_start >= granularity.bucket_start(since))
+        if until is not None:
+            query = query.where(AuditRollupModel.bucket_start <= until)
+        
+        models = (await self.session.scalars(query.order_by(AuditRollupModel.bucket_start))).all()
+        return [
+            TrendBucket(
+                organization_id=m.organization_id,
+                granularity=granularity,
+                bucket_start=m.bucket_start,
+                audit_count=m.audit_count,
+                avg_optimization_score=m.score_sum / m.scored_audits if m.scored_audits else None,
+                total_cost_impact=m.total_cost_impact,
+                severity_counts={
+                    severity: getattr(m, column) for severity, column in SEVERITY_COUNT_COLUMNS.items()
+                }
+            )
+            for m in models
+        ]
+    
+    async def rebuild(self, org_id: Optional[UUID] = None) -> int:
+        completed = AuditModel.status == AuditStatus.COMPLETED.value
+        
+        per_audit = select(
+            FindingModel.audit_id.label("audit_id"),
+            func.sum(FindingModel.cost_impact).label("total_cost_impact"),
+            *_severity_count_columns(FindingModel.severity)
+        ).group_by(FindingModel.audit_id).subquery()
+        
+        clear = delete(AuditRollupModel)
+        if org_id is not None:
+            clear = clear.where(AuditRollupModel.organization_id == org_id)
+        await self.session.execute(clear)
+        
+        columns = [
+            "organization_id", "granularity", "bucket_start", "audit_count", "scored_audits",
+            "score_sum", "total_cost_impact", *SEVERITY_COUNT_COLUMNS.values()
+        ]
+        written = 0
+        for granularity in TrendGranularity:
+            bucket = func.date_trunc(granularity.value, AuditModel.completed_at).cast(Date)
+            source = select(
+                AuditModel.organization_id,
+                literal(granularity.value),
+                bucket,
+                func.count(AuditModel.id),
+                func.count(AuditModel.optimization_score),
+                func.coalesce(func.sum(AuditModel.optimization_score), 0),
+                func.coalesce(func.sum(per_audit.c.total_cost_impact), 0.0),
+                *[func.coalesce(func.sum(getattr(per_audit.c, column)), 0) for column in SEVERITY_COUNT_COLUMNS.values()]
+            ).outerjoin(per_audit, per_audit.c.audit_id == AuditModel.id) \
+             .where(and_(completed, AuditModel.completed_at.isnot(None))) \
+             .group_by(AuditModel.organization_id, bucket)
+            if org_id is not None:
+                source = source.where(AuditModel.organization_id == org_id)
+            
+            result = await self.session.execute(pg_insert(AuditRollupModel).from_select(columns, source))
+            written += result.rowcount
+        
+        await commit_or_defer(self.session)
+        return written
+
+
+class SQLAlchemyAuditProfileRepository(AuditProfileRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+    
+    async def save(self, profile: AuditProfile) -> AuditProfile:
+        model = await self.session.merge(AuditProfileMapper.to_model(profile))
+        await commit_or_defer(self.session)
+        return AuditProfileMapper.to_domain(model)
+    
+    async def get_by_audit(self, audit_id: UUID) -> Optional[AuditProfile]:
+        model = await self.session.get(AuditProfileModel, audit_id)
+        return AuditProfileMapper.to_domain(model) if model else None
+
+
+class SQLAlchemyRevokedTokenRepository(RevokedTokenRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+    
+    async def revoke(self, jti: UUID, expires_at: datetime) -> bool:
+        # The insert is the atomic guard: of two concurrent rotations of the
+        # same token only one gets a row back
+        stmt = pg_insert(RevokedTokenModel).values(
+            jti=jti,
+            expires_at=expires_at,
+            revoked_at=datetime.utcnow()
+        ).on_conflict_do_nothing(
+            index_elements=[RevokedTokenModel.jti]
+        ).returning(RevokedTokenModel.jti)
+        inserted = (await self.session.execute(stmt)).scalar_one_or_none()
+        await commit_or_defer(self.session)
+        return inserted is not None
+    
+    async def is_revoked(self, jti: UUID) -> bool:
+        return (await self.session.get(RevokedTokenModel, jti)) is not None
+    
+    async def get_revoked_since(self, since: Optional[datetime] = None) -> List[Tuple[UUID, datetime]]:
+        query = select(RevokedTokenModel.jti, RevokedTokenModel.revoked_at).where(
+            RevokedTokenModel.expires_at > datetime.utcnow()
+        )
+        if since is not None:
+            query = query.where(RevokedTokenModel.revoked_at > since)
+        return [(jti, revoked_at) for jti, revoked_at in await self.session.execute(query)]
+    
+    async def purge_expired(self) -> int:
+        result = await self.session.execute(
+            delete(RevokedTokenModel).where(RevokedTokenModel.expires_at <= datetime.utcnow())
+        )
+        await commit_or_defer(self.session)
+        return result.rowcount
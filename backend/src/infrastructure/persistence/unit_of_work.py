@@ -0,0 +1,83 @@
+from typing import List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...application.unit_of_work import UnitOfWork
+from ...domain.events import DomainEvent, EventBus, event_bus
+
+UNIT_OF_WORK_KEY = "unit_of_work"
+
+
+class SQLAlchemyUnitOfWork(UnitOfWork):
+    """
+    Unit of work over the request's AsyncSession
+
+    While active it is registered in ``session.info``, which is how the
+    repositories sharing the session know to defer their commits and
+    events to it.
+    """
+
+    def __init__(self, session: AsyncSession, bus: EventBus = event_bus):
+        self.session = session
+        self.bus = bus
+        self._depth = 0
+        self._events: List[DomainEvent] = []
+
+    async def begin(self) -> None:
+        if self._depth == 0:
+            self.session.info[UNIT_OF_WORK_KEY] = self
+        self._depth += 1
+
+    async def commit(self) -> None:
+        self._depth -= 1
+        if self._depth:
+            return
+        try:
+            await self.session.commit()
+        except Exception:
+            await self._close(rolled_back=True)
+            raise
+        await self._close(rolled_back=False)
+
+    async def rollback(self) -> None:
+        # An error in a nested block reaches the outermost one, which rolls back
+        self._depth -= 1
+        if self._depth:
+            return
+        await self._close(rolled_back=True)
+
+    async def flush(self) -> None:
+        await self.session.flush()
+
+    def record(self, *events: DomainEvent) -> None:
+        """Queue events to publish once the transaction commits"""
+        self._events.extend(events)
+
+    async def _close(self, rolled_back: bool) -> None:
+        self.session.info.pop(UNIT_OF_WORK_KEY, None)
+        events, self._events = self._events, []
+        if rolled_back:
+            await self.session.rollback()
+            return
+        for event in events:
+            self.bus.publish(event)
+
+
+def active_unit_of_work(session: AsyncSession) -> Optional[SQLAlchemyUnitOfWork]:
+    return session.info.get(UNIT_OF_WORK_KEY)
+
+
+async def commit_or_defer(session: AsyncSession, *events: DomainEvent) -> None:
+    """
+    Commit a repository write and publish its events
+
+    Inside a unit of work both are left to it: the write stays pending in
+    the transaction and the events wait for the final commit.
+    """
+    unit_of_work = active_unit_of_work(session)
+    if unit_of_work is not None:
+        unit_of_work.record(*events)
+        return
+    await session.commit()
+    for event in events:
+        event_bus.publish(event)
@@ -0,0 +1,207 @@
+from collections import Counter
+from dataclasses import dataclass, field
+from io import BytesIO
+from typing import TYPE_CHECKING, Dict, List, Optional
+from uuid import UUID
+import asyncio
+import os
+
+from ...domain.entities import Audit, AuditStatus
+from ...domain.entities.finding import Finding
+
+if TYPE_CHECKING:
+    from reportlab.platypus import Table
+
+REPORTS_DIR = os.getenv("REPORTS_DIR", "reports")
+
+# Bump whenever the layout below changes so cached PDFs are re-rendered
+REPORT_TEMPLATE_VERSION = 1
+
+SEVERITY_ORDER = ["critical", "high", "medium", "low"]
+MAX_FINDINGS_IN_REPORT = 200
+
+
+def _severity_value(finding: Finding) -> str:
+    severity = finding.severity
+    return getattr(severity, "value", severity).lower()
+
+
+def build_audit_summary(audit: Audit, findings: List[Finding]) -> Dict:
+    """Summarize an audit and its findings for the report"""
+    by_severity = Counter(_severity_value(f) for f in findings)
+    total_impact = sum(f.cost_impact for f in findings if f.cost_impact is not None)
+
+    return {
+        "audit": audit,
+        "total_findings": len(findings),
+        "by_severity": {severity: by_severity.get(severity, 0) for severity in SEVERITY_ORDER},
+        "total_cost_impact": total_impact,
+        "findings": sorted(
+            findings,
+            key=lambda f: (
+                SEVERITY_ORDER.index(_severity_value(f)) if _severity_value(f) in SEVERITY_ORDER else len(SEVERITY_ORDER),
+                -(f.cost_impact or 0.0)
+            )
+        )[:MAX_FINDINGS_IN_REPORT]
+    }
+
+
+def render_audit_report(summary: Dict) -> bytes:
+    """Render an audit summary as a PDF document (CPU bound, run off the event loop)"""
+    # reportlab is only loaded by workers that actually render a report
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib.units import mm
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+
+    audit: Audit = summary["audit"]
+    styles = getSampleStyleSheet()
+    buffer = BytesIO()
+
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=A4,
+        title=f"Audit report - {audit.file_name}",
+        leftMargin=18 * mm,
+        rightMargin=18 * mm,
+        topMargin=18 * mm,
+        bottomMargin=18 * mm
+    )
+
+    story = [
+        Paragraph("AI Cloud Cost Auditor - Audit Report", styles["Title"]),
+        Spacer(1, 6 * mm),
+    ]
+
+    # Audit overview
+    overview = [
+        ["File", audit.file_name],
+        ["Audit type", audit.audit_type.value],
+        ["Status", audit.status.value],
+        ["Created at", audit.created_at.strftime("%Y-%m-%d %H:%M UTC")],
+        ["Completed at", audit.completed_at.strftime("%Y-%m-%d %H:%M UTC") if audit.completed_at else "-"],
+        ["Optimization score", str(audit.optimization_score) if audit.optimization_score is not None else "-"],
+        ["Total cost / revenue", f"{audit.total_cost_or_revenue:,.2f}" if audit.total_cost_or_revenue is not None else "-"],
+    ]
+    story.append(_table(overview, header=False))
+    story.append(Spacer(1, 6 * mm))
+
+    # Findings by severity
+    story.append(Paragraph("Findings by severity", styles["Heading2"]))
+    severity_rows = [["Severity", "Findings"]]
+    severity_rows += [[severity.capitalize(), str(count)] for severity, count in summary["by_severity"].items()]
+    severity_rows.append(["Total", str(summary["total_findings"])])
+    story.append(_table(severity_rows))
+    story.append(Spacer(1, 3 * mm))
+    story.append(Paragraph(f"Total cost impact: {summary['total_cost_impact']:,.2f}", styles["Normal"]))
+    story.append(Spacer(1, 6 * mm))
+
+    # Finding details
+    findings: List[Finding] = summary["findings"]
+    if findings:
+        story.append(Paragraph("Findings", styles["Heading2"]))
+        finding_rows = [["Severity", "Title", "Cost impact", "Recommendation"]]
+        for finding in findings:
+            finding_rows.append([
+                _severity_value(finding).capitalize(),
+                Paragraph(finding.title, styles["BodyText"]),
+                f"{finding.cost_impact:,.2f}" if finding.cost_impact is not None else "-",
+                Paragraph(finding.recommendation or "-", styles["BodyText"])
+            ])
+        story.append(_table(finding_rows, col_widths=[22 * mm, 60 * mm, 25 * mm, 67 * mm]))
+
+        if summary["total_findings"] > len(findings):
+            story.append(Spacer(1, 3 * mm))
+            story.append(Paragraph(
+                f"Showing the {len(findings)} most relevant of {summary['total_findings']} findings.",
+                styles["Italic"]
+            ))
+
+    doc.build(story)
+    return buffer.getvalue()
+
+
+def _table(rows: List[List], header: bool = True, col_widths: Optional[List[float]] = None) -> "Table":
+    from reportlab.lib import colors
+    from reportlab.platypus import Table, TableStyle
+
+    table = Table(rows, colWidths=col_widths, hAlign="LEFT", repeatRows=1 if header else 0)
+    style = [
+        ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+        ("FONTSIZE", (0, 0), (-1, -1), 9),
+    ]
+    if header:
+        style += [
+            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#1f2937")),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+        ]
+    else:
+        style.append(("BACKGROUND", (0, 0), (0, -1), colors.HexColor("#f3f4f6")))
+    table.setStyle(TableStyle(style))
+    return table
+
+
+@dataclass
+class _RenderLock:
+    """Lock of one report path and the number of callers holding or awaiting it"""
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    users: int = 0
+
+
+class AuditReportCache:
+    """
+    On-disk cache of rendered audit reports
+
+    Completed audits never change, so a report is keyed by audit id and
+    template version and rendered at most once per version.
+    """
+
+    def __init__(self, reports_dir: str = REPORTS_DIR, template_version: int = REPORT_TEMPLATE_VERSION):
+        self.reports_dir = reports_dir
+        self.template_version = template_version
+        self._locks: Dict[str, _RenderLock] = {}
+
+    def path_for(self, audit_id: UUID) -> str:
+        return os.path.join(self.reports_dir, f"{audit_id}_v{self.template_version}.pdf")
+
+    def etag_for(self, audit_id: UUID) -> str:
+        """Validator of the report; a template bump invalidates clients' copies"""
+        return f'"{audit_id}-v{self.template_version}"'
+
+    def is_cacheable(self, audit: Audit) -> bool:
+        return audit.status == AuditStatus.COMPLETED
+
+    async def get_or_render(self, audit: Audit, findings: List[Finding]) -> str:
+        """Return the path of the rendered report, rendering in a worker thread on a miss"""
+        path = self.path_for(audit.id)
+        if os.path.exists(path):
+            return path
+
+        # Only one render per audit at a time; later callers reuse the file.
+        # The lock is dropped once its last user leaves, even if rendering failed
+        render_lock = self._locks.setdefault(path, _RenderLock())
+        render_lock.users += 1
+        try:
+            async with render_lock.lock:
+                if not os.path.exists(path):
+                    # Created on first render, so importing the app writes nothing
+                    os.makedirs(self.reports_dir, exist_ok=True)
+                    summary = build_audit_summary(audit, findings)
+                    await asyncio.to_thread(self._render_to_file, summary, path)
+        finally:
+            render_lock.users -= 1
+            if not render_lock.users:
+                del self._locks[path]
+        return path
+
+    @staticmethod
+    def _render_to_file(summary: Dict, path: str) -> None:
+        content = render_audit_report(summary)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+
+report_cache = AuditReportCache()
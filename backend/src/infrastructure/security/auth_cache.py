@@ -0,0 +1,136 @@
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Any, Dict, Generic, Hashable, Optional, Tuple, TypeVar, Union
+from uuid import UUID
+import os
+import threading
+import time
+
+from ...domain.entities.user import User
+from ...domain.events import EventBus, UserChanged, event_bus
+from .jwt import REFRESH_TOKEN_TYPE, STREAM_TOKEN_TYPE, decode_access_token
+
+AUTH_CACHE_TTL_SECONDS = float(os.getenv("AUTH_CACHE_TTL_SECONDS", "30"))
+AUTH_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_CACHE_MAX_ENTRIES", "10000"))
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """Thread-safe bounded LRU whose entries expire after a per-entry deadline"""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: V, expires_at: Optional[float] = None) -> None:
+        deadline = time.monotonic() + self.ttl_seconds
+        if expires_at is not None:
+            deadline = min(deadline, expires_at)
+        with self._lock:
+            self._entries[key] = (deadline, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class AuthContextCache:
+    """
+    Short-lived cache of verified tokens and authenticated users
+
+    ``payloads`` memoizes JWT signature verification per token (never past
+    the token's own expiry); ``users`` maps user id to the ``User`` entity
+    and is invalidated by ``UserChanged`` events from the user repository.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = AUTH_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = AUTH_CACHE_TTL_SECONDS,
+        bus: EventBus = event_bus
+    ):
+        self.payloads: TTLCache[Dict[str, Any]] = TTLCache(max_entries, ttl_seconds)
+        self.users: TTLCache[User] = TTLCache(max_entries, ttl_seconds)
+        # Bumped on invalidation so a lookup racing with an update is not cached
+        self.generation = 0
+        bus.subscribe(UserChanged, self.handle_event)
+
+    def get_payload(self, token: str) -> Optional[Dict[str, Any]]:
+        return self.payloads.get(token)
+
+    def set_payload(self, token: str, payload: Dict[str, Any]) -> None:
+        exp = payload.get("exp")
+        expires_at = None
+        if exp is not None:
+            expires_at = time.monotonic() + (float(exp) - time.time())
+        self.payloads.set(token, payload, expires_at)
+
+    def payload_for(self, token: str) -> Dict[str, Any]:
+        """
+        Verified access-token payload, memoized; {} for invalid tokens
+
+        Refresh and stream tokens are rejected here so they are never
+        memoized as access tokens by any caller.
+        """
+        payload = self.payloads.get(token)
+        if payload is not None:
+            return payload
+        payload = decode_access_token(token)
+        if payload.get("type") in (REFRESH_TOKEN_TYPE, STREAM_TOKEN_TYPE) or "sub" not in payload:
+            return {}
+        self.set_payload(token, payload)
+        return payload
+    
+    def get_user(self, user_id: UUID) -> Optional[User]:
+        user = self.users.get(user_id)
+        # Hand out copies so callers cannot mutate the cached entity
+        return replace(user) if user is not None else None
+
+    def set_user(self, user: User, generation: int) -> None:
+        if generation == self.generation:
+            self.users.set(user.id, replace(user))
+
+    def invalidate_user(self, user_id: UUID) -> None:
+        self.generation += 1
+        self.users.pop(user_id)
+
+    def handle_event(self, event: UserChanged) -> None:
+        self.invalidate_user(event.user_id)
+
+
+auth_cache = AuthContextCache()
+
+
+def bearer_user_id(authorization: Union[str, bytes, None]) -> Optional[str]:
+    """User id of a verified ``Authorization: Bearer`` header value, else None"""
+    if isinstance(authorization, bytes):
+        authorization = authorization.decode("latin-1")
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    return auth_cache.payload_for(token).get("sub")
@@ -1,11 +1,16 @@
 from jose import JWTError, jwt
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
+from uuid import UUID, uuid4
 import os
 
 SECRET_KEY = os.getenv("JWT_SECRET", "your-secret-key-change-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
+REFRESH_TOKEN_EXPIRE_DAYS = 7
+REFRESH_TOKEN_TYPE = "refresh"
+STREAM_TOKEN_TYPE = "stream"
+STREAM_TOKEN_EXPIRE_SECONDS = 60
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None, expires_days: Optional[int] = None) -> str:
@@ -31,3 +36,39 @@ def decode_access_token(token: str) -> dict:
         return payload
     except JWTError:
         return {}
+
+
+def create_refresh_token(user_id: UUID) -> Tuple[str, UUID, datetime]:
+    """Create a single-use refresh token; returns the token, its jti and expiry"""
+    jti = uuid4()
+    expire = datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+    to_encode = {"sub": str(user_id), "jti": str(jti), "type": REFRESH_TOKEN_TYPE, "exp": expire}
+    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM), jti, expire
+
+
+def decode_refresh_token(token: str) -> dict:
+    """Decode a refresh token; returns {} for anything else, including access tokens"""
+    payload = decode_access_token(token)
+    if payload.get("type") != REFRESH_TOKEN_TYPE or "jti" not in payload or "sub" not in payload:
+        return {}
+    return payload
+
+
+def create_stream_token(user_id: UUID, audit_id: UUID) -> str:
+    """
+    Create a short-lived token for one audit's event stream
+
+    EventSource cannot send headers, so the stream takes its credentials in
+    the URL; this token, unlike an access token, is harmless once logged.
+    """
+    expire = datetime.utcnow() + timedelta(seconds=STREAM_TOKEN_EXPIRE_SECONDS)
+    to_encode = {"sub": str(user_id), "audit": str(audit_id), "type": STREAM_TOKEN_TYPE, "exp": expire}
+    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+
+
+def decode_stream_token(token: str, audit_id: UUID) -> dict:
+    """Decode a stream token issued for ``audit_id``; returns {} for anything else"""
+    payload = decode_access_token(token)
+    if payload.get("type") != STREAM_TOKEN_TYPE or payload.get("audit") != str(audit_id) or "sub" not in payload:
+        return {}
+    return payload
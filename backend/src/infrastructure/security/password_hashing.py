@@ -0,0 +1,86 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+import asyncio
+import os
+import threading
+
+from passlib.context import CryptContext
+
+from ...domain.services.auth_service import AuthenticationService
+
+AUTH_HASH_WORKERS = int(os.getenv("AUTH_HASH_WORKERS", str(os.cpu_count() or 1)))
+AUTH_HASH_QUEUE_DEPTH = int(os.getenv("AUTH_HASH_QUEUE_DEPTH", "32"))
+
+
+class ExecutorSaturatedError(Exception):
+    """Raised when a bounded executor has no free slot for new work"""
+
+    def __init__(self, retry_after: int = 1):
+        self.retry_after = retry_after
+        super().__init__("Authentication service is busy, retry shortly")
+
+
+class BoundedExecutor:
+    """
+    Thread pool with a hard limit on running plus queued work
+
+    Submissions beyond ``max_workers + max_queue`` fail immediately with
+    ``ExecutorSaturatedError`` instead of queueing without bound.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int, thread_name_prefix: str = "bounded"):
+        self.capacity = max_workers + max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                raise ExecutorSaturatedError()
+            self._in_flight += 1
+
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._release()
+            raise
+        # Release on completion, not on await: a cancelled request must not
+        # free the slot while its hash is still running in the pool
+        future.add_done_callback(lambda _: self._release())
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+
+class ThreadedAuthenticationService(AuthenticationService):
+    """AuthenticationService running bcrypt in a dedicated bounded thread pool"""
+
+    def __init__(self, executor: BoundedExecutor, pwd_context: Optional[CryptContext] = None):
+        super().__init__(pwd_context)
+        self.executor = executor
+
+    async def hash_password_async(self, password: str) -> str:
+        return await self.executor.run(self.hash_password, password)
+
+    async def verify_password_async(self, plain_password: str, hashed_password: str) -> bool:
+        return await self.executor.run(self.verify_password, plain_password, hashed_password)
+
+
+password_executor = BoundedExecutor(
+    max_workers=AUTH_HASH_WORKERS,
+    max_queue=AUTH_HASH_QUEUE_DEPTH,
+    thread_name_prefix="bcrypt"
+)
+
+# Process-wide instance: one CryptContext and one pool for every request
+auth_service = ThreadedAuthenticationService(password_executor)
@@ -0,0 +1,122 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Optional
+import os
+import time
+
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory")
+RATE_LIMIT_MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000"))
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Token bucket of ``capacity`` tokens refilled evenly over ``period_seconds``"""
+    capacity: float
+    period_seconds: float
+
+    @property
+    def rate(self) -> float:
+        return self.capacity / self.period_seconds
+
+    @classmethod
+    def parse(cls, spec: Optional[str]) -> Optional["RateLimit"]:
+        """Parse ``"20/60"`` (20 requests per 60 seconds); empty disables the limit"""
+        if not spec:
+            return None
+        capacity, _, period = spec.partition("/")
+        return cls(capacity=float(capacity), period_seconds=float(period or 1))
+
+
+class RateLimitBackend(ABC):
+    """
+    Storage for token buckets
+
+    ``consume`` takes ``cost`` tokens from the bucket at ``key`` and
+    returns 0.0 when the request is allowed, otherwise the number of
+    seconds until enough tokens are available.
+    """
+
+    @abstractmethod
+    async def consume(self, key: str, limit: RateLimit, cost: float = 1.0) -> float:
+        pass
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Per-process buckets in a bounded LRU; each worker enforces its own budget"""
+
+    def __init__(self, max_keys: int = RATE_LIMIT_MAX_KEYS):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+
+    async def consume(self, key: str, limit: RateLimit, cost: float = 1.0) -> float:
+        return self.take(key, limit, cost)
+
+    def take(self, key: str, limit: RateLimit, cost: float = 1.0) -> float:
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = [limit.capacity, now]
+            self._buckets[key] = bucket
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+            bucket[0] = min(limit.capacity, bucket[0] + (now - bucket[1]) * limit.rate)
+            bucket[1] = now
+
+        if bucket[0] >= cost:
+            bucket[0] -= cost
+            return 0.0
+        return (cost - bucket[0]) / limit.rate
+
+
+class PostgresRateLimitBackend(RateLimitBackend):
+    """
+    Buckets shared by every worker in the ``rate_limit_buckets`` table
+
+    Refill, check and deduct happen in one upsert, so concurrent workers
+    never double-spend a token. Only rate-limited route groups pay the
+    round-trip.
+    """
+
+    # Bind parameters carry no type, and asyncpg cannot infer one for
+    # ``:capacity - :cost``, so every numeric parameter is cast. SET
+    # expressions all see the row as it was, so repeating the refill
+    # expression yields the same value for both columns
+    CAPACITY = "CAST(:capacity AS double precision)"
+    COST = "CAST(:cost AS double precision)"
+    RATE = "CAST(:rate AS double precision)"
+    REFILLED = f"LEAST({CAPACITY}, b.tokens + EXTRACT(EPOCH FROM LOCALTIMESTAMP - b.updated_at) * {RATE})"
+    CONSUME_SQL = f"""
+        INSERT INTO rate_limit_buckets AS b (key, tokens, allowed, updated_at)
+        VALUES (:key, {CAPACITY} - {COST}, true, LOCALTIMESTAMP)
+        ON CONFLICT (key) DO UPDATE SET
+            tokens = CASE WHEN {REFILLED} >= {COST} THEN {REFILLED} - {COST} ELSE {REFILLED} END,
+            allowed = {REFILLED} >= {COST},
+            updated_at = LOCALTIMESTAMP
+        RETURNING b.tokens, b.allowed
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+
+    async def consume(self, key: str, limit: RateLimit, cost: float = 1.0) -> float:
+        from sqlalchemy import text
+
+        async with self.engine.begin() as conn:
+            result = await conn.execute(
+                text(self.CONSUME_SQL),
+                {"key": key, "capacity": limit.capacity, "cost": cost, "rate": limit.rate}
+            )
+            tokens, allowed = result.one()
+        if allowed:
+            return 0.0
+        return (cost - tokens) / limit.rate
+
+
+def create_rate_limit_backend() -> RateLimitBackend:
+    if RATE_LIMIT_BACKEND == "postgres":
+        from ..database import async_engine
+        return PostgresRateLimitBackend(async_engine)
+    return InMemoryRateLimitBackend()
@@ -0,0 +1,112 @@
+from datetime import datetime, timedelta
+from typing import Optional
+from uuid import UUID
+import asyncio
+import hashlib
+import math
+import os
+import time
+
+from ...domain.repositories.revoked_token_repository import RevokedTokenRepository
+
+REVOCATION_FILTER_CAPACITY = int(os.getenv("REVOCATION_FILTER_CAPACITY", "100000"))
+REVOCATION_FILTER_ERROR_RATE = float(os.getenv("REVOCATION_FILTER_ERROR_RATE", "0.001"))
+REVOCATION_SYNC_SECONDS = float(os.getenv("REVOCATION_SYNC_SECONDS", "5"))
+
+# Re-read a short window before the watermark so rows committed out of
+# revoked_at order by concurrent workers are not missed
+SYNC_OVERLAP = timedelta(seconds=30)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter using double hashing over one blake2b digest"""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: bytes):
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, key: bytes) -> None:
+        added = False
+        for position in self._positions(key):
+            mask = 1 << (position & 7)
+            if not self.bits[position >> 3] & mask:
+                self.bits[position >> 3] |= mask
+                added = True
+        if added:
+            self.count += 1
+
+    def __contains__(self, key: bytes) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class RevocationList:
+    """
+    In-memory Bloom filter over revoked refresh-token ids
+
+    A miss proves a token was not revoked without touching the database;
+    a hit is confirmed against the revoked-token table. New rows are synced
+    from the table every ``sync_seconds`` so revocations made by other
+    workers are picked up, and the filter is rebuilt from unexpired rows
+    once it reaches capacity.
+    """
+
+    def __init__(
+        self,
+        capacity: int = REVOCATION_FILTER_CAPACITY,
+        error_rate: float = REVOCATION_FILTER_ERROR_RATE,
+        sync_seconds: float = REVOCATION_SYNC_SECONDS
+    ):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_seconds = sync_seconds
+        self._filter = BloomFilter(capacity, error_rate)
+        self._watermark: Optional[datetime] = None
+        self._synced_at = -math.inf
+        self._lock = asyncio.Lock()
+
+    async def is_revoked(self, jti: UUID, repository: RevokedTokenRepository) -> bool:
+        await self._sync(repository)
+        if jti.bytes not in self._filter:
+            return False
+        return await repository.is_revoked(jti)
+
+    async def revoke(self, jti: UUID, expires_at: datetime, repository: RevokedTokenRepository) -> bool:
+        """Revoke a token id; returns False if it had already been revoked"""
+        revoked = await repository.revoke(jti, expires_at)
+        self._filter.add(jti.bytes)
+        return revoked
+
+    async def _sync(self, repository: RevokedTokenRepository) -> None:
+        if time.monotonic() - self._synced_at < self.sync_seconds:
+            return
+        async with self._lock:
+            if time.monotonic() - self._synced_at < self.sync_seconds:
+                return
+
+            rebuild = self._watermark is None or self._filter.count >= self.capacity
+            since = None if rebuild else self._watermark - SYNC_OVERLAP
+            target = BloomFilter(self.capacity, self.error_rate) if rebuild else self._filter
+            watermark = None if rebuild else self._watermark
+
+            for jti, revoked_at in await repository.get_revoked_since(since):
+                target.add(jti.bytes)
+                if watermark is None or revoked_at > watermark:
+                    watermark = revoked_at
+
+            # Ids revoked while a rebuild was reading are re-read by the next
+            # sync thanks to the overlap window
+            self._filter = target
+            self._watermark = watermark or datetime.utcnow()
+            self._synced_at = time.monotonic()
+
+
+revocation_list = RevocationList()
@@ -1,37 +1,49 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+import asyncio
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
-from .infrastructure.database import init_db
-from .infrastructure.api.routes import auth, organizations, audits, rules, dashboard
-
-# Initialize database
-init_db()
-
-# Create FastAPI app
-app = FastAPI(
-    title="AI Cloud Cost Auditor - Hexagonal Architecture",
-    description="Multi-tenant SaaS with Clean Architecture - Complete API",
-    version="1.0.0"
-)
-
-# CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:5173", "http://frontend:5173"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Include all routers
-app.include_router(auth.router)
-app.include_router(organizations.router)
-app.include_router(audits.router)
-app.include_router(rules.router)
-app.include_router(dashboard.router)
-
-
-@app.get("/")
+from .infrastructure.database import dispose_engines
+from .infrastructure.messaging.progress import progress_broker
+from .infrastructure.api.routes import auth, organizations, audits, rules, dashboard, metrics
+from .infrastructure.api.middleware.response_cache import ResponseCacheMiddleware
+from .infrastructure.api.middleware.rate_limit import RateLimitMiddleware
+from .infrastructure.api.middleware.read_routing import ReadYourWritesMiddleware, read_router
+from .infrastructure.api.middleware.request_metrics import RequestMetricsMiddleware
+from .infrastructure.api.middleware.repeated_queries import RepeatedQueryMiddleware, REPEATED_QUERY_WARNINGS
+from .infrastructure.observability.app_metrics import multiprocess
+from .infrastructure.security.password_hashing import ExecutorSaturatedError
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Runs in every worker: drop any pooled connections inherited from a
+    # preloading parent so each worker starts with its own
+    await dispose_engines(close=False)
+    # Listen for audit progress before any client subscribes, so a final
+    # message published by another worker is never missed
+    await progress_broker.start()
+    # Multi-worker metrics: share this worker's figures through its metrics file
+    writer = asyncio.create_task(multiprocess.write_periodically()) if multiprocess is not None else None
+    yield
+    if writer is not None:
+        writer.cancel()
+        multiprocess.write()
+    await progress_broker.stop()
+    await dispose_engines()
+
+
+async def executor_saturated_handler(request: Request, exc: ExecutorSaturatedError):
+    # Shed load fast instead of queueing bcrypt work behind a login storm
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)}
+    )
+
+
 async def root():
     return {
         "message": "AI Cloud Cost Auditor API - Hexagonal Architecture",
@@ -42,16 +54,79 @@ async def root():
             "organizations": "/organizations",
             "audits": "/audits",
             "rules": "/rules",
-            "dashboard": "/dashboard"
+            "dashboard": "/dashboard",
+            "metrics": "/metrics"
         }
     }
 
 
-@app.get("/health")
 async def health():
     return {"status": "healthy"}
 
 
+def create_app() -> FastAPI:
+    """
+    Build the FastAPI application
+    
+    Building it does no I/O: the schema is migrated beforehand
+    (``python -m src.cli migrate``) and pandas, openpyxl and reportlab load
+    on first use. Pre-forking servers can therefore import the app once in
+    the parent, e.g.
+    ``gunicorn src.main:app --preload -w 4 -k uvicorn.workers.UvicornWorker``,
+    or build one per worker with ``uvicorn src.main:create_app --factory``.
+    """
+    app = FastAPI(
+        title="AI Cloud Cost Auditor - Hexagonal Architecture",
+        description="Multi-tenant SaaS with Clean Architecture - Complete API",
+        version="1.0.0",
+        lifespan=lifespan
+    )
+    
+    # Response cache for polled GET endpoints (registered first so CORS wraps it)
+    app.add_middleware(ResponseCacheMiddleware)
+    
+    # Token-bucket limits for auth and upload (inside CORS so 429s carry CORS headers)
+    app.add_middleware(RateLimitMiddleware)
+    
+    # Pin users to the primary right after they write
+    if read_router.enabled:
+        app.add_middleware(ReadYourWritesMiddleware)
+    
+    # CORS
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["http://localhost:5173", "http://frontend:5173"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    
+    # Development: log statements repeated within one request (N+1 queries)
+    if REPEATED_QUERY_WARNINGS:
+        app.add_middleware(RepeatedQueryMiddleware)
+    
+    # Request metrics (outermost, so every response above is measured)
+    app.add_middleware(RequestMetricsMiddleware)
+    
+    app.add_exception_handler(ExecutorSaturatedError, executor_saturated_handler)
+    
+    # Include all routers
+    app.include_router(auth.router)
+    app.include_router(organizations.router)
+    app.include_router(audits.router)
+    app.include_router(rules.router)
+    app.include_router(dashboard.router)
+    app.include_router(metrics.router)
+    
+    app.add_api_route("/", root, methods=["GET"])
+    app.add_api_route("/health", health, methods=["GET"])
+    
+    return app
+
+
+app = create_app()
+
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
+    uvicorn.run("src.main:app", host="0.0.0.0", port=8000, reload=True)
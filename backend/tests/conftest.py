@@ -0,0 +1,142 @@
+from contextlib import contextmanager
+from pathlib import Path
+from uuid import UUID
+import asyncio
+import os
+
+import pytest
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+requires_database = pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set")
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def store(monkeypatch):
+    """Fresh in-memory store serving every repository, so no database is needed"""
+    from src.infrastructure.api import dependencies
+    from src.infrastructure.persistence.memory import InMemoryStore
+
+    store = InMemoryStore()
+    monkeypatch.setattr(dependencies, "memory_store", store)
+    return store
+
+
+@pytest.fixture
+def client(store, monkeypatch):
+    from fastapi.testclient import TestClient
+    from src.infrastructure.api.middleware import rate_limit
+    from src.infrastructure.security.rate_limit import InMemoryRateLimitBackend
+    from src.main import create_app
+
+    # Each test starts with full auth buckets
+    monkeypatch.setattr(rate_limit, "rate_limit_backend", InMemoryRateLimitBackend())
+    with TestClient(create_app()) as client:
+        yield client
+
+
+@pytest.fixture
+def signup(client):
+    """Register a user; returns its bearer headers and id"""
+    def signup(email: str = "owner@example.com"):
+        response = client.post("/auth/register", json={"email": email, "password": "password123"})
+        assert response.status_code == 201, response.text
+        body = response.json()
+        return {"Authorization": f"Bearer {body['access_token']}"}, UUID(body["user"]["id"])
+
+    return signup
+
+
+@pytest.fixture(scope="module")
+def database_engine():
+    """Async engine on the scratch ``TEST_DATABASE_URL`` database, migrated to head"""
+    from alembic import command
+    from alembic.config import Config
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import NullPool
+    from src.infrastructure.database import to_async_url
+
+    os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "migrations"))
+    command.upgrade(config, "head")
+
+    # No pooling: the test client and the seeding code run separate event loops
+    engine = create_async_engine(to_async_url(TEST_DATABASE_URL), poolclass=NullPool)
+    yield engine
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture(scope="module")
+def database_client(database_engine):
+    """Test client whose repositories run on ``database_engine`` instead of the memory store"""
+    from fastapi.testclient import TestClient
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+    from src.infrastructure.api import dependencies
+    from src.infrastructure.api.middleware import rate_limit
+    from src.infrastructure.database import get_db
+    from src.infrastructure.security.rate_limit import InMemoryRateLimitBackend
+    from src.main import create_app
+
+    sessions = async_sessionmaker(database_engine, autoflush=False, expire_on_commit=False)
+
+    async def get_test_db():
+        async with sessions() as db:
+            yield db
+
+    memory_store, dependencies.memory_store = dependencies.memory_store, None
+    backend, rate_limit.rate_limit_backend = rate_limit.rate_limit_backend, InMemoryRateLimitBackend()
+    app = create_app()
+    app.dependency_overrides[get_db] = get_test_db
+    yield TestClient(app)
+    dependencies.memory_store = memory_store
+    rate_limit.rate_limit_backend = backend
+
+
+class StatementLog:
+    """SQL statements executed on an engine while the log is attached"""
+
+    def __init__(self, engine):
+        self.target = getattr(engine, "sync_engine", engine)
+        self.statements = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        from sqlalchemy import event
+        event.listen(self.target, "after_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info):
+        from sqlalchemy import event
+        event.remove(self.target, "after_cursor_execute", self._record)
+
+
+@pytest.fixture
+def query_budget():
+    """
+    Fail the test when a block runs more SQL statements than its budget
+
+        with query_budget(engine, 3, "GET /audits"):
+            client.get("/audits", headers=headers)
+
+    The failure lists what ran by statement fingerprint, most repeated
+    first, so an N+1 loop shows up as one shape with a large count.
+    """
+    from src.infrastructure.observability.db_metrics import repeated_statements
+
+    @contextmanager
+    def budget(engine, max_queries: int, label: str = "block"):
+        with StatementLog(engine) as log:
+            yield log
+        if len(log.statements) > max_queries:
+            lines = [f"{count:>4}x {shape}" for shape, count in repeated_statements(log.statements, more_than=0)]
+            pytest.fail(
+                f"{label} ran {len(log.statements)} statements, budget is {max_queries}:\n" + "\n".join(lines),
+                pytrace=False
+            )
+
+    return budget
@@ -0,0 +1,60 @@
+import asyncio
+from datetime import datetime
+from uuid import uuid4
+
+import pandas as pd
+import pytest
+
+from src.domain.entities import Audit, AuditType, AuditStatus
+from src.domain.exceptions import ValidationError
+from src.infrastructure.datasets.audit_data_store import AuditDataStore, parse_filter, parse_sort
+
+
+@pytest.fixture
+def audit(tmp_path):
+    file_path = tmp_path / "costs.csv"
+    pd.DataFrame({
+        "resource": ["vm-1", "vm-2", "db-1", "bucket-1"],
+        "region": ["eu", "us", "eu", "us"],
+        "cost": [120.5, 30.0, 900.0, 5.25],
+    }).to_csv(file_path, index=False)
+    return Audit(
+        id=uuid4(),
+        organization_id=uuid4(),
+        audit_type=AuditType.CLOUD,
+        file_name="costs.csv",
+        file_path=str(file_path),
+        status=AuditStatus.COMPLETED,
+        created_by=uuid4(),
+        created_at=datetime.utcnow()
+    )
+
+
+def test_parse_filter_and_sort():
+    numeric = parse_filter("cost>=100")
+    assert (numeric.field, numeric.operator, numeric.value) == ("cost", ">=", 100.0)
+    assert parse_filter("resource~vm").value == "%vm%"
+    assert parse_sort("-cost, region") == [("cost", True), ("region", False)]
+    with pytest.raises(ValidationError):
+        parse_filter("cost")
+
+
+def test_query_projects_filters_sorts_and_pages(tmp_path, audit):
+    store = AuditDataStore(cache_dir=str(tmp_path / "cache"))
+    page = asyncio.run(store.query(
+        audit,
+        columns=["resource", "cost"],
+        filters=[parse_filter("region==eu")],
+        sort=parse_sort("-cost"),
+        limit=1
+    ))
+    assert page.columns == ["resource", "cost"]
+    assert page.rows == [{"resource": "db-1", "cost": 900.0}]
+    assert page.total == 2
+    assert page.next_offset == 1
+
+
+def test_query_rejects_unknown_columns(tmp_path, audit):
+    store = AuditDataStore(cache_dir=str(tmp_path / "cache"))
+    with pytest.raises(ValidationError):
+        asyncio.run(store.query(audit, columns=["missing"]))
@@ -0,0 +1,42 @@
+"""
+Profiling an upload never breaks the rest of its processing
+
+Runs against a scratch database (``TEST_DATABASE_URL``).
+"""
+import asyncio
+from uuid import uuid4
+
+import pandas as pd
+
+from src.infrastructure.api.routes.audits import _ingest_dataframe
+
+from .conftest import requires_database
+from .test_audit_report import _audit
+
+
+class UnusedDataStore:
+    async def ensure(self, audit, df):
+        raise AssertionError("data copy written after the profile failed")
+
+
+@requires_database
+def test_failed_profile_save_leaves_the_session_usable(database_engine):
+    from sqlalchemy import select
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from src.infrastructure.persistence.models import AuditProfileModel
+    from src.infrastructure.persistence.repositories import SQLAlchemyAuditProfileRepository
+    from src.infrastructure.persistence.unit_of_work import SQLAlchemyUnitOfWork
+
+    # No such audit row: the profile's foreign key fails on commit
+    audit = _audit(uuid4())
+    df = pd.DataFrame({"service": ["ec2", "s3"], "cost": [12.5, 3.0]})
+
+    async def run():
+        async with AsyncSession(database_engine, expire_on_commit=False) as session:
+            await _ingest_dataframe(
+                audit, df, UnusedDataStore(), SQLAlchemyAuditProfileRepository(session), SQLAlchemyUnitOfWork(session)
+            )
+            # Without a rollback this raises PendingRollbackError
+            return (await session.scalars(select(AuditProfileModel).where(AuditProfileModel.audit_id == audit.id))).all()
+
+    assert asyncio.run(run()) == []
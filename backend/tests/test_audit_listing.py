@@ -0,0 +1,169 @@
+"""
+``GET /audits`` on Postgres: keyset pages, filters and organization scope
+
+Runs against a scratch database (``TEST_DATABASE_URL``); the cursor
+encoding tests need none.
+"""
+import asyncio
+import base64
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from src.domain.entities import Audit, AuditStatus, AuditType
+from src.infrastructure.api.routes.audits import _decode_cursor, _encode_cursor
+
+from .conftest import requires_database
+
+STARTED = datetime(2024, 3, 6, 12, 0)
+
+
+def test_cursor_round_trips():
+    position = (datetime(2024, 3, 6, 12, 0, 0, 123456), uuid4())
+
+    assert _decode_cursor(_encode_cursor(position)) == position
+
+
+@pytest.mark.parametrize("cursor", [
+    "not a cursor",
+    base64.urlsafe_b64encode(b"yesterday|nobody").decode(),
+    base64.urlsafe_b64encode(b"\xff\xfe").decode(),
+])
+def test_malformed_cursor_is_a_bad_request(cursor):
+    with pytest.raises(HTTPException) as raised:
+        _decode_cursor(cursor)
+
+    assert raised.value.status_code == 400
+
+
+async def _seed(engine, organization_id: UUID, user_id: UUID, specs):
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from src.infrastructure.persistence.repositories import SQLAlchemyAuditRepository
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        for created_at, audit_status, audit_type in specs:
+            await SQLAlchemyAuditRepository(session).create(Audit(
+                id=uuid4(),
+                organization_id=organization_id,
+                audit_type=audit_type,
+                file_name="costs.csv",
+                file_path="/tmp/costs.csv",
+                status=audit_status,
+                created_by=user_id,
+                created_at=created_at
+            ))
+
+
+def _register(client, name: str):
+    response = client.post("/auth/register", json={
+        "email": f"{name}-{uuid4().hex[:10]}@example.com", "password": "listing-password"
+    })
+    assert response.status_code == 201, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}, UUID(response.json()["user"]["id"])
+
+
+def _organization(client, headers, name: str) -> UUID:
+    response = client.post("/organizations", json={"name": name}, headers=headers)
+    assert response.status_code == 201, response.text
+    return UUID(response.json()["id"])
+
+
+@pytest.fixture(scope="module")
+def tenant(database_client, database_engine):
+    """An owner with two organizations of audits, and an outsider with one"""
+    client = database_client
+    headers, user_id = _register(client, "owner")
+    first, second = _organization(client, headers, "First"), _organization(client, headers, "Second")
+    # Two audits share a timestamp, so pages must break ties by id
+    asyncio.run(_seed(database_engine, first, user_id, [
+        (STARTED, AuditStatus.COMPLETED, AuditType.CLOUD),
+        (STARTED + timedelta(minutes=2), AuditStatus.FAILED, AuditType.CLOUD),
+        (STARTED + timedelta(minutes=4), AuditStatus.COMPLETED, AuditType.HOSPITALITY),
+    ]))
+    asyncio.run(_seed(database_engine, second, user_id, [
+        (STARTED + timedelta(minutes=1), AuditStatus.COMPLETED, AuditType.CLOUD),
+        (STARTED + timedelta(minutes=2), AuditStatus.PENDING, AuditType.BUSINESS),
+    ]))
+
+    outsider_headers, outsider_id = _register(client, "outsider")
+    outsider_organization = _organization(client, outsider_headers, "Elsewhere")
+    asyncio.run(_seed(database_engine, outsider_organization, outsider_id, [
+        (STARTED + timedelta(minutes=3), AuditStatus.COMPLETED, AuditType.CLOUD),
+    ]))
+    return {
+        "headers": headers,
+        "organizations": (first, second),
+        "outsider_headers": outsider_headers,
+        "outsider_organization": outsider_organization
+    }
+
+
+def _pages(client, headers, **params):
+    """Every page of a listing, following next_cursor"""
+    pages, cursor = [], None
+    while True:
+        response = client.get("/audits", params={**params, **({"cursor": cursor} if cursor else {})}, headers=headers)
+        assert response.status_code == 200, response.text
+        pages.append(response.json())
+        cursor = pages[-1]["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+def _keys(audits):
+    return [(audit["created_at"], audit["id"]) for audit in audits]
+
+
+@requires_database
+def test_pages_cover_every_audit_newest_first_once(database_client, tenant):
+    pages = _pages(database_client, tenant["headers"], limit=2)
+    audits = [audit for page in pages for audit in page["audits"]]
+
+    assert [len(page["audits"]) for page in pages] == [2, 2, 1]
+    assert {page["total"] for page in pages} == {5}
+    assert len({audit["id"] for audit in audits}) == 5
+    assert _keys(audits) == sorted(_keys(audits), reverse=True)
+    assert {UUID(audit["organization_id"]) for audit in audits} == set(tenant["organizations"])
+
+
+@requires_database
+def test_filters_apply_to_pages_and_total(database_client, tenant):
+    headers = tenant["headers"]
+
+    completed = _pages(database_client, headers, status="completed", limit=2)
+    assert {audit["status"] for page in completed for audit in page["audits"]} == {"completed"}
+    assert sum(len(page["audits"]) for page in completed) == completed[0]["total"] == 3
+
+    cloud = _pages(database_client, headers, audit_type="cloud", limit=10)
+    assert [len(page["audits"]) for page in cloud] == [3]
+    assert {audit["audit_type"] for audit in cloud[0]["audits"]} == {"cloud"}
+
+    first = tenant["organizations"][0]
+    response = database_client.get(
+        "/audits", params={"organization_id": str(first), "status": "completed"}, headers=headers
+    )
+    assert response.status_code == 200
+    assert response.json()["total"] == 2
+    assert {audit["organization_id"] for audit in response.json()["audits"]} == {str(first)}
+
+
+@requires_database
+def test_bad_cursor_is_rejected(database_client, tenant):
+    response = database_client.get("/audits", params={"cursor": "not a cursor"}, headers=tenant["headers"])
+
+    assert response.status_code == 400
+
+
+@requires_database
+def test_organization_of_another_user_is_not_found(database_client, tenant):
+    response = database_client.get(
+        "/audits", params={"organization_id": str(tenant["outsider_organization"])}, headers=tenant["headers"]
+    )
+    assert response.status_code == 404
+
+    # The outsider's listing holds only their own audit
+    response = database_client.get("/audits", headers=tenant["outsider_headers"])
+    assert response.json()["total"] == 1
+    assert response.json()["audits"][0]["organization_id"] == str(tenant["outsider_organization"])
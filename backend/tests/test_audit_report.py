@@ -0,0 +1,146 @@
+from datetime import datetime
+from uuid import UUID, uuid4
+import asyncio
+import os
+
+import pytest
+
+from src.domain.entities import Audit, AuditStatus, AuditType, Finding
+from src.infrastructure.api.dependencies import get_read_finding_repository, get_report_cache
+from src.infrastructure.reports.pdf_report import AuditReportCache
+
+NOW = datetime(2024, 3, 6, 12, 0)
+
+
+def _audit(organization_id, status=AuditStatus.COMPLETED):
+    return Audit(
+        id=uuid4(),
+        organization_id=organization_id,
+        audit_type=AuditType.CLOUD,
+        file_name="costs.csv",
+        file_path="/tmp/costs.csv",
+        status=status,
+        created_by=uuid4(),
+        created_at=NOW,
+        optimization_score=90 if status == AuditStatus.COMPLETED else None,
+        completed_at=NOW if status == AuditStatus.COMPLETED else None
+    )
+
+
+def _finding(audit_id):
+    return Finding(id=uuid4(), audit_id=audit_id, title="Idle instance", severity="high", created_at=NOW, cost_impact=12.5)
+
+
+@pytest.fixture
+def report_cache(client, tmp_path):
+    cache = AuditReportCache(str(tmp_path / "reports"))
+    client.app.dependency_overrides[get_report_cache] = lambda: cache
+    return cache
+
+
+@pytest.fixture
+def owned_audit(client, store, signup):
+    """Returns a function adding an audit, with one finding, to an organization of the signed-up user"""
+    headers, _ = signup()
+    organization_id = UUID(client.post("/organizations", json={"name": "Acme"}, headers=headers).json()["id"])
+
+    def add(status=AuditStatus.COMPLETED):
+        audit = _audit(organization_id, status)
+        store.audits.put(audit.id, audit)
+        finding = _finding(audit.id)
+        store.findings.put(finding.id, finding)
+        return audit
+
+    return headers, add
+
+
+def test_cache_renders_each_report_once_per_template_version(tmp_path):
+    audit = _audit(uuid4())
+    cache = AuditReportCache(str(tmp_path / "reports"), template_version=3)
+    rendered = []
+    cache._render_to_file = lambda summary, path: (rendered.append(path), open(path, "wb").close())
+
+    async def run():
+        return await asyncio.gather(*(cache.get_or_render(audit, [_finding(audit.id)]) for _ in range(3)))
+
+    paths = asyncio.run(run())
+    assert paths == [cache.path_for(audit.id)] * 3
+    assert paths[0].endswith(f"{audit.id}_v3.pdf")
+    assert rendered == [paths[0]]
+    assert AuditReportCache(str(tmp_path), template_version=4).etag_for(audit.id) != cache.etag_for(audit.id)
+
+
+def test_render_locks_are_released_after_success_and_failure(tmp_path):
+    audit = _audit(uuid4())
+    cache = AuditReportCache(str(tmp_path / "reports"))
+    renders = []
+
+    def failing_render(summary, path):
+        renders.append(path)
+        raise RuntimeError("render failed")
+
+    cache._render_to_file = failing_render
+
+    async def run():
+        return await asyncio.gather(*(cache.get_or_render(audit, []) for _ in range(3)), return_exceptions=True)
+
+    # Every waiter retries the render in turn, and no lock outlives them
+    assert [type(result) for result in asyncio.run(run())] == [RuntimeError] * 3
+    assert len(renders) == 3
+    assert cache._locks == {}
+
+    cache._render_to_file = lambda summary, path: open(path, "wb").close()
+    asyncio.run(run())
+    assert cache._locks == {}
+
+
+def test_only_completed_audits_are_cacheable(tmp_path):
+    cache = AuditReportCache(str(tmp_path))
+    assert cache.is_cacheable(_audit(uuid4()))
+    assert not cache.is_cacheable(_audit(uuid4(), AuditStatus.PROCESSING))
+
+
+def test_report_of_unfinished_audit_is_a_conflict(client, owned_audit, report_cache):
+    headers, add = owned_audit
+    audit = add(AuditStatus.PROCESSING)
+
+    response = client.get(f"/audits/{audit.id}/report.pdf", headers=headers)
+
+    assert response.status_code == 409
+    assert not os.path.exists(report_cache.path_for(audit.id))
+
+
+def test_report_is_rendered_then_revalidated_by_etag(client, owned_audit, report_cache):
+    headers, add = owned_audit
+    audit = add()
+
+    response = client.get(f"/audits/{audit.id}/report.pdf", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/pdf"
+    assert response.content.startswith(b"%PDF")
+    assert response.headers["etag"] == report_cache.etag_for(audit.id)
+    assert "immutable" not in response.headers["cache-control"]
+
+    revalidated = client.get(
+        f"/audits/{audit.id}/report.pdf", headers={**headers, "If-None-Match": response.headers["etag"]}
+    )
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+    report_cache.template_version += 1
+    stale = client.get(f"/audits/{audit.id}/report.pdf", headers={**headers, "If-None-Match": response.headers["etag"]})
+    assert stale.status_code == 200
+    assert stale.headers["etag"] == report_cache.etag_for(audit.id)
+
+
+
+def test_report_findings_are_read_from_the_primary(client, owned_audit, report_cache):
+    # A lagging replica could return no findings for a just-completed audit
+    def replica_repository():
+        raise AssertionError("report read findings from the replica")
+
+    client.app.dependency_overrides[get_read_finding_repository] = replica_repository
+    headers, add = owned_audit
+    audit = add()
+
+    assert client.get(f"/audits/{audit.id}/report.pdf", headers=headers).status_code == 200
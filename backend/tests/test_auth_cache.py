@@ -0,0 +1,55 @@
+from datetime import datetime
+from uuid import uuid4
+import time
+
+from src.domain.entities.user import User, UserRole
+from src.domain.events import EventBus, UserChanged
+from src.infrastructure.security.auth_cache import AuthContextCache, TTLCache
+
+
+def make_user():
+    return User(
+        id=uuid4(),
+        email="owner@example.com",
+        password_hash="hash",
+        role=UserRole.MEMBER,
+        created_at=datetime.utcnow()
+    )
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+
+
+def test_payload_is_not_cached_past_token_expiry():
+    cache = AuthContextCache(bus=EventBus())
+    cache.set_payload("expired", {"sub": "x", "exp": time.time() - 1})
+    cache.set_payload("valid", {"sub": "y", "exp": time.time() + 600})
+    assert cache.get_payload("expired") is None
+    assert cache.get_payload("valid")["sub"] == "y"
+
+
+def test_user_changed_event_invalidates_cached_user():
+    bus = EventBus()
+    cache = AuthContextCache(bus=bus)
+    user = make_user()
+    cache.set_user(user, cache.generation)
+    assert cache.get_user(user.id) == user
+
+    bus.publish(UserChanged(user_id=user.id))
+    assert cache.get_user(user.id) is None
+
+
+def test_lookup_racing_with_invalidation_is_not_cached():
+    cache = AuthContextCache(bus=EventBus())
+    user = make_user()
+    generation = cache.generation
+    cache.invalidate_user(user.id)
+    cache.set_user(user, generation)
+    assert cache.get_user(user.id) is None
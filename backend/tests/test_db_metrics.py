@@ -0,0 +1,60 @@
+"""
+Pool checkout metrics land on the engine's own ``DatabaseMetrics``
+
+Runs against a scratch database (``TEST_DATABASE_URL``).
+"""
+import asyncio
+
+import pytest
+
+from src.infrastructure.observability.db_metrics import (
+    DatabaseMetrics,
+    InstrumentedAsyncQueuePool,
+    db_metrics,
+    instrumented_pool_class
+)
+
+from .conftest import TEST_DATABASE_URL, requires_database
+
+
+def test_pool_class_per_metrics_target():
+    metrics = DatabaseMetrics()
+
+    assert instrumented_pool_class(db_metrics) is InstrumentedAsyncQueuePool
+    assert issubclass(instrumented_pool_class(metrics), InstrumentedAsyncQueuePool)
+    assert instrumented_pool_class(metrics).metrics is metrics
+
+
+@requires_database
+def test_checkout_waits_and_timeouts_are_recorded_per_engine():
+    from sqlalchemy import exc
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from src.infrastructure.database import to_async_url
+
+    metrics = DatabaseMetrics()
+    primary_timeouts, primary_waits = db_metrics.checkout_timeouts, db_metrics.checkout_wait.count
+
+    async def run():
+        engine = create_async_engine(
+            to_async_url(TEST_DATABASE_URL),
+            poolclass=instrumented_pool_class(metrics),
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.1
+        )
+        try:
+            async with engine.connect():
+                with pytest.raises(exc.TimeoutError):
+                    async with engine.connect():
+                        pass
+            # The pool rebuilt on dispose keeps reporting to the same target
+            await engine.dispose()
+            async with engine.connect():
+                pass
+        finally:
+            await engine.dispose()
+
+    asyncio.run(run())
+    assert metrics.checkout_timeouts == 1
+    assert metrics.checkout_wait.count == 3
+    assert (db_metrics.checkout_timeouts, db_metrics.checkout_wait.count) == (primary_timeouts, primary_waits)
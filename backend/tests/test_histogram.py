@@ -0,0 +1,25 @@
+from src.infrastructure.observability.histogram import Histogram
+
+
+def test_observations_land_in_cumulative_buckets():
+    histogram = Histogram(buckets=(0.01, 0.1, 1.0))
+    for value in (0.005, 0.05, 0.05, 0.5, 5.0):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["count"] == 5
+    assert snapshot["buckets"] == {"0.01": 1, "0.1": 3, "1.0": 4, "+Inf": 5}
+    assert round(snapshot["sum"], 3) == 5.605
+
+
+def test_quantile_reports_bucket_upper_bound():
+    histogram = Histogram(buckets=(0.01, 0.1, 1.0))
+    for _ in range(98):
+        histogram.observe(0.002)
+    histogram.observe(0.5)
+    histogram.observe(2.0)
+
+    assert histogram.quantile(0.5) == 0.01
+    assert histogram.quantile(0.99) == 1.0
+    assert histogram.quantile(1.0) == float("inf")
+    assert Histogram().quantile(0.99) == 0.0
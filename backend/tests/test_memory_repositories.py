@@ -0,0 +1,203 @@
+from datetime import date, datetime, timedelta
+from uuid import uuid4
+import asyncio
+
+import pytest
+
+from src.domain.entities import Audit, AuditStatus, AuditType, Finding, Organization, Rule, RuleSeverity, TrendGranularity, User, UserRole
+from src.domain.events import AuditChanged, EventBus
+from src.domain.exceptions import EntityAlreadyExistsError
+from src.infrastructure.persistence.memory import (
+    InMemoryAuditRepository,
+    InMemoryFindingRepository,
+    InMemoryMetricsRepository,
+    InMemoryRuleRepository,
+    InMemoryStore,
+    InMemoryTrendRepository,
+    InMemoryUnitOfWork,
+    InMemoryUserRepository
+)
+
+NOW = datetime(2024, 3, 6, 12, 0)
+
+
+def _user(email="user@example.com"):
+    return User(id=uuid4(), email=email, password_hash="hash", role=UserRole.MEMBER, created_at=NOW)
+
+
+def _organization(store, owner_id):
+    organization = Organization(id=uuid4(), name="Org", owner_id=owner_id, created_at=NOW)
+    store.organizations.put(organization.id, organization)
+    return organization
+
+
+def _audit(organization_id, created_at=NOW, status=AuditStatus.PENDING, score=None):
+    return Audit(
+        id=uuid4(),
+        organization_id=organization_id,
+        audit_type=AuditType.CLOUD,
+        file_name="costs.csv",
+        file_path="/tmp/costs.csv",
+        status=status,
+        created_by=uuid4(),
+        created_at=created_at,
+        optimization_score=score,
+        completed_at=created_at if status == AuditStatus.COMPLETED else None
+    )
+
+
+def _rule(organization_id, is_active=True, audit_type="cloud"):
+    return Rule(
+        id=uuid4(),
+        organization_id=organization_id,
+        name="Idle instances",
+        audit_type=audit_type,
+        conditions={"field": "cpu", "operator": "<", "threshold": 5},
+        severity=RuleSeverity.HIGH,
+        is_active=is_active,
+        created_by=uuid4(),
+        created_at=NOW
+    )
+
+
+def _finding(audit_id, severity="High", cost_impact=10.0):
+    return Finding(id=uuid4(), audit_id=audit_id, title="Idle", severity=severity, created_at=NOW, cost_impact=cost_impact)
+
+
+def test_users_are_indexed_by_unique_email():
+    store = InMemoryStore()
+    users = InMemoryUserRepository(store)
+
+    async def run():
+        user = await users.create(_user())
+        assert (await users.get_by_email("user@example.com")).id == user.id
+        with pytest.raises(EntityAlreadyExistsError):
+            await users.create(_user())
+
+        user.email = "renamed@example.com"
+        await users.update(user)
+        assert await users.get_by_email("user@example.com") is None
+        assert (await users.get_by_email("renamed@example.com")).id == user.id
+
+    asyncio.run(run())
+
+
+def test_returned_entities_do_not_share_state_with_the_store():
+    store = InMemoryStore()
+    users = InMemoryUserRepository(store)
+
+    async def run():
+        user = await users.create(_user())
+        user.email = "changed@example.com"
+        return await users.get_by_id(user.id)
+
+    assert asyncio.run(run()).email == "user@example.com"
+
+
+def test_active_rules_are_looked_up_by_organization_type_and_state():
+    store = InMemoryStore()
+    rules = InMemoryRuleRepository(store)
+    org_id = uuid4()
+
+    async def run():
+        active = await rules.create(_rule(org_id))
+        inactive = await rules.create(_rule(org_id, is_active=False))
+        await rules.create(_rule(org_id, audit_type="business"))
+        await rules.create(_rule(uuid4()))
+        assert [rule.id for rule in await rules.get_active_by_audit_type(org_id, "cloud")] == [active.id]
+
+        inactive.activate()
+        await rules.update(inactive)
+        return {rule.id for rule in await rules.get_active_by_audit_type(org_id, "cloud")}
+
+    assert len(asyncio.run(run())) == 2
+
+
+def test_audit_listing_is_scoped_filtered_and_paged_newest_first():
+    store = InMemoryStore()
+    audits = InMemoryAuditRepository(store)
+    owner_id = uuid4()
+    organization = _organization(store, owner_id)
+    _organization(store, uuid4())
+
+    async def run():
+        created = [await audits.create(_audit(organization.id, NOW + timedelta(minutes=i))) for i in range(5)]
+        await audits.create(_audit(organization.id, status=AuditStatus.FAILED))
+
+        first = await audits.list_for_owner(owner_id, status=AuditStatus.PENDING, limit=3)
+        second = await audits.list_for_owner(owner_id, status=AuditStatus.PENDING, limit=3, after=first.next_cursor)
+        assert first.total == 5 and first.organization_ids == [organization.id]
+        assert [audit.id for audit in first.audits + second.audits] == [audit.id for audit in reversed(created)]
+        assert second.next_cursor is None
+
+        assert (await audits.list_for_owner(uuid4(), organization_id=organization.id)).organization_ids == []
+        assert await audits.get_by_id_for_owner(created[0].id, uuid4()) is None
+        assert await audits.count_by_organization(organization.id) == 6
+
+    asyncio.run(run())
+
+
+def test_metrics_and_trends_are_computed_from_the_rows():
+    store = InMemoryStore()
+    audits = InMemoryAuditRepository(store)
+    findings = InMemoryFindingRepository(store)
+    organization = _organization(store, uuid4())
+
+    async def run():
+        completed = await audits.create(_audit(organization.id, status=AuditStatus.COMPLETED, score=80))
+        await audits.create(_audit(organization.id))
+        await findings.create_many([_finding(completed.id), _finding(completed.id, severity="critical", cost_impact=5.0)])
+        await InMemoryRuleRepository(store).create(_rule(organization.id))
+
+        metrics = await InMemoryMetricsRepository(store).get_dashboard_metrics(organization.id)
+        trends = await InMemoryTrendRepository(store).get_trends(organization.id, TrendGranularity.MONTH)
+        return metrics, trends
+
+    metrics, trends = asyncio.run(run())
+    assert (metrics.total_audits, metrics.completed_audits, metrics.total_findings, metrics.active_rules) == (2, 1, 2, 1)
+    assert metrics.avg_optimization_score == 80
+    assert metrics.total_cost_impact == 15.0
+    assert [trend.bucket_start for trend in trends] == [date(2024, 3, 1)]
+    assert trends[0].severity_counts == {"critical": 1, "high": 1, "medium": 0, "low": 0}
+
+
+def test_unit_of_work_rollback_undoes_writes_and_drops_events():
+    bus = EventBus()
+    published = []
+    bus.subscribe(AuditChanged, published.append)
+    store = InMemoryStore(bus)
+    audits = InMemoryAuditRepository(store)
+    organization = _organization(store, uuid4())
+    kept = asyncio.run(audits.create(_audit(organization.id)))
+    published.clear()
+
+    async def run():
+        async with InMemoryUnitOfWork(store):
+            await audits.create(_audit(organization.id))
+            kept.status = AuditStatus.PROCESSING
+            await audits.update(kept)
+            await audits.delete(kept.id)
+            raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(run())
+    assert [audit.id for audit in asyncio.run(audits.get_by_status(AuditStatus.PENDING))] == [kept.id]
+    assert len(store.audits) == 1
+    assert published == []
+    assert store.unit_of_work is None
+
+
+def test_unit_of_work_publishes_after_commit():
+    bus = EventBus()
+    published = []
+    bus.subscribe(AuditChanged, published.append)
+    store = InMemoryStore(bus)
+    audits = InMemoryAuditRepository(store)
+
+    async def run():
+        async with InMemoryUnitOfWork(store):
+            await audits.create(_audit(uuid4()))
+            assert published == []
+
+    asyncio.run(run())
+    assert len(published) == 1
@@ -0,0 +1,151 @@
+"""
+Dashboard counters maintained on write agree with a full recount
+
+Every repository write adjusts ``organization_metrics`` by a delta; after
+a mix of creates, updates and deletes the row must equal what
+``SQLAlchemyMetricsRepository.rebuild`` computes from the tables. Runs
+against a scratch database (``TEST_DATABASE_URL``).
+"""
+import asyncio
+from datetime import datetime
+from uuid import uuid4
+
+from src.domain.entities import (
+    Audit, AuditStatus, AuditType, Finding, Organization, Rule, RuleSeverity, User, UserRole
+)
+
+from .conftest import requires_database
+
+NOW = datetime(2024, 3, 6, 12, 0)
+
+COUNTERS = (
+    "total_audits", "completed_audits", "scored_audits", "score_sum",
+    "total_findings", "total_cost_impact", "active_rules"
+)
+
+
+def _audit(organization_id, user_id, status=AuditStatus.PENDING, score=None):
+    return Audit(
+        id=uuid4(),
+        organization_id=organization_id,
+        audit_type=AuditType.CLOUD,
+        file_name="costs.csv",
+        file_path="/tmp/costs.csv",
+        status=status,
+        created_by=user_id,
+        created_at=NOW,
+        optimization_score=score,
+        completed_at=NOW if status == AuditStatus.COMPLETED else None
+    )
+
+
+def _rule(organization_id, user_id, is_active=True):
+    return Rule(
+        id=uuid4(),
+        organization_id=organization_id,
+        name="Idle instances",
+        audit_type="cloud",
+        conditions={"field": "cpu", "operator": "<", "threshold": 5},
+        severity=RuleSeverity.HIGH,
+        is_active=is_active,
+        created_by=user_id,
+        created_at=NOW
+    )
+
+
+def _finding(audit_id, cost_impact):
+    return Finding(id=uuid4(), audit_id=audit_id, title="Idle", severity="high", created_at=NOW, cost_impact=cost_impact)
+
+
+async def _counters(session, organization_id):
+    from src.infrastructure.persistence.models import OrganizationMetricsModel
+
+    session.expire_all()
+    model = await session.get(OrganizationMetricsModel, organization_id)
+    return {counter: getattr(model, counter) for counter in COUNTERS}
+
+
+async def _exercise_repositories(engine):
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from src.infrastructure.persistence.repositories import (
+        SQLAlchemyAuditRepository,
+        SQLAlchemyFindingRepository,
+        SQLAlchemyMetricsRepository,
+        SQLAlchemyOrganizationRepository,
+        SQLAlchemyRuleRepository,
+        SQLAlchemyUserRepository
+    )
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        audits, rules = SQLAlchemyAuditRepository(session), SQLAlchemyRuleRepository(session)
+        findings = SQLAlchemyFindingRepository(session)
+
+        user = await SQLAlchemyUserRepository(session).create(User(
+            id=uuid4(), email=f"counters-{uuid4().hex[:10]}@example.com", password_hash="hash",
+            role=UserRole.MEMBER, created_at=NOW
+        ))
+        organization = await SQLAlchemyOrganizationRepository(session).create(
+            Organization(id=uuid4(), name="Counters", owner_id=user.id, created_at=NOW)
+        )
+        org_id = organization.id
+
+        # Audits: created in each state, then moved between states and deleted
+        pending = await audits.create(_audit(org_id, user.id))
+        completed = await audits.create(_audit(org_id, user.id, AuditStatus.COMPLETED, score=70))
+        unscored = await audits.create(_audit(org_id, user.id, AuditStatus.COMPLETED))
+        failing = await audits.create(_audit(org_id, user.id, AuditStatus.PROCESSING))
+        doomed = await audits.create(_audit(org_id, user.id, AuditStatus.COMPLETED, score=10))
+
+        pending.status = AuditStatus.PROCESSING
+        await audits.update(pending)
+        pending.mark_as_completed(90, 120.0)
+        await audits.update(pending)
+        completed.optimization_score = 75
+        await audits.update(completed)
+        failing.mark_as_failed("Unreadable file")
+        await audits.update(failing)
+        unscored.status = AuditStatus.FAILED
+        await audits.update(unscored)
+        await audits.delete(doomed.id)
+
+        # Rules: active and inactive, toggled and deleted
+        active = await rules.create(_rule(org_id, user.id))
+        inactive = await rules.create(_rule(org_id, user.id, is_active=False))
+        removed = await rules.create(_rule(org_id, user.id))
+        active.is_active = False
+        await rules.update(active)
+        inactive.is_active = True
+        await rules.update(inactive)
+        await rules.delete(removed.id)
+        await rules.create(_rule(org_id, user.id))
+
+        # Findings: one by one, in batches across audits, deleted singly and per audit
+        single = await findings.create(_finding(completed.id, 12.5))
+        await findings.create(_finding(completed.id, None))
+        await findings.create_many([
+            _finding(pending.id, 40.0), _finding(pending.id, 2.25), _finding(failing.id, 8.0)
+        ])
+        await findings.delete(single.id)
+        await findings.delete_by_audit(failing.id)
+        await findings.create_many([_finding(unscored.id, 3.0)])
+
+        maintained = await _counters(session, org_id)
+        await SQLAlchemyMetricsRepository(session).rebuild(org_id)
+        rebuilt = await _counters(session, org_id)
+    return maintained, rebuilt
+
+
+@requires_database
+def test_counters_maintained_on_write_match_rebuild(database_engine):
+    maintained, rebuilt = asyncio.run(_exercise_repositories(database_engine))
+
+    assert maintained == rebuilt
+    assert rebuilt == {
+        "total_audits": 4,
+        "completed_audits": 2,
+        "scored_audits": 2,
+        "score_sum": 165,
+        "total_findings": 4,
+        "total_cost_impact": 45.25,
+        "active_rules": 2
+    }
@@ -0,0 +1,29 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.infrastructure.security.password_hashing import BoundedExecutor, ExecutorSaturatedError
+
+
+def test_bounded_executor_rejects_work_beyond_capacity():
+    executor = BoundedExecutor(max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    async def scenario():
+        running = [asyncio.ensure_future(executor.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0)
+        with pytest.raises(ExecutorSaturatedError):
+            await executor.run(release.wait)
+        release.set()
+        await asyncio.gather(*running)
+
+    asyncio.run(scenario())
+    assert executor.in_flight == 0
+    executor.shutdown()
+
+
+def test_bounded_executor_returns_result():
+    executor = BoundedExecutor(max_workers=2, max_queue=0)
+    assert asyncio.run(executor.run(sum, [1, 2, 3])) == 6
+    executor.shutdown()
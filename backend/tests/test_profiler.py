@@ -0,0 +1,53 @@
+from uuid import uuid4
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.infrastructure.datasets.hyperloglog import HyperLogLog
+from src.infrastructure.datasets.profiler import profile_dataframe
+
+
+def test_hyperloglog_estimates_within_error_bounds():
+    values = pd.Series(np.arange(50_000))
+    sketch = HyperLogLog()
+    sketch.add_hashes(pd.util.hash_pandas_object(values, index=False).to_numpy())
+    assert abs(sketch.count() - 50_000) / 50_000 < 0.03
+
+
+def test_hyperloglog_small_cardinality_is_exact_enough():
+    sketch = HyperLogLog()
+    sketch.add_hashes(pd.util.hash_pandas_object(pd.Series(["a", "b", "c", "a"]), index=False).to_numpy())
+    assert sketch.count() == 3
+
+
+def test_hyperloglog_ranks_are_exact_at_the_lowest_precision():
+    sketch = HyperLogLog(precision=11)
+    value_bits = 64 - 11
+    # All-ones remainder (largest float64-exact value) and a lone lowest bit
+    sketch.add_hashes(np.array([(1 << value_bits) - 1, (1 << value_bits) | 1], dtype=np.uint64))
+    assert sketch.registers[0] == 1
+    assert sketch.registers[1] == value_bits
+
+    with pytest.raises(ValueError):
+        HyperLogLog(precision=10)
+
+
+def test_profile_dataframe_numeric_and_string_columns():
+    df = pd.DataFrame({
+        "cost": [10.0, 20.0, None, 30.0],
+        "region": ["eu", "eu", "us", None],
+    })
+    profile = profile_dataframe(uuid4(), df)
+
+    assert profile.row_count == 4
+    cost = profile.get_column("cost")
+    assert cost.inferred_type == "float"
+    assert cost.null_count == 1
+    assert (cost.min, cost.max, cost.mean) == (10.0, 30.0, 20.0)
+    assert sum(cost.histogram["counts"]) == 3
+
+    region = profile.get_column("region")
+    assert region.inferred_type == "string"
+    assert region.distinct_estimate == 2
+    assert region.top_values[0] == {"value": "eu", "count": 2}
@@ -0,0 +1,219 @@
+"""
+Audit progress brokers and the ``/audits/{audit_id}/events`` stream
+
+The Postgres broker test needs a scratch database (``TEST_DATABASE_URL``).
+"""
+import asyncio
+import json
+import os
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.domain.entities import AuditStatus
+from src.domain.events import AuditPhase, AuditProgress
+from src.infrastructure.api.dependencies import get_audit_repository, get_progress_broker
+from src.infrastructure.messaging import progress as progress_module
+from src.infrastructure.messaging.progress import InMemoryProgressBroker, PostgresProgressBroker
+from src.infrastructure.persistence.memory import InMemoryAuditRepository
+
+from .test_audit_report import _audit
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+def _progress(audit_id, phase=AuditPhase.EVALUATING, rows_processed=0):
+    return AuditProgress(audit_id=audit_id, phase=phase, rows_total=100, rows_processed=rows_processed)
+
+
+async def _collect(subscription):
+    return [(update.phase, update.rows_processed) async for update in subscription]
+
+
+def test_subscription_starts_from_latest_and_ends_on_final_phase():
+    async def run():
+        broker, audit_id = InMemoryProgressBroker(), uuid4()
+        await broker.publish(_progress(audit_id, AuditPhase.PARSING))
+        await broker.publish(_progress(audit_id, rows_processed=10))
+
+        subscription = broker.subscribe(audit_id)
+        await broker.publish(_progress(audit_id, rows_processed=20))
+        await broker.publish(_progress(audit_id, AuditPhase.COMPLETED, rows_processed=100))
+        await broker.publish(_progress(audit_id, AuditPhase.FAILED))
+        return broker, audit_id, await _collect(subscription)
+
+    broker, audit_id, updates = asyncio.run(run())
+    assert updates == [(AuditPhase.EVALUATING, 10), (AuditPhase.EVALUATING, 20), (AuditPhase.COMPLETED, 100)]
+    assert audit_id not in broker._subscribers
+
+
+def test_subscription_to_finished_audit_yields_only_the_final_message():
+    async def run():
+        broker, audit_id = InMemoryProgressBroker(), uuid4()
+        await broker.publish(_progress(audit_id, AuditPhase.FAILED))
+        return await _collect(broker.subscribe(audit_id))
+
+    assert asyncio.run(run()) == [(AuditPhase.FAILED, 0)]
+
+
+def test_slow_subscriber_drops_oldest_updates(monkeypatch):
+    monkeypatch.setattr(progress_module, "SUBSCRIBER_QUEUE_SIZE", 2)
+
+    async def run():
+        broker, audit_id = InMemoryProgressBroker(), uuid4()
+        subscription = broker.subscribe(audit_id)
+        for rows in (10, 20, 30):
+            broker._dispatch(_progress(audit_id, rows_processed=rows))
+        broker._dispatch(_progress(audit_id, AuditPhase.COMPLETED, rows_processed=100))
+        return await _collect(subscription)
+
+    assert asyncio.run(run()) == [(AuditPhase.EVALUATING, 30), (AuditPhase.COMPLETED, 100)]
+
+
+def test_closed_subscription_is_unregistered():
+    async def run():
+        broker, audit_id = InMemoryProgressBroker(), uuid4()
+        subscription = broker.subscribe(audit_id)
+        assert len(broker._subscribers[audit_id]) == 1
+        await subscription.aclose()
+        await broker.publish(_progress(audit_id))
+        return broker, audit_id, subscription
+
+    broker, audit_id, subscription = asyncio.run(run())
+    assert audit_id not in broker._subscribers
+    assert subscription.queue.empty()
+
+
+def test_latest_keeps_only_recent_audits(monkeypatch):
+    monkeypatch.setattr(progress_module, "MAX_TRACKED_AUDITS", 2)
+    broker = InMemoryProgressBroker()
+    audit_ids = [uuid4() for _ in range(3)]
+    for audit_id in audit_ids:
+        broker._dispatch(_progress(audit_id))
+
+    assert broker.latest(audit_ids[0]) is None
+    assert all(broker.latest(audit_id) for audit_id in audit_ids[1:])
+
+
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set")
+def test_postgres_broker_receives_messages_published_before_subscribing():
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from src.infrastructure.database import to_async_url
+
+    async def run():
+        engine = create_async_engine(to_async_url(TEST_DATABASE_URL))
+        listener, publisher = PostgresProgressBroker(engine), PostgresProgressBroker(engine)
+        await listener.start()
+        try:
+            audit_id = uuid4()
+            # Another process finishes the audit before anyone here subscribes
+            await publisher.publish(_progress(audit_id, AuditPhase.COMPLETED, rows_processed=100))
+            for _ in range(100):
+                if listener.latest(audit_id) is not None:
+                    break
+                await asyncio.sleep(0.05)
+            finished = await asyncio.wait_for(_collect(listener.subscribe(audit_id)), timeout=5)
+
+            other_id = uuid4()
+            subscription = listener.subscribe(other_id)
+            await publisher.publish(_progress(other_id, rows_processed=50))
+            await publisher.publish(_progress(other_id, AuditPhase.FAILED))
+            streamed = await asyncio.wait_for(_collect(subscription), timeout=5)
+        finally:
+            await listener.stop()
+            await engine.dispose()
+        return finished, streamed
+
+    finished, streamed = asyncio.run(run())
+    assert finished == [(AuditPhase.COMPLETED, 100)]
+    assert streamed == [(AuditPhase.EVALUATING, 50), (AuditPhase.FAILED, 0)]
+
+
+# ============ /audits/{audit_id}/events ============
+
+@pytest.fixture
+def broker(client):
+    broker = InMemoryProgressBroker()
+    client.app.dependency_overrides[get_progress_broker] = lambda: broker
+    return broker
+
+
+@pytest.fixture
+def owned_audit(client, store, signup):
+    headers, _ = signup()
+    organization_id = UUID(client.post("/organizations", json={"name": "Acme"}, headers=headers).json()["id"])
+
+    def add(status=AuditStatus.PROCESSING):
+        audit = _audit(organization_id, status)
+        store.audits.put(audit.id, audit)
+        return audit
+
+    return headers, add
+
+
+def _events(response):
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("text/event-stream")
+    return [
+        json.loads(line[len("data: "):])
+        for line in response.text.splitlines()
+        if line.startswith("data: ")
+    ]
+
+
+def test_stream_of_finished_audit_sends_one_final_event(client, broker, owned_audit):
+    headers, add = owned_audit
+    audit = add(AuditStatus.COMPLETED)
+
+    events = _events(client.get(f"/audits/{audit.id}/events", headers=headers))
+
+    assert [(event["phase"], event["optimization_score"]) for event in events] == [("completed", 90)]
+
+
+def test_stream_ends_on_the_final_phase(client, broker, owned_audit):
+    headers, add = owned_audit
+    audit = add()
+    broker._dispatch(_progress(audit.id, AuditPhase.FAILED))
+
+    events = _events(client.get(f"/audits/{audit.id}/events", headers=headers))
+
+    assert [event["phase"] for event in events] == ["failed"]
+    assert audit.id not in broker._subscribers
+
+
+def test_stream_rechecks_status_after_subscribing(client, store, broker, owned_audit):
+    # The audit completes between the ownership check and the subscription,
+    # and its final message is never delivered to this process
+    headers, add = owned_audit
+    audit = add()
+    finished = _audit(audit.organization_id, AuditStatus.COMPLETED)
+
+    class FinishingAuditRepository(InMemoryAuditRepository):
+        async def get_by_id(self, audit_id):
+            return finished
+
+    client.app.dependency_overrides[get_audit_repository] = lambda: FinishingAuditRepository(store)
+    broker._dispatch(_progress(audit.id, rows_processed=10))
+
+    events = _events(client.get(f"/audits/{audit.id}/events", headers=headers))
+
+    assert [event["phase"] for event in events] == ["completed"]
+    assert audit.id not in broker._subscribers
+
+
+def test_stream_accepts_only_a_token_for_its_own_audit(client, broker, owned_audit):
+    headers, add = owned_audit
+    audit, other = add(AuditStatus.COMPLETED), add(AuditStatus.COMPLETED)
+    access_token = headers["Authorization"].split()[1]
+
+    response = client.post(f"/audits/{audit.id}/events/token", headers=headers)
+    assert response.status_code == 200
+    stream_token = response.json()["stream_token"]
+
+    assert len(_events(client.get(f"/audits/{audit.id}/events", params={"stream_token": stream_token}))) == 1
+    assert client.get(f"/audits/{other.id}/events", params={"stream_token": stream_token}).status_code == 401
+    assert client.get(f"/audits/{audit.id}/events").status_code == 401
+    # Access tokens stay out of URLs, and stream tokens are not access tokens
+    assert client.get(f"/audits/{audit.id}/events", params={"stream_token": access_token}).status_code == 401
+    assert client.get(f"/audits/{audit.id}/events", params={"access_token": access_token}).status_code == 401
+    assert client.get("/auth/me", headers={"Authorization": f"Bearer {stream_token}"}).status_code == 401
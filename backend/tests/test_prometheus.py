@@ -0,0 +1,56 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from src.infrastructure.observability.prometheus import MetricsRegistry, MultiprocessCollector, render
+
+
+def _worker_registry(requests, in_flight, latency):
+    registry = MetricsRegistry()
+    registry.counter("requests_total", "Requests", ["route"]).labels("/audits").inc(requests)
+    registry.gauge("in_flight", "In flight").set(in_flight)
+    registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0)).observe(latency)
+    return registry
+
+
+def test_render_emits_cumulative_buckets_and_escaped_labels():
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Request latency", ["route"], buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5.0):
+        latency.labels("/audits/{audit_id}").observe(value)
+    registry.counter("errors_total", "Errors", ["message"]).labels('bad "input"\n').inc()
+
+    text = render(registry.collect())
+
+    assert "# TYPE latency_seconds histogram" in text
+    assert 'latency_seconds_bucket{route="/audits/{audit_id}",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{route="/audits/{audit_id}",le="1"} 2' in text
+    assert 'latency_seconds_bucket{route="/audits/{audit_id}",le="+Inf"} 3' in text
+    assert 'latency_seconds_count{route="/audits/{audit_id}"} 3' in text
+    assert 'errors_total{message="bad \\"input\\"\\n"} 1' in text
+    assert text.endswith("\n")
+
+
+def test_families_are_shared_by_name_and_checked_for_conflicts():
+    registry = MetricsRegistry()
+    counter = registry.counter("requests_total", "Requests", ["route"])
+    assert registry.counter("requests_total", "Requests", ["route"]) is counter
+    with pytest.raises(ValueError):
+        registry.gauge("requests_total", "Requests", ["route"])
+    with pytest.raises(ValueError):
+        counter.labels("/audits", "extra")
+
+
+def test_multiprocess_merge_sums_workers_and_drops_gauges_of_exited_ones(tmp_path):
+    exited = subprocess.Popen([sys.executable, "-c", "pass"])
+    exited.wait()
+    MultiprocessCollector(str(tmp_path), _worker_registry(3, 7, 0.5)).write()
+    os.replace(tmp_path / f"{os.getpid()}.json", tmp_path / f"{exited.pid}.json")
+
+    families = MultiprocessCollector(str(tmp_path), _worker_registry(2, 4, 0.05)).collect()
+
+    assert families["requests_total"]["samples"] == [[["/audits"], 5]]
+    assert families["in_flight"]["samples"] == [[[], 4]]
+    assert families["latency_seconds"]["samples"] == [[[], {"counts": [1, 1, 0], "sum": 0.55, "count": 2}]]
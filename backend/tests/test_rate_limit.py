@@ -0,0 +1,122 @@
+import asyncio
+import time
+from uuid import uuid4
+
+import pytest
+
+from src.infrastructure.security.rate_limit import InMemoryRateLimitBackend, RateLimit
+
+from .conftest import requires_database
+
+
+def test_parse_rate_limit_spec():
+    limit = RateLimit.parse("20/60")
+    assert limit.capacity == 20
+    assert limit.rate == 20 / 60
+    assert RateLimit.parse("") is None
+
+
+def test_bucket_allows_burst_then_reports_retry_after():
+    backend = InMemoryRateLimitBackend()
+    limit = RateLimit(capacity=3, period_seconds=60)
+    assert [backend.take("ip:1", limit) for _ in range(3)] == [0.0, 0.0, 0.0]
+    retry_after = backend.take("ip:1", limit)
+    assert 0 < retry_after <= 20
+    assert backend.take("ip:2", limit) == 0.0
+
+
+def test_bucket_refills_over_time(monkeypatch):
+    backend = InMemoryRateLimitBackend()
+    limit = RateLimit(capacity=1, period_seconds=10)
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    assert backend.take("user:1", limit) == 0.0
+    assert backend.take("user:1", limit) > 0
+    monkeypatch.setattr(time, "monotonic", lambda: now + 10)
+    assert backend.take("user:1", limit) == 0.0
+
+
+def test_least_recently_used_keys_are_evicted():
+    backend = InMemoryRateLimitBackend(max_keys=2)
+    limit = RateLimit(capacity=1, period_seconds=60)
+    for key in ("a", "b", "c"):
+        backend.take(key, limit)
+    assert len(backend._buckets) == 2
+    assert backend.take("a", limit) == 0.0
+
+
+# ============ Middleware ============
+
+def _limited_client(groups):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from src.infrastructure.api.middleware.rate_limit import RateLimitMiddleware
+
+    app = FastAPI()
+
+    @app.post("/auth/login")
+    @app.post("/audits/upload")
+    async def accepted():
+        return {"ok": True}
+
+    app.add_middleware(RateLimitMiddleware, backend=InMemoryRateLimitBackend(), groups=groups)
+    return TestClient(app)
+
+
+def _groups(per_ip, per_user=None):
+    from dataclasses import replace
+    from src.infrastructure.api.middleware.rate_limit import DEFAULT_ROUTE_GROUPS
+
+    return [
+        replace(group, per_ip=per_ip, per_user=per_user if group.per_user else None)
+        for group in DEFAULT_ROUTE_GROUPS
+    ]
+
+
+@pytest.mark.parametrize("path", ["/auth/login", "/audits/upload"])
+def test_exhausted_group_answers_429_with_retry_after(path):
+    client = _limited_client(_groups(per_ip=RateLimit(capacity=2, period_seconds=60)))
+
+    assert [client.post(path).status_code for _ in range(2)] == [200, 200]
+    response = client.post(path)
+
+    assert response.status_code == 429
+    assert response.json() == {"detail": "Too many requests"}
+    assert response.headers["retry-after"] == "30"
+    # Groups have separate budgets, and unlimited routes are untouched
+    other = "/audits/upload" if path == "/auth/login" else "/auth/login"
+    assert client.post(other).status_code == 200
+    assert client.get("/docs").status_code == 200
+
+
+def test_upload_is_limited_per_user():
+    from src.infrastructure.security.jwt import create_access_token
+
+    client = _limited_client(_groups(
+        per_ip=RateLimit(capacity=100, period_seconds=60),
+        per_user=RateLimit(capacity=1, period_seconds=3600)
+    ))
+    first, second = ({"Authorization": f"Bearer {create_access_token({'sub': str(uuid4())})}"} for _ in range(2))
+
+    assert client.post("/audits/upload", headers=first).status_code == 200
+    response = client.post("/audits/upload", headers=first)
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "3600"
+    assert client.post("/audits/upload", headers=second).status_code == 200
+
+
+@requires_database
+def test_postgres_bucket_refuses_once_empty(database_engine):
+    from src.infrastructure.security.rate_limit import PostgresRateLimitBackend
+
+    backend, key = PostgresRateLimitBackend(database_engine), f"test:ip:{uuid4()}"
+    limit = RateLimit(capacity=3, period_seconds=60)
+
+    async def drain():
+        allowed = [await backend.consume(key, limit) for _ in range(3)]
+        return allowed, await backend.consume(key, limit), await backend.consume(f"test:ip:{uuid4()}", limit)
+
+    allowed, refused, other = asyncio.run(drain())
+    assert allowed == [0.0, 0.0, 0.0]
+    assert 19 < refused <= 20
+    assert other == 0.0
@@ -0,0 +1,134 @@
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from src.domain.events import AuditChanged, EventBus, OrganizationChanged, UserChanged
+from src.infrastructure.api.middleware.response_cache import ResponseCache, ResponseCacheMiddleware, cache_response_for
+from src.infrastructure.security.jwt import create_access_token
+
+ORGANIZATION_ID = uuid4()
+USER_ID = uuid4()
+
+
+@pytest.fixture
+def app():
+    """An app with tagged, untagged and failing routes behind the middleware"""
+    app = FastAPI()
+    app.state.bus = EventBus()
+    app.state.cache = ResponseCache()
+    app.state.calls = 0
+    app.state.during_request = None
+
+    @app.get("/audits")
+    async def audits(request: Request):
+        app.state.calls += 1
+        if app.state.during_request is not None:
+            app.state.during_request()
+        cache_response_for(request, [ORGANIZATION_ID], owner_id=USER_ID)
+        return {"calls": app.state.calls}
+
+    @app.get("/rules")
+    async def rules():
+        app.state.calls += 1
+        return {"calls": app.state.calls}
+
+    @app.get("/dashboard/metrics")
+    async def metrics(request: Request):
+        app.state.calls += 1
+        cache_response_for(request, [ORGANIZATION_ID])
+        return JSONResponse({"detail": "Organization not found"}, status_code=404)
+
+    app.add_middleware(ResponseCacheMiddleware, cache=app.state.cache, bus=app.state.bus)
+    return app
+
+
+@pytest.fixture
+def client(app):
+    return TestClient(app)
+
+
+@pytest.fixture
+def headers():
+    return {"Authorization": f"Bearer {create_access_token({'sub': str(USER_ID)})}"}
+
+
+def test_second_request_is_served_from_cache(client, app, headers):
+    first = client.get("/audits", headers=headers)
+    second = client.get("/audits", headers=headers)
+
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json() == {"calls": 1}
+    assert first.headers["etag"] == second.headers["etag"]
+    assert first.headers["cache-control"] == "private, no-cache"
+    # Another query string is another entry
+    assert client.get("/audits", params={"limit": 5}, headers=headers).json() == {"calls": 2}
+
+
+def test_matching_etag_gets_not_modified(client, headers):
+    etag = client.get("/audits", headers=headers).headers["etag"]
+
+    response = client.get("/audits", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    assert client.get("/audits", headers={**headers, "If-None-Match": '"other"'}).status_code == 200
+
+
+def test_organization_event_drops_tagged_responses(client, app, headers):
+    client.get("/audits", headers=headers)
+
+    app.state.bus.publish(AuditChanged(organization_id=uuid4(), audit_id=uuid4()))
+    assert client.get("/audits", headers=headers).json() == {"calls": 1}
+
+    app.state.bus.publish(AuditChanged(organization_id=ORGANIZATION_ID, audit_id=uuid4()))
+    assert client.get("/audits", headers=headers).json() == {"calls": 2}
+
+    # Creating another organization of the owner changes the cross-organization listing
+    app.state.bus.publish(OrganizationChanged(organization_id=uuid4(), owner_id=USER_ID))
+    assert client.get("/audits", headers=headers).json() == {"calls": 3}
+
+
+def test_user_event_drops_only_that_users_responses(client, app, headers):
+    other = {"Authorization": f"Bearer {create_access_token({'sub': str(uuid4())})}"}
+    client.get("/audits", headers=headers)
+    client.get("/audits", headers=other)
+
+    # A deleted user or a changed role must not keep being served from cache
+    app.state.bus.publish(UserChanged(user_id=USER_ID))
+
+    assert client.get("/audits", headers=headers).json() == {"calls": 3}
+    assert client.get("/audits", headers=other).json() == {"calls": 2}
+
+
+def test_write_racing_a_miss_is_not_stored(client, app, headers):
+    # The data changes while the response is being built from the old data
+    app.state.during_request = lambda: app.state.bus.publish(
+        AuditChanged(organization_id=ORGANIZATION_ID, audit_id=uuid4())
+    )
+    assert client.get("/audits", headers=headers).json() == {"calls": 1}
+    assert len(app.state.cache) == 0
+
+    app.state.during_request = None
+    assert client.get("/audits", headers=headers).json() == {"calls": 2}
+    assert client.get("/audits", headers=headers).json() == {"calls": 2}
+
+
+def test_untagged_failed_and_anonymous_responses_pass_through(client, app, headers):
+    untagged = [client.get("/rules", headers=headers) for _ in range(2)]
+    assert [response.json() for response in untagged] == [{"calls": 1}, {"calls": 2}]
+    assert "etag" not in untagged[0].headers
+
+    failed = [client.get("/dashboard/metrics", headers=headers) for _ in range(2)]
+    assert [response.status_code for response in failed] == [404, 404]
+    assert failed[1].json() == {"detail": "Organization not found"}
+    assert "etag" not in failed[1].headers
+
+    # Without a valid bearer token the app answers every request
+    assert client.get("/audits").json() == {"calls": 5}
+    assert client.get("/audits", headers={"Authorization": "Bearer nonsense"}).json() == {"calls": 6}
+    assert app.state.calls == 6
+    assert len(app.state.cache) == 0
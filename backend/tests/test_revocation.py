@@ -0,0 +1,64 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+import asyncio
+
+from src.domain.repositories import RevokedTokenRepository
+from src.infrastructure.security.revocation import BloomFilter, RevocationList
+
+
+class FakeRevokedTokenRepository(RevokedTokenRepository):
+    def __init__(self):
+        self.rows = {}
+        self.lookups = 0
+
+    async def revoke(self, jti, expires_at):
+        if jti in self.rows:
+            return False
+        self.rows[jti] = datetime.utcnow()
+        return True
+
+    async def is_revoked(self, jti):
+        self.lookups += 1
+        return jti in self.rows
+
+    async def get_revoked_since(self, since=None):
+        return [(jti, at) for jti, at in self.rows.items() if since is None or at > since]
+
+    async def purge_expired(self):
+        return 0
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    keys = [uuid4().bytes for _ in range(1000)]
+    for key in keys:
+        bloom.add(key)
+    assert all(key in bloom for key in keys)
+    false_positives = sum(uuid4().bytes in bloom for _ in range(10000))
+    assert false_positives < 300
+
+
+def test_unrevoked_token_skips_the_database():
+    repository = FakeRevokedTokenRepository()
+    revocations = RevocationList(capacity=100, error_rate=0.001, sync_seconds=60)
+    assert asyncio.run(revocations.is_revoked(uuid4(), repository)) is False
+    assert repository.lookups == 0
+
+
+def test_rotated_token_cannot_be_reused():
+    repository = FakeRevokedTokenRepository()
+    revocations = RevocationList(capacity=100, error_rate=0.001, sync_seconds=60)
+    jti = uuid4()
+    expires_at = datetime.utcnow() + timedelta(days=7)
+
+    assert asyncio.run(revocations.revoke(jti, expires_at, repository)) is True
+    assert asyncio.run(revocations.is_revoked(jti, repository)) is True
+    assert asyncio.run(revocations.revoke(jti, expires_at, repository)) is False
+
+
+def test_revocations_from_other_workers_are_synced():
+    repository = FakeRevokedTokenRepository()
+    revocations = RevocationList(capacity=100, error_rate=0.001, sync_seconds=0)
+    jti = uuid4()
+    asyncio.run(repository.revoke(jti, datetime.utcnow() + timedelta(days=7)))
+    assert asyncio.run(revocations.is_revoked(jti, repository)) is True
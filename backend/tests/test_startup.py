@@ -0,0 +1,18 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+def test_importing_the_app_writes_no_files(tmp_path):
+    # Upload, report and data-cache directories are created on first write,
+    # so pre-forking parents and tooling can import the app from anywhere
+    env = {**os.environ, "PYTHONPATH": str(BACKEND_DIR)}
+    for name in ("UPLOAD_DIR", "REPORTS_DIR", "DATA_CACHE_DIR", "PROMETHEUS_MULTIPROC_DIR"):
+        env.pop(name, None)
+
+    subprocess.run([sys.executable, "-c", "import src.main"], cwd=tmp_path, env=env, check=True)
+
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,104 @@
+"""
+Tenant isolation: another user's organizations, audits and rules are missing
+
+Every route that loads a resource by id checks ownership in the same query
+(``get_owned_organization``, ``get_owned_audit``,
+``get_owned_audit_for_stream``, ``get_owned_rule`` or an inline
+``get_by_id_for_owner``) and answers 404 rather than 403, so ids of other
+tenants cannot be probed.
+"""
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.domain.entities import Finding
+
+from .test_audit_report import NOW, _audit
+
+RULE = {
+    "name": "Idle instances",
+    "audit_type": "cloud",
+    "conditions": {"field": "cpu_utilization", "operator": "<", "threshold": 5},
+    "severity": "high"
+}
+
+# (method, path, request arguments, detail of the 404)
+ROUTES = [
+    ("GET", "/organizations/{organization_id}", {}, "Organization not found"),
+    ("GET", "/audits", {"params": {"organization_id": "{organization_id}"}}, "Organization not found"),
+    ("POST", "/audits/upload", {
+        "data": {"organization_id": "{organization_id}", "audit_type": "cloud"},
+        "files": {"file": ("costs.csv", b"cost\n1\n", "text/csv")}
+    }, "Organization not found"),
+    ("GET", "/audits/{audit_id}", {}, "Audit not found"),
+    ("GET", "/audits/{audit_id}/findings", {}, "Audit not found"),
+    ("GET", "/audits/{audit_id}/data", {}, "Audit not found"),
+    ("GET", "/audits/{audit_id}/profile", {}, "Audit not found"),
+    ("GET", "/audits/{audit_id}/report.pdf", {}, "Audit not found"),
+    ("POST", "/audits/{audit_id}/events/token", {}, "Audit not found"),
+    ("GET", "/audits/{audit_id}/events", {}, "Audit not found"),
+    ("GET", "/rules", {"params": {"organization_id": "{organization_id}"}}, "Organization not found"),
+    ("POST", "/rules", {"json": {**RULE, "organization_id": "{organization_id}"}}, "Organization not found"),
+    ("PUT", "/rules/{rule_id}", {"json": {"is_active": False}}, "Rule not found"),
+    ("DELETE", "/rules/{rule_id}", {}, "Rule not found"),
+    ("GET", "/dashboard/metrics", {"params": {"organization_id": "{organization_id}"}}, "Organization not found"),
+    ("GET", "/dashboard/trends", {"params": {"organization_id": "{organization_id}"}}, "Organization not found"),
+]
+
+
+def _fill(value, ids):
+    if isinstance(value, str):
+        return value.format(**ids)
+    if isinstance(value, dict):
+        return {key: _fill(item, ids) for key, item in value.items()}
+    return value
+
+
+@pytest.fixture
+def tenants(client, store, signup):
+    """The owner's organization, audit (with a finding) and rule, and an intruder's headers"""
+    owner, _ = signup("owner@example.com")
+    organization_id = UUID(client.post("/organizations", json={"name": "Acme"}, headers=owner).json()["id"])
+    audit = _audit(organization_id)
+    store.audits.put(audit.id, audit)
+    finding = Finding(id=uuid4(), audit_id=audit.id, title="Idle", severity="high", created_at=NOW)
+    store.findings.put(finding.id, finding)
+    response = client.post("/rules", json={**RULE, "organization_id": str(organization_id)}, headers=owner)
+    assert response.status_code == 201, response.text
+
+    intruder, _ = signup("intruder@example.com")
+    ids = {"organization_id": str(organization_id), "audit_id": str(audit.id), "rule_id": response.json()["id"]}
+    return owner, intruder, ids
+
+
+@pytest.mark.parametrize("method, path, arguments, detail", ROUTES, ids=[f"{m} {p}" for m, p, _, _ in ROUTES])
+def test_other_users_resources_are_not_found(client, tenants, method, path, arguments, detail):
+    _, intruder, ids = tenants
+
+    response = client.request(method, path.format(**ids), headers=intruder, **_fill(arguments, ids))
+
+    assert response.status_code == 404, response.text
+    assert response.json() == {"detail": detail}
+
+
+@pytest.mark.parametrize("path", [
+    "/organizations/{organization_id}",
+    "/audits/{audit_id}",
+    "/audits/{audit_id}/findings",
+    "/rules?organization_id={organization_id}",
+    "/dashboard/metrics?organization_id={organization_id}",
+])
+def test_owner_reaches_the_same_resources(client, tenants, path):
+    owner, _, ids = tenants
+
+    assert client.get(path.format(**ids), headers=owner).status_code == 200
+
+
+def test_intruder_writes_leave_the_owners_rule_alone(client, tenants):
+    owner, intruder, ids = tenants
+
+    client.put(f"/rules/{ids['rule_id']}", json={"is_active": False}, headers=intruder)
+    client.delete(f"/rules/{ids['rule_id']}", headers=intruder)
+
+    rules = client.get("/rules", params={"organization_id": ids["organization_id"]}, headers=owner).json()["rules"]
+    assert [(rule["id"], rule["is_active"]) for rule in rules] == [(ids["rule_id"], True)]
@@ -0,0 +1,35 @@
+from dataclasses import replace
+from datetime import date, datetime
+from uuid import UUID
+
+from src.domain.entities.metrics import TrendGranularity
+
+from .test_audit_report import _audit
+
+
+def test_day_bucket_truncates_time():
+    assert TrendGranularity.DAY.bucket_start(datetime(2024, 3, 14, 23, 59)) == date(2024, 3, 14)
+
+
+def test_week_bucket_starts_on_monday():
+    # 2024-03-14 is a Thursday
+    assert TrendGranularity.WEEK.bucket_start(datetime(2024, 3, 14, 8, 0)) == date(2024, 3, 11)
+    assert TrendGranularity.WEEK.bucket_start(date(2024, 3, 11)) == date(2024, 3, 11)
+
+
+def test_month_bucket_starts_on_first_day():
+    assert TrendGranularity.MONTH.bucket_start(datetime(2024, 2, 29, 12, 0)) == date(2024, 2, 1)
+
+
+def test_zero_average_score_is_reported_as_zero(client, store, signup):
+    headers, _ = signup()
+    organization_id = UUID(client.post("/organizations", json={"name": "Acme"}, headers=headers).json()["id"])
+    audit = replace(_audit(organization_id), optimization_score=0)
+    store.audits.put(audit.id, audit)
+    params = {"organization_id": str(organization_id)}
+
+    metrics = client.get("/dashboard/metrics", params=params, headers=headers).json()
+    trends = client.get("/dashboard/trends", params=params, headers=headers).json()
+
+    assert metrics["avg_optimization_score"] == 0.0
+    assert [bucket["avg_optimization_score"] for bucket in trends["buckets"]] == [0.0]
@@ -0,0 +1,87 @@
+from uuid import uuid4
+import asyncio
+
+import pytest
+
+from src.domain.events import EventBus, UserChanged
+from src.infrastructure.persistence.unit_of_work import SQLAlchemyUnitOfWork, commit_or_defer
+
+
+class FakeSession:
+    def __init__(self):
+        self.info = {}
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+    async def flush(self):
+        pass
+
+
+def _unit_of_work(session):
+    bus = EventBus()
+    published = []
+    bus.subscribe(UserChanged, published.append)
+    return SQLAlchemyUnitOfWork(session, bus), published
+
+
+def test_writes_commit_once_and_publish_after_commit():
+    session = FakeSession()
+    unit_of_work, published = _unit_of_work(session)
+    events = [UserChanged(user_id=uuid4()) for _ in range(3)]
+
+    async def run():
+        async with unit_of_work:
+            for event in events:
+                await commit_or_defer(session, event)
+            assert session.commits == 0
+            assert published == []
+
+    asyncio.run(run())
+    assert session.commits == 1
+    assert published == events
+    assert session.info == {}
+
+
+def test_error_rolls_back_and_drops_events():
+    session = FakeSession()
+    unit_of_work, published = _unit_of_work(session)
+
+    async def run():
+        async with unit_of_work:
+            await commit_or_defer(session, UserChanged(user_id=uuid4()))
+            raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(run())
+    assert (session.commits, session.rollbacks) == (0, 1)
+    assert published == []
+    assert session.info == {}
+
+
+def test_nested_blocks_join_the_outer_transaction():
+    session = FakeSession()
+    unit_of_work, published = _unit_of_work(session)
+
+    async def run():
+        async with unit_of_work:
+            async with unit_of_work:
+                await commit_or_defer(session, UserChanged(user_id=uuid4()))
+            assert session.commits == 0
+
+    asyncio.run(run())
+    assert session.commits == 1
+    assert len(published) == 1
+
+
+def test_writes_outside_a_unit_of_work_commit_immediately():
+    session = FakeSession()
+
+    asyncio.run(commit_or_defer(session))
+
+    assert session.commits == 1